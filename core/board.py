@@ -8,6 +8,9 @@ from core.constants import (
 )
 from core.utils import valid
 
+# Square names indexed [row][col] — row 0 is rank 8
+SQUARE_NAMES = [[f"{'abcdefgh'[c]}{8 - r}" for c in range(8)] for r in range(8)]
+
 
 class Board:
     """
@@ -262,6 +265,12 @@ class Board:
                         result.append(mv)
         return result
 
+    def legal_uci_moves(self, turn=None):
+        """Return the set of legal moves for the given side as UCI strings."""
+        sq = SQUARE_NAMES
+        return {sq[fr][fc] + sq[tr][tc] + (promo.lower() if promo else '')
+                for fr, fc, tr, tc, promo in self.legal_moves(turn)}
+
     # ── Raw (no-history) move application ─────────────────
 
     def _apply_raw(self, fr, fc, tr, tc, promo):
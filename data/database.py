@@ -16,6 +16,22 @@ class Database:
     are treated as the same engine.
     """
 
+    # Fixed SQL text, so sqlite3's per-connection statement cache reuses the
+    # prepared statements across saves on a long-lived connection
+    _INSERT_GAME_SQL = '''
+        INSERT INTO games
+            (white_engine, black_engine, result, reason,
+             date, time, pgn, move_count, duration_seconds, source)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_TGAME_SQL = '''
+        INSERT INTO tournament_games
+            (game_id, tournament_id, tournament_name, format,
+             round_num, white_engine, black_engine, result, reason,
+             pgn, move_count, duration_sec, opening, date, time)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
     def __init__(self, db_path=None):
         self.db_path = db_path or get_db_path()
         self._init_schema()
@@ -85,23 +101,10 @@ class Database:
             conn   = sqlite3.connect(self.db_path)
             conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
-            date_str = datetime.now().strftime("%Y.%m.%d")
-            time_str = datetime.now().strftime("%H:%M:%S")
-            cursor.execute('''
-                INSERT INTO games
-                    (white_engine, black_engine, result, reason,
-                     date, time, pgn, move_count, duration_seconds, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                normalize_engine_name(white_name),
-                normalize_engine_name(black_name),
-                result, reason,
-                date_str, time_str,
-                pgn, move_count, duration_sec,
-                source,
-            ))
+            game_id = self._insert_game(
+                cursor, datetime.now(), white_name, black_name, result,
+                reason, pgn, move_count, duration_sec, source)
             conn.commit()
-            game_id = cursor.lastrowid
             conn.close()
             return game_id
         except Exception as e:
@@ -113,59 +116,116 @@ class Database:
                              reason, pgn, move_count, duration_sec,
                              opening=None):
         try:
-            # 1. Save to main games table so Elo / stats pick it up
-            game_id = self.save_game(
-                white_name   = white_name,
-                black_name   = black_name,
-                result       = result,
-                reason       = reason,
-                pgn          = pgn,
-                move_count   = move_count,
-                duration_sec = duration_sec,
-                source       = 'tournament',
-            )
-            if game_id is None:
-                return None, None
-
-            # 2. Save tournament metadata
             conn   = sqlite3.connect(self.db_path)
             conn.execute("PRAGMA journal_mode=WAL")
-            cursor = conn.cursor()
-            now      = datetime.now()
-            date_str = now.strftime("%Y.%m.%d")
-            time_str = now.strftime("%H:%M:%S")
-            cursor.execute('''
-                INSERT INTO tournament_games
-                    (game_id, tournament_id, tournament_name, format,
-                     round_num, white_engine, black_engine, result, reason,
-                     pgn, move_count, duration_sec, opening, date, time)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                game_id,
-                tournament_id,
-                tournament_name,
-                fmt,
-                round_num,
-                normalize_engine_name(white_name),
-                normalize_engine_name(black_name),
-                result,
-                reason,
-                pgn,
-                move_count,
-                duration_sec,
-                opening or '',
-                date_str,
-                time_str,
-            ))
+            ids = self._insert_tournament_game(
+                conn.cursor(), tournament_id, tournament_name, fmt,
+                round_num, white_name, black_name, result, reason,
+                pgn, move_count, duration_sec, opening)
             conn.commit()
-            t_game_id = cursor.lastrowid
             conn.close()
-            return game_id, t_game_id
+            return ids
 
         except Exception as e:
             print(f"[Database] save_tournament_game error: {e}")
             return None, None
 
+    def open_writer(self):
+        """
+        Open a connection meant to live on one writer thread and be passed
+        to save_tournament_game_prepared().  The caller commits and closes.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def save_tournament_game_prepared(self, conn, tournament_id,
+                                      tournament_name, fmt, round_num,
+                                      white_name, black_name, result,
+                                      reason, pgn, move_count, duration_sec,
+                                      opening=None):
+        """
+        Same rows as save_tournament_game(), written on the caller's open
+        connection *conn* (see open_writer) without committing, so a run
+        of saves reuses the cached statements and shares one commit.
+        A failed save is rolled back to a savepoint, leaving no half-written
+        game in the pending transaction.
+
+        Returns
+        -------
+        (game_id, t_game_id), or (None, None) on error
+        """
+        try:
+            # Savepoint nested in an explicit transaction: releasing it
+            # must not commit the batch
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            conn.execute("SAVEPOINT tgame")
+        except Exception as e:
+            print(f"[Database] save_tournament_game_prepared error: {e}")
+            return None, None
+        try:
+            ids = self._insert_tournament_game(
+                conn.cursor(), tournament_id, tournament_name, fmt,
+                round_num, white_name, black_name, result, reason,
+                pgn, move_count, duration_sec, opening)
+        except Exception as e:
+            conn.execute("ROLLBACK TO tgame")
+            conn.execute("RELEASE tgame")
+            print(f"[Database] save_tournament_game_prepared error: {e}")
+            return None, None
+        conn.execute("RELEASE tgame")
+        return ids
+
+    def _insert_game(self, cursor, now, white_name, black_name, result,
+                     reason, pgn, move_count, duration_sec, source):
+        """Insert one games row on *cursor* (no commit); returns its id."""
+        cursor.execute(self._INSERT_GAME_SQL, (
+            normalize_engine_name(white_name),
+            normalize_engine_name(black_name),
+            result, reason,
+            now.strftime("%Y.%m.%d"), now.strftime("%H:%M:%S"),
+            pgn, move_count, duration_sec,
+            source,
+        ))
+        return cursor.lastrowid
+
+    def _insert_tournament_game(self, cursor, tournament_id, tournament_name,
+                                fmt, round_num, white_name, black_name,
+                                result, reason, pgn, move_count,
+                                duration_sec, opening):
+        """
+        Insert a tournament game on *cursor* (no commit): its games row, so
+        Elo / stats pick it up, then its tournament metadata row.
+
+        Returns
+        -------
+        (game_id, t_game_id)
+        """
+        now     = datetime.now()
+        game_id = self._insert_game(
+            cursor, now, white_name, black_name, result, reason,
+            pgn, move_count, duration_sec, 'tournament')
+        cursor.execute(self._INSERT_TGAME_SQL, (
+            game_id,
+            tournament_id,
+            tournament_name,
+            fmt,
+            round_num,
+            normalize_engine_name(white_name),
+            normalize_engine_name(black_name),
+            result,
+            reason,
+            pgn,
+            move_count,
+            duration_sec,
+            opening or '',
+            now.strftime("%Y.%m.%d"),
+            now.strftime("%H:%M:%S"),
+        ))
+        return game_id, cursor.lastrowid
+
     # ── Read ──────────────────────────────────────────────
 
     def get_all_games_for_elo(self):
@@ -473,10 +533,20 @@ class Database:
             print(f"[Database] get_opening_stats_all error: {e}")
         return result
 
-    def get_tournament_list(self):
+    def get_tournament_list(self, name_like=None, fmt=None,
+                            limit=None, offset=None):
         """
         Return a summary list of all tournaments stored in the database.
 
+        Parameters
+        ----------
+        name_like : str | None  — keep tournaments whose name contains this
+                                  (case-insensitive with Python's Unicode
+                                  str.lower(), not SQLite's ASCII-only LIKE)
+        fmt       : str | None  — keep only this format
+        limit     : int | None  — return at most this many tournaments
+        offset    : int | None  — skip this many (needs limit)
+
         Returns
         -------
         list of dicts:
@@ -489,17 +559,40 @@ class Database:
         try:
             conn   = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
+            conn.create_function(
+                'py_lower', 1,
+                lambda v: v.lower() if isinstance(v, str) else v,
+                deterministic=True)
             cursor = conn.cursor()
-            cursor.execute('''
+
+            query  = '''
                 SELECT tournament_id,
                        tournament_name,
                        format,
                        COUNT(*)  AS game_count,
                        MIN(date) AS date
                 FROM tournament_games
-                GROUP BY tournament_id
-                ORDER BY MAX(id) DESC
-            ''')
+            '''
+            params = []
+            conditions = []
+
+            if name_like:
+                # Plain substring test on both sides lowered in Python, so
+                # it matches exactly what the list's own filter would
+                conditions.append('instr(py_lower(tournament_name), ?) > 0')
+                params.append(name_like.lower())
+            if fmt:
+                conditions.append('format = ?')
+                params.append(fmt)
+
+            if conditions:
+                query += ' WHERE ' + ' AND '.join(conditions)
+            query += ' GROUP BY tournament_id ORDER BY MAX(id) DESC'
+            if limit is not None:
+                query += ' LIMIT ? OFFSET ?'
+                params.extend([limit, offset or 0])
+
+            cursor.execute(query, params)
             rows = [dict(r) for r in cursor.fetchall()]
             conn.close()
             return rows
@@ -4,14 +4,25 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
+import tkinter.font as tkfont
 import threading
+import queue
 import time
 import random
 import sqlite3
 import os
+import re
 import math
+import bisect
+import weakref
 from datetime import datetime
-from itertools import combinations
+from itertools import combinations, islice
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from contextlib import contextmanager
+from typing import NamedTuple
+from operator import attrgetter
 import copy
 
 from core.constants import (
@@ -83,6 +94,10 @@ class LoadingOverlay:
     def show(self, message: str | None = None):
         if message:
             self._msg_lbl.config(text=message)
+        if self._visible:
+            # Already up (a shared overlay): keep the one spinner loop going
+            self._backdrop.lift()
+            return
         self._visible = True
         self._backdrop.place(x=0, y=0, relwidth=1.0, relheight=1.0)
         self._backdrop.lift()
@@ -184,54 +199,125 @@ def _get_elo_map(db) -> dict:
         return {}
 
 
+# Ratings are integers from a small range, so the tier scan is memoised.
+# Everything below is a pure dict/cache lookup and safe on the Tk thread;
+# the Elo map itself only ever comes from _get_elo_map via fetch_async.
+_tier = lru_cache(maxsize=None)(get_tier)
+
+# Treeview tag per tier, found by bisecting the ascending cutoffs; ratings
+# below the lowest cutoff fall back to get_tier's own default colour
+_TIER_ASC      = sorted(RANK_TIERS)
+_TIER_CUTOFFS  = [cut for cut, _, _ in _TIER_ASC]
+_TIER_TAGS     = [f'tier_{colour}' for _, _, colour in _TIER_ASC]
+_TIER_TAG_LOW  = f'tier_{get_tier(_TIER_CUTOFFS[0] - 1)[1]}'
+
+
+def _tier_tag(elo) -> str:
+    idx = bisect.bisect_right(_TIER_CUTOFFS, elo) - 1
+    return _TIER_TAGS[idx] if idx >= 0 else _TIER_TAG_LOW
+
+
+# Engine names repeat across every refresh, so their normalised form is too
+_norm_name = lru_cache(maxsize=4096)(normalize_engine_name)
+
+
+def _lookup_elo(elo_map: dict, name: str):
+    return elo_map.get(name) or elo_map.get(_norm_name(name))
+
+
+@lru_cache(maxsize=4096)
+def _elo_display(elo) -> tuple:
+    """
+    (badge text, colour, tier label, tier tag) for a rating, keyed on the
+    integer alone so it is cached across maps; None gives the unrated look.
+    """
+    if elo is None:
+        return ("—", "#888888", "", None)
+    label, colour = _tier(elo)
+    return (f"{elo}  {label}", colour, label, _tier_tag(elo))
+
+
 def _fmt_elo(elo_map: dict, name: str) -> str:
     """
     Return a formatted Elo string like '1742 📝 Candidate' for display,
     or '—' if the engine has no rating yet.
     """
-    elo = elo_map.get(name) or elo_map.get(normalize_engine_name(name))
-    if elo is None:
-        return "—"
-    tier_lbl, _ = get_tier(elo)
-    return f"{elo}  {tier_lbl}"
+    return _elo_display(_lookup_elo(elo_map, name))[0]
 
 
 def _elo_color(elo_map: dict, name: str) -> str:
     """Return the tier colour for this engine, or #888888 if unrated."""
-    elo = elo_map.get(name) or elo_map.get(normalize_engine_name(name))
-    if elo is None:
-        return "#888888"
-    _, col = get_tier(elo)
-    return col
+    return _elo_display(_lookup_elo(elo_map, name))[1]
+
+
+def _elo_display_map(elo_map: dict, names) -> dict:
+    """Pre-render {name: (badge text, colour)} for the given engine names."""
+    return {n: _elo_display(_lookup_elo(elo_map, n))[:2] for n in names}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Off-thread DB reconstruction helper
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_PGN_TAGS     = re.compile(r'\[.*?\]\s*', re.DOTALL)
+_PGN_MOVE_NUM = re.compile(r'\d+\.+')
+_PGN_RESULT   = re.compile(r'1-0|0-1|1/2-1/2|\*')
+# Destination square of a SAN token (absent for castling)
+_SAN_DEST     = re.compile(r'([a-h])([1-8])(?:=?[QRBNqrbn])?[+#!?]*$')
+
+
+def _replay_pgn_moves(pgn: str) -> list:
+    """
+    Replay a PGN's SAN movetext on a Board and return its move_history
+    [(uci, san, fen), ...], stopping at the first token that does not match.
+    """
+    try:
+        b    = Board()
+        body = _PGN_TAGS.sub('', pgn)
+        body = _PGN_MOVE_NUM.sub('', body)
+        body = _PGN_RESULT.sub('', body)
+        for san in body.split():
+            try:
+                legal = b.legal_moves()
+                # Only moves landing on the SAN's target square can match,
+                # so just those get their SAN built and compared
+                dest  = _SAN_DEST.search(san)
+                if dest:
+                    tc = ord(dest.group(1)) - ord('a')
+                    tr = 8 - int(dest.group(2))
+                    cands = [m for m in legal if m[2] == tr and m[3] == tc]
+                else:
+                    cands = legal
+                want = san.rstrip('+#')
+                for fr, fc, tr, tc, promo in cands:
+                    if b._build_san(fr, fc, tr, tc, promo,
+                                    legal).rstrip('+#') == want:
+                        b.apply_uci(f"{chr(ord('a')+fc)}{8-fr}"
+                                    f"{chr(ord('a')+tc)}{8-tr}"
+                                    + (promo.lower() if promo else ""))
+                        break
+                else:
+                    break
+            except Exception:
+                break
+        return list(b.move_history)
+    except Exception:
+        return []
+
+
 def _parse_db_rows(tournament_id: str, rows: list):
     """
     Pure function — no Tk calls allowed.
     Parses raw DB rows into a fully-populated Tournament object so the caller
     can hand the result straight back to the main thread via fetch_async.
+    Move lists are not replayed here: each game keeps its PGN and replays it
+    the first time its move_history is read.
     """
-    import re as _re
-
     first  = rows[0]
     t_name = first.get("tournament_name", "Unknown Tournament")
     t_fmt  = first.get("format", "Swiss")  # Tournament.FORMAT_SWISS resolved below
     t_id   = first.get("tournament_id", tournament_id)
 
-    # Resolve Board class (needed for PGN replay)
-    _Board = None
-    try:
-        from core.board import Board as _Board
-    except ImportError:
-        try:
-            from core.board import Board as _Board
-        except ImportError:
-            pass
-
     player_names: dict = {}
     for row in rows:
         for key in ("white_engine", "black_engine"):
@@ -277,36 +363,8 @@ def _parse_db_rows(tournament_id: str, rows: list):
         g.opening    = row.get("opening", "")
         g.status     = "done"
 
-        if g.pgn and _Board is not None:
-            try:
-                b     = _Board()
-                body  = _re.sub(r'\[.*?\]\s*', '', g.pgn, flags=_re.DOTALL)
-                body  = _re.sub(r'\d+\.+', '', body)
-                body  = _re.sub(r'1-0|0-1|1/2-1/2|\*', '', body)
-                for san in body.split():
-                    san = san.strip()
-                    if not san:
-                        continue
-                    try:
-                        legal   = b.legal_moves()
-                        matched = False
-                        for move in legal:
-                            fr, fc, tr, tc, promo = move
-                            csan = b._build_san(fr, fc, tr, tc, promo, legal)
-                            if csan.rstrip('+#') == san.rstrip('+#'):
-                                uci = (f"{chr(ord('a')+fc)}{8-fr}"
-                                       f"{chr(ord('a')+tc)}{8-tr}"
-                                       + (promo.lower() if promo else ""))
-                                b.apply_uci(uci)
-                                matched = True
-                                break
-                        if not matched:
-                            break
-                    except Exception:
-                        break
-                g.move_history = list(b.move_history)
-            except Exception:
-                g.move_history = []
+        if g.pgn:
+            g._unparsed_pgn = g.pgn
 
         ws = g.white_score
         bs = g.black_score
@@ -314,7 +372,8 @@ def _parse_db_rows(tournament_id: str, rows: list):
             wp.record(ws, bname, 'w')
             bp.record(bs, wname, 'b')
 
-        t.all_games.append(g)
+        t._add_game(g)
+        t._mark_completed(g)
 
         if t_fmt == Tournament.FORMAT_KNOCKOUT:
             t._ko_round_games.setdefault(rnum, []).append(g)
@@ -337,13 +396,15 @@ def _parse_db_rows(tournament_id: str, rows: list):
                     eliminated_set.add(g.black.name)
                     t._ko_eliminated.append(g.black)
 
-        t._ko_pending_winners = [p for p in players if p.name not in eliminated_set]
+        t._ko_pending_winners = {p.name: p for p in players
+                                 if p.name not in eliminated_set}
 
     t.round_games = (
         t._ko_round_games.get(max_round, [])
         if t_fmt == Tournament.FORMAT_KNOCKOUT
-        else [g for g in t.all_games if g.round_num == max_round]
+        else list(t._games_by_round.get(max_round, []))
     )
+    t._pending_cursor = 0
 
     standings = t.get_standings()
     if standings:
@@ -352,51 +413,402 @@ def _parse_db_rows(tournament_id: str, rows: list):
     return t
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Shared fonts — one named Tk font per (family, size, style) spec
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_FONTS: dict = {}
+
+
+def _font(family: str, size: int, *style) -> tkfont.Font:
+    """
+    Return a cached Font for the spec, so widgets reference a named font
+    instead of Tk re-parsing a font tuple for every widget created.
+    Needs a Tk root to exist; call it while building widgets.
+    """
+    key = (family, size) + style
+    f = _FONTS.get(key)
+    if f is None:
+        f = _FONTS[key] = tkfont.Font(
+            family=family, size=size,
+            weight='bold' if 'bold' in style else 'normal',
+            slant='italic' if 'italic' in style else 'roman')
+    return f
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Read-only Text helper
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@contextmanager
+def _editable(text: tk.Text):
+    """Unlock a read-only Text widget for the duration of the block."""
+    text.config(state='normal')
+    try:
+        yield text
+    finally:
+        text.config(state='disabled')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Shared ttk styles — configured once per process, not per window open
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_styles_interp = None    # Tcl interpreter the styles were last set up in
+
+
+def _init_ttk_styles():
+    global _styles_interp
+    style = ttk.Style()
+    # Styles are per interpreter: only a fresh Tk root needs them again
+    if _styles_interp is style.tk:
+        return
+    _styles_interp = style.tk
+    style.theme_use('clam')
+    # Everything sits on derived style names: the main GUI reconfigures the
+    # base Treeview / TNotebook styles later with its own look, and that
+    # must not leak into tournament windows (nor ours into its widgets)
+    for h in (24, 26, 28):
+        style.configure(f'Rows{h}.Treeview', rowheight=h,
+                        background=LOG_BG, foreground=TEXT,
+                        fieldbackground=LOG_BG, borderwidth=0)
+        style.map(f'Rows{h}.Treeview', background=[('selected', ACCENT)])
+        style.configure(f'Rows{h}.Treeview.Heading', background=BTN_BG,
+                        foreground=TEXT, borderwidth=1,
+                        font=_font('Segoe UI', 8, 'bold'))
+    style.configure('Tournament.TNotebook', background=PANEL_BG,
+                    borderwidth=0)
+    style.configure('Tournament.TNotebook.Tab', background=BTN_BG,
+                    foreground=TEXT, padding=[10,4],
+                    font=_font('Segoe UI', 9))
+    style.map('Tournament.TNotebook.Tab',
+              background=[('selected', ACCENT)],
+              foreground=[('selected', 'white')])
+
+
+def _tree_style(rowheight: int) -> str:
+    """Name of the shared Treeview style with the given row height."""
+    _init_ttk_styles()
+    return f'Rows{rowheight}.Treeview'
+
+
+def _setup_columns(tree: ttk.Treeview, cols, widths: dict,
+                   left_cols=(), default_width: int = 80):
+    """Heading text = column name; *left_cols* left-aligned, rest centred."""
+    for c in cols:
+        tree.heading(c, text=c)
+        tree.column(c, width=widths.get(c, default_width),
+                    anchor='w' if c in left_cols else 'center')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Eval statistics
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _eval_stats(game) -> "tuple | None":
+    """
+    (avg, max, min) of the evaluated plies in *game.eval_history* (None
+    marks a ply the analyzer skipped), computed in one pass and cached on
+    the game until its history length changes.  None if nothing was
+    evaluated.
+    """
+    evals  = game.eval_history
+    cached = getattr(game, '_eval_stats', None)
+    if cached is not None and cached[0] == len(evals):
+        return cached[1]
+    total = n = 0
+    hi = lo = None
+    for cp in evals:
+        if cp is None:
+            continue
+        total += cp
+        n     += 1
+        if hi is None:
+            hi = lo = cp
+        elif cp > hi: hi = cp
+        elif cp < lo: lo = cp
+    stats = (total / n, hi, lo) if n else None
+    game._eval_stats = (len(evals), stats)
+    return stats
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Chunked treeview insert — keeps UI responsive when inserting many rows
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_INSERT_CHUNK = 150   # rows per _batch_tree_insert step
+
+
 def _batch_tree_insert(widget: tk.Widget,
                        tree,
                        rows: list,
-                       chunk: int = 150,
+                       chunk: int = _INSERT_CHUNK,
                        done_fn=None):
     """
     Insert *rows* into *tree* in chunks of *chunk* items, yielding control to
     Tk between each chunk via widget.after(0, …).
 
-    Each element of *rows* must be a dict:
-        {"values": [...], "tags": (...,), "parent": "", "index": "end"}
+    Each element of *rows* is a tuple, trailing fields optional:
+        (values, tags[, iid[, index]])
+    Rows go under the root; *index* defaults to "end".
 
     *done_fn* is called (no args) on the main thread once all rows are inserted.
+
+    Returns a callable that cancels any chunks not yet inserted.
     """
     if not rows:
         if done_fn:
             done_fn()
-        return
+        return lambda: None
 
     iterator = iter(rows)
+    pending  = [None]   # after-id of the next scheduled chunk
+
+    def _cancel():
+        if pending[0] is not None:
+            try: widget.after_cancel(pending[0])
+            except Exception: pass
+            pending[0] = None
 
     def _insert_chunk():
         count = 0
         try:
             while count < chunk:
-                r = next(iterator)
-                tree.insert(
-                    r.get("parent", ""),
-                    r.get("index", "end"),
-                    values=r["values"],
-                    tags=r.get("tags", ()),
-                    iid=r.get("iid"),
-                )
+                values, tags, *extra = next(iterator)
+                tree.insert('', extra[1] if len(extra) > 1 else 'end',
+                            values=values, tags=tags,
+                            iid=extra[0] if extra else None)
                 count += 1
         except StopIteration:
+            pending[0] = None
             if done_fn:
                 done_fn()
             return
-        widget.after(0, _insert_chunk)
+        pending[0] = widget.after(0, _insert_chunk)
+
+    pending[0] = widget.after(0, _insert_chunk)
+    return _cancel
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Virtual treeview — only the rows on screen exist as Tk items
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _VirtualTree:
+    """
+    Windowed rendering for a long Treeview list.
+
+    The full data set lives in *rows* as (values, tags) tuples; the Treeview
+    itself only holds a small pool of items, one per visible line, whose
+    contents are swapped as the user scrolls.  The scrollbar is driven from
+    the data offset rather than from the tree's own yview.
+
+    The selection belongs to a data row, not to a pool item: it is kept as
+    the row's *key* (``key(row)``), follows that row through scrolling and
+    set_rows, and is put back on whichever pool item shows it.  Arrow,
+    page and Home/End keys move it through the whole data set.
+
+    Usage
+    -----
+        vt = _VirtualTree(tree, scrollbar, rowheight=26,
+                          key=lambda r: r[0][0], on_select=callback)
+        vt.set_rows([(values, (tag,)), ...])
+        vt.selected_row()      # → the selected row tuple, or None
+    """
+
+    _NAV_KEYS = ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>')
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: tk.Scrollbar,
+                 rowheight: int, key=None, on_select=None):
+        self.tree      = tree
+        self.sb        = scrollbar
+        self.rowheight = rowheight
+        self.key       = key or (lambda row: tuple(row[0]))
+        self.on_select = on_select   # called with the new key (or None)
+        self.rows: list = []
+        self.top       = 0
+        self.selected  = None    # index into rows of the selected row
+        self._sel_key  = None
+        self._sel_iid  = None    # pool item the selection was last put on
+        self._pool: list = []    # pool iids, top to bottom
+        self._shown: dict = {}   # pool iid → row currently displayed
+        self._detached: set = set()   # pool iids parked past the data end
+        scrollbar.config(command=self._on_scrollbar)
+        tree.configure(yscrollcommand='', selectmode='browse')
+        tree.bind('<Configure>',  lambda e: self._render())
+        tree.bind('<MouseWheel>', self._on_wheel)
+        tree.bind('<Button-4>',   lambda e: self._scroll(-3))
+        tree.bind('<Button-5>',   lambda e: self._scroll(3))
+        tree.bind('<<TreeviewSelect>>', self._on_tree_select, add='+')
+        for seq in self._NAV_KEYS:
+            tree.bind(seq, self._on_nav_key)
+
+    def set_rows(self, rows: list):
+        self.rows = rows
+        if self._sel_key is not None:
+            # Usually the row stays put; otherwise look it up by key
+            idx = self.selected
+            if idx is None or idx >= len(rows) or \
+                    self.key(rows[idx]) != self._sel_key:
+                idx = next((i for i, r in enumerate(rows)
+                            if self.key(r) == self._sel_key), None)
+            self.selected = idx
+            if idx is None:
+                self._set_selection(None)
+        self._render()
+
+    def selected_row(self):
+        if self.selected is None:
+            return None
+        return self.rows[self.selected]
+
+    def select_key(self, key):
+        """Select the row whose key is *key* (None clears the selection)."""
+        idx = None
+        if key is not None:
+            idx = next((i for i, r in enumerate(self.rows)
+                        if self.key(r) == key), None)
+        self.selected = idx
+        self._sel_key = key if idx is not None else None
+        self._render()
+
+    def see_end(self):
+        self.top = max(0, len(self.rows) - self._capacity())
+        self._render()
+
+    def index_of(self, iid):
+        """Index into *rows* of the row pool item *iid* shows, or None."""
+        try:
+            idx = self.top + self._pool.index(iid)
+        except ValueError:
+            return None
+        return idx if idx < len(self.rows) else None
+
+    def iid_at(self, idx: int):
+        """Pool item currently showing row *idx*, or None if off screen."""
+        k = idx - self.top
+        if 0 <= k < len(self._pool) and idx < len(self.rows):
+            return self._pool[k]
+        return None
+
+    def _capacity(self) -> int:
+        # One line is taken by the heading row
+        return max(1, self.tree.winfo_height() // self.rowheight - 1)
+
+    def _scroll(self, lines: int):
+        self.top += lines
+        self._render()
+
+    def _on_wheel(self, e):
+        self._scroll(-3 if e.delta > 0 else 3)
 
-    widget.after(0, _insert_chunk)
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.top = int(float(amount) * len(self.rows))
+        elif unit == 'pages':
+            self.top += int(amount) * self._capacity()
+        else:
+            self.top += int(amount)
+        self._render()
+
+    def _set_selection(self, idx):
+        self.selected = idx
+        key = None if idx is None else self.key(self.rows[idx])
+        if key != self._sel_key:
+            self._sel_key = key
+            if self.on_select is not None:
+                self.on_select(key)
+
+    def _on_tree_select(self, _e=None):
+        # Also fires (queued) for the selection _render itself applies;
+        # mapping the item back through the current offset keeps that a
+        # no-op.  An empty selection only clears ours when the row is on
+        # screen — otherwise it is _render parking the highlight.
+        sel = self.tree.selection()
+        if sel:
+            self._sel_iid = sel[0]
+            idx = self.index_of(sel[0])
+            if idx is not None:
+                self._set_selection(idx)
+        else:
+            self._sel_iid = None
+            if self.selected is not None and \
+                    self.iid_at(self.selected) is not None:
+                self._set_selection(None)
+
+    def _on_nav_key(self, e):
+        total = len(self.rows)
+        if not total:
+            return 'break'
+        cap  = self._capacity()
+        step = {'Up': -1, 'Down': 1, 'Prior': -cap, 'Next': cap,
+                'Home': -total, 'End': total}[e.keysym]
+        cur  = self.selected
+        if cur is None:
+            cur = self.top if step > 0 else self.top + cap - 1
+        else:
+            cur += step
+        cur = max(0, min(cur, total - 1))
+        self._set_selection(cur)
+        if cur < self.top:
+            self.top = cur
+        elif cur >= self.top + cap:
+            self.top = cur - cap + 1
+        self._render()
+        return 'break'   # the class binding only knows the pool items
+
+    def _render(self):
+        tree  = self.tree
+        cap   = self._capacity()
+        total = len(self.rows)
+        self.top = max(0, min(self.top, total - cap))
+        while len(self._pool) < cap:
+            self._pool.append(tree.insert('', 'end'))
+        if len(self._pool) > cap:
+            tree.delete(*self._pool[cap:])
+            for iid in self._pool[cap:]:
+                self._shown.pop(iid, None)
+                self._detached.discard(iid)
+            del self._pool[cap:]
+        # Rows are compared by identity first (callers reuse the tuple of an
+        # unchanged row) and by value second, so a scroll or refresh only
+        # reconfigures pool items whose content really differs
+        shown    = self._shown
+        detached = self._detached
+        hidden   = []
+        for k, iid in enumerate(self._pool):
+            idx = self.top + k
+            if idx >= total:
+                if iid not in detached:
+                    hidden.append(iid)
+                continue
+            row = self.rows[idx]
+            old = shown.get(iid)
+            if old is not row and old != row:
+                tree.item(iid, values=row[0], tags=row[1])
+            shown[iid] = row
+            if iid in detached:
+                tree.move(iid, '', k)
+                detached.discard(iid)
+        if hidden:
+            tree.detach(*hidden)
+            for iid in hidden:
+                shown.pop(iid, None)
+            detached.update(hidden)
+        # Put the highlight on the item now showing the selected row, or
+        # park it while that row is scrolled out of view
+        want = None if self.selected is None else self.iid_at(self.selected)
+        if want != self._sel_iid:
+            if want is not None:
+                tree.selection_set(want)
+                tree.focus(want)
+            else:
+                tree.selection_remove(*tree.selection())
+            self._sel_iid = want
+        if total:
+            self.sb.set(self.top / total, min(1.0, (self.top + cap) / total))
+        else:
+            self.sb.set(0.0, 1.0)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -425,6 +837,21 @@ class TournamentPlayer:
         self.color_history.append(color)
         self.opponents.append(opponent_name)
 
+    @property
+    def engine_path(self):
+        return self._engine_path
+
+    @engine_path.setter
+    def engine_path(self, path):
+        # Roster label is derived once here rather than on every refresh
+        self._engine_path  = path
+        if not path:
+            self._path_display = "—"
+        elif len(path) > 38:
+            self._path_display = "…" + path[-36:]
+        else:
+            self._path_display = path
+
     @property
     def games_played(self):
         return self.wins + self.draws + self.losses
@@ -449,6 +876,21 @@ class TournamentGame:
         self.eval_history = []
         self.move_qualities = []  # Store move quality classifications
         self.id           = id(self)
+        # Searchable text for the history filter, finalised on completion
+        self._search_blob = f"{white.name}\x00{black.name}"
+
+    @property
+    def move_history(self):
+        # Games rebuilt from the DB replay their PGN on first use only
+        if self._unparsed_pgn is not None:
+            self._move_history = _replay_pgn_moves(self._unparsed_pgn)
+            self._unparsed_pgn = None
+        return self._move_history
+
+    @move_history.setter
+    def move_history(self, moves):
+        self._move_history = moves
+        self._unparsed_pgn = None
 
     @property
     def white_score(self):
@@ -602,6 +1044,9 @@ class Tournament:
         self.format        = fmt
         self.players       = {p.name: p for p in players}
         self.player_list   = list(players)
+        # Normalised, lower-cased names for O(1) duplicate checks
+        self._norm_name_set = {normalize_engine_name(p.name).lower()
+                               for p in players}
         self.rounds        = rounds
         self.movetime_ms   = movetime_ms
         self.double_rr     = double_rr
@@ -611,21 +1056,28 @@ class Tournament:
 
         self.current_round = 0
         self.all_games     = []
+        self._games_by_round = {}  # round number → games, in creation order
+        self._completed    = []    # games in the order they finished
+        self._games_by_result = {}  # result string → completed games
+        self._game_by_key  = {}    # (round, white, black) → completed game
         self.round_games   = []
+        self._pending_cursor = 0   # round_games before this index are not pending
         self.played_pairs  = set()
         self.bye_history   = set()
         self.started       = False
         self.finished      = False
         self.winner        = None
+        self._rev          = 0     # bumped on start / game done / finish
         self.status_msg    = "Ready"
         self.created_at    = datetime.now()
 
         self.tournament_id = str(id(self))
 
-        self._ko_pending_winners = []
+        # Name-keyed (insertion-ordered) so roster removals are O(1)
+        self._ko_pending_winners = {}
         self._ko_eliminated      = []
         self._ko_round_games     = {}
-        self._ko_active_players  = list(players)
+        self._ko_active_players  = {p.name: p for p in players}
 
         if fmt == self.FORMAT_ROUNDROBIN:
             self._rr_schedule = RoundRobinPairing.generate_all_rounds(
@@ -634,14 +1086,26 @@ class Tournament:
         else:
             self._rr_schedule = None
 
+    @property
+    def winner(self):
+        return self._winner
+
+    @winner.setter
+    def winner(self, player):
+        # List label is derived once here rather than on every refresh
+        self._winner      = player
+        self._winner_name = player.name if player is not None else "—"
+
     def start(self):
         self.started = True
+        self._rev   += 1
         self._generate_round()
         self.status_msg = f"Round {self.current_round} started"
 
     def _generate_round(self):
         self.current_round += 1
         self.round_games = []
+        self._pending_cursor = 0
 
         if self.format == self.FORMAT_SWISS:
             pairs, bye = SwissPairing.pair(
@@ -649,7 +1113,7 @@ class Tournament:
             for w, b in pairs:
                 g = TournamentGame(self.current_round, w, b)
                 self.round_games.append(g)
-                self.all_games.append(g)
+                self._add_game(g)
             if bye:
                 bye.record(1.0, 'BYE', 'w')
                 self.bye_history.add(bye.name)
@@ -660,24 +1124,25 @@ class Tournament:
                 for w, b in self._rr_schedule[idx]:
                     g = TournamentGame(self.current_round, w, b)
                     self.round_games.append(g)
-                    self.all_games.append(g)
+                    self._add_game(g)
 
         elif self.format == self.FORMAT_KNOCKOUT:
             if self.current_round == 1:
-                bracket = KnockoutBracket.seed_bracket(self._ko_active_players)
+                bracket = KnockoutBracket.seed_bracket(
+                    list(self._ko_active_players.values()))
                 for w, b in bracket:
                     if w is None or b is None:
                         survivor = w or b
                         if survivor:
-                            self._ko_pending_winners.append(survivor)
+                            self._ko_pending_winners[survivor.name] = survivor
                         continue
                     g = TournamentGame(self.current_round, w, b)
                     self.round_games.append(g)
-                    self.all_games.append(g)
+                    self._add_game(g)
                 self._ko_round_games[self.current_round] = list(self.round_games)
             else:
-                prev_winners = list(self._ko_pending_winners)
-                self._ko_pending_winners = []
+                prev_winners = list(self._ko_pending_winners.values())
+                self._ko_pending_winners = {}
                 if len(prev_winners) <= 1:
                     self.winner = prev_winners[0] if prev_winners else None
                     self._finish()
@@ -686,7 +1151,7 @@ class Tournament:
                 for w, b in pairs:
                     g = TournamentGame(self.current_round, w, b)
                     self.round_games.append(g)
-                    self.all_games.append(g)
+                    self._add_game(g)
                 self._ko_round_games[self.current_round] = list(self.round_games)
 
     def record_game_result(self, game: TournamentGame, result, reason,
@@ -702,6 +1167,7 @@ class Tournament:
         game.eval_history = eval_history or []
         game.move_qualities = move_qualities or []
         game.status       = "done"
+        self._mark_completed(game)
 
         pair_key = frozenset({game.white.name, game.black.name})
         self.played_pairs.add(pair_key)
@@ -714,17 +1180,30 @@ class Tournament:
 
         if self.format == self.FORMAT_KNOCKOUT and ws is not None:
             if ws > bs:
-                self._ko_pending_winners.append(game.white)
+                self._ko_pending_winners[game.white.name] = game.white
                 self._ko_eliminated.append(game.black)
             elif bs > ws:
-                self._ko_pending_winners.append(game.black)
+                self._ko_pending_winners[game.black.name] = game.black
                 self._ko_eliminated.append(game.white)
             else:
                 adv  = random.choice([game.white, game.black])
                 elim = game.black if adv is game.white else game.white
-                self._ko_pending_winners.append(adv)
+                self._ko_pending_winners[adv.name] = adv
                 self._ko_eliminated.append(elim)
 
+    def _add_game(self, game: TournamentGame):
+        self.all_games.append(game)
+        self._games_by_round.setdefault(game.round_num, []).append(game)
+
+    def _mark_completed(self, game: TournamentGame):
+        game._search_blob = (f"{game.white.name}\x00{game.black.name}"
+                             f"\x00{game.opening or ''}")
+        self._completed.append(game)
+        self._games_by_result.setdefault(game.result, []).append(game)
+        self._game_by_key[(game.round_num, game.white.name,
+                           game.black.name)] = game
+        self._rev += 1
+
     def round_complete(self):
         return all(g.status == "done" for g in self.round_games)
 
@@ -746,7 +1225,7 @@ class Tournament:
             return False
 
         elif self.format == self.FORMAT_KNOCKOUT:
-            active = self._ko_pending_winners
+            active = list(self._ko_pending_winners.values())
             if len(active) <= 1:
                 self.winner = active[0] if active else None
                 self._finish()
@@ -758,6 +1237,7 @@ class Tournament:
 
     def _finish(self):
         self.finished = True
+        self._rev    += 1
         standings = self.get_standings()
         if standings and self.winner is None:
             self.winner = standings[0]
@@ -768,16 +1248,20 @@ class Tournament:
         if self.format != self.FORMAT_SWISS:
             return
         score_map = {p.name: p.score for p in self.player_list}
+        # One pass over the finished games credits both sides, instead of
+        # rescanning every game once per player
+        sb = {id(p): 0.0 for p in self.player_list}
+        for g in self._completed:
+            if g.status != 'done':
+                continue
+            wid, bid = id(g.white), id(g.black)
+            if wid in sb and g.white_score is not None:
+                sb[wid] += g.white_score * score_map.get(g.black.name, 0)
+            if bid in sb and g.black_score is not None:
+                sb[bid] += g.black_score * score_map.get(g.white.name, 0)
         for p in self.player_list:
             p.buchholz  = sum(score_map.get(opp, 0) for opp in p.opponents if opp != 'BYE')
-            p.sonneborn = 0.0
-            for g in self.all_games:
-                if g.status != 'done':
-                    continue
-                if g.white is p and g.white_score is not None:
-                    p.sonneborn += g.white_score * score_map.get(g.black.name, 0)
-                elif g.black is p and g.black_score is not None:
-                    p.sonneborn += g.black_score * score_map.get(g.white.name, 0)
+            p.sonneborn = sb[id(p)]
 
     def get_standings(self):
         players = list(self.player_list)
@@ -786,12 +1270,16 @@ class Tournament:
         elif self.format == self.FORMAT_ROUNDROBIN:
             players.sort(key=lambda p: (-p.score, -p.wins, p.name))
         elif self.format == self.FORMAT_KNOCKOUT:
-            eliminated_names = [p.name for p in self._ko_eliminated]
+            # name → index of its first elimination, for O(1) sort keys
+            elim_pos = {}
+            for i, ep in enumerate(self._ko_eliminated):
+                elim_pos.setdefault(ep.name, i)
+            n_elim = len(self._ko_eliminated)
             def ko_key(p):
-                if p.name not in eliminated_names:
+                idx = elim_pos.get(p.name)
+                if idx is None:
                     return (0, -p.score, p.name)
-                idx = eliminated_names.index(p.name)
-                return (len(eliminated_names) - idx, -p.score, p.name)
+                return (n_elim - idx, -p.score, p.name)
             players.sort(key=ko_key)
         return players
 
@@ -799,11 +1287,17 @@ class Tournament:
         return [g for g in self.round_games if g.status == "pending"]
 
     def next_game(self):
-        pending = self.get_pending_games()
-        return pending[0] if pending else None
+        # Games leave "pending" in round order, so a forward cursor suffices
+        games = self.round_games
+        i     = self._pending_cursor
+        while i < len(games) and games[i].status != "pending":
+            i += 1
+        self._pending_cursor = i
+        return games[i] if i < len(games) else None
 
     def get_all_completed_games(self):
-        return [g for g in self.all_games if g.status == "done"]
+        # Shared list — callers must treat it as read-only
+        return self._completed
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -897,29 +1391,62 @@ class EvalBarWidget(tk.Frame):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class EvalGraphWidget(tk.Frame):
+    MAX_CP      = 600
+    LIVE_WINDOW = 512    # plies kept when fed one eval at a time
+
     def __init__(self, parent, width=580, height=90, **kwargs):
         super().__init__(parent, bg=BG, **kwargs)
         self.W = width
         self.H = height
-        self._evals = []
+        self._evals = deque()
+        self._redraw_id = None
         self.canvas = tk.Canvas(
             self, width=self.W, height=self.H,
             bg="#0a0a18", bd=0,
             highlightthickness=1,
             highlightbackground="#333")
         self.canvas.pack(fill='both', expand=True)
+        self._draw_background()
         self._draw([])
 
     def set_evals(self, eval_list):
-        self._evals = list(eval_list)
-        self._draw(self._evals)
+        self._cancel_redraw()
+        self._evals = deque(eval_list)
+        self._draw(list(self._evals))
+
+    def append_eval(self, cp):
+        """
+        Add one ply to a live graph.  Only the last LIVE_WINDOW plies are
+        kept, and appends arriving in the same event-loop pass share one
+        redraw on the next idle cycle.
+        """
+        self._evals.append(cp)
+        if len(self._evals) > self.LIVE_WINDOW:
+            self._evals.popleft()
+        if self._redraw_id is None:
+            self._redraw_id = self.after_idle(self._flush_redraw)
 
     def highlight_move(self, idx):
-        self._draw(self._evals, highlight=idx)
+        self._cancel_redraw()
+        self._draw(list(self._evals), highlight=idx)
 
-    def _draw(self, evals, highlight=None):
+    def _flush_redraw(self):
+        self._redraw_id = None
+        self._draw(list(self._evals))
+
+    def _cancel_redraw(self):
+        if self._redraw_id is not None:
+            self.after_cancel(self._redraw_id)
+            self._redraw_id = None
+
+    def _cp_to_y(self, cp):
+        mid  = self.H // 2
+        frac = max(-1.0, min(1.0, cp / self.MAX_CP))
+        return int(mid - frac * mid * 0.88)
+
+    def _draw_background(self):
+        # Static layers: drawn once, the series is redrawn on top of them
         c  = self.canvas
-        c.delete('all')
         W, H = self.W, self.H
         mid = H // 2
         c.create_rectangle(0, 0, W, mid, fill="#080818", outline='')
@@ -930,46 +1457,59 @@ class EvalGraphWidget(tk.Frame):
             y2 = int(mid + (i/5) * mid * 0.85)
             c.create_line(0, y2, W, y2, fill="#121a12", width=1)
         c.create_line(0, mid, W, mid, fill="#333", width=1, dash=(4,4))
-        if not evals:
+        for label, cp_val in [("+5", 500), ("+2", 200), ("0", 0), ("-2", -200), ("-5", -500)]:
+            y = self._cp_to_y(cp_val)
+            if 4 <= y <= H - 4:
+                c.create_text(W-16, y, text=label, fill="#444",
+                            font=('Consolas', 6), anchor='e', tags='axis')
+
+    def _draw(self, evals, highlight=None):
+        # None entries are plies without an evaluation: they keep their
+        # x slot but the series is drawn through the evaluated ones only
+        c  = self.canvas
+        c.delete('series')
+        W, H = self.W, self.H
+        mid = H // 2
+        n = len(evals)
+        known = [i for i in range(n) if evals[i] is not None]
+        if not known:
+            c.itemconfigure('axis', state='hidden')
             c.create_text(W//2, H//2, text="No eval data",
-                        fill="#444", font=('Segoe UI', 8))
+                        fill="#444", font=('Segoe UI', 8), tags='series')
             return
-        MAX_CP = 600
-        n = len(evals)
-        def cp_to_y(cp):
-            frac = max(-1.0, min(1.0, cp / MAX_CP))
-            return int(mid - frac * mid * 0.88)
+        cp_to_y = self._cp_to_y
         def idx_to_x(i):
             if n <= 1: return W // 2
             return int(i * (W - 4) / (n - 1)) + 2
-        poly_pts = [2, mid]
-        for i, cp in enumerate(evals):
-            poly_pts += [idx_to_x(i), cp_to_y(cp)]
-        poly_pts += [idx_to_x(n-1), mid]
-        c.create_polygon(poly_pts, fill="#1a3a1a", outline='', smooth=True)
-        pts = []
-        for i, cp in enumerate(evals):
-            pts += [idx_to_x(i), cp_to_y(cp)]
+        # Screen coordinates computed once and shared by fill, line and markers
+        xs  = [idx_to_x(i) for i in known]
+        ys  = [cp_to_y(evals[i]) for i in known]
+        pts = [v for xy in zip(xs, ys) for v in xy]
+        c.create_polygon([xs[0], mid] + pts + [xs[-1], mid],
+                         fill="#1a3a1a", outline='', smooth=True, tags='series')
         if len(pts) >= 4:
-            c.create_line(pts, fill="#00CC44", width=2, smooth=True)
-        for i in range(1, n):
-            delta = evals[i] - evals[i-1]
+            c.create_line(pts, fill="#00CC44", width=2, smooth=True, tags='series')
+        prev = evals[known[0]]
+        for k in range(1, len(known)):
+            cp    = evals[known[k]]
+            delta = cp - prev
+            prev  = cp
             if abs(delta) > 150:
-                x = idx_to_x(i)
-                y = cp_to_y(evals[i])
+                x, y = xs[k], ys[k]
                 col = "#FF4444" if delta < 0 else "#FF8800"
-                c.create_oval(x-4, y-4, x+4, y+4, fill=col, outline='')
+                c.create_oval(x-4, y-4, x+4, y+4, fill=col, outline='',
+                              tags='series')
         if highlight is not None and 0 <= highlight < n:
             x = idx_to_x(highlight)
-            y = cp_to_y(evals[highlight])
-            c.create_line(x, 0, x, H, fill=ACCENT, width=1, dash=(3,3))
-            c.create_oval(x-5, y-5, x+5, y+5,
-                        fill=ACCENT, outline='white', width=1)
-        for label, cp_val in [("+5", 500), ("+2", 200), ("0", 0), ("-2", -200), ("-5", -500)]:
-            y = cp_to_y(cp_val)
-            if 4 <= y <= H - 4:
-                c.create_text(W-16, y, text=label, fill="#444",
-                            font=('Consolas', 6), anchor='e')
+            c.create_line(x, 0, x, H, fill=ACCENT, width=1, dash=(3,3),
+                          tags='series')
+            if evals[highlight] is not None:
+                y = cp_to_y(evals[highlight])
+                c.create_oval(x-5, y-5, x+5, y+5,
+                            fill=ACCENT, outline='white', width=1,
+                            tags='series')
+        c.itemconfigure('axis', state='normal')
+        c.tag_raise('axis')
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -986,14 +1526,19 @@ class MiniBoardWidget(tk.Frame):
         self._in_replay    = False
         self._replay_moves = []
         self._replay_idx   = 0
-        self._replay_board = None
+        self._replay_boards = []     # board rows after each ply; [0] = start
+        self._replay_sans  = []
         self._replay_evals = []
         self._replay_qualities = []  # Store move qualities
         self._show_eval    = show_eval_bar
+        self._last_sig     = None    # (rows, last_move) of the last paint
+        self._lm_cache     = (None, None, None)   # (last_move, from, to)
         self._build()
 
     def _build(self):
         sz = self.SQ
+        # One font object for every piece glyph — Tk skips re-parsing the spec
+        self._piece_font = tkfont.Font(family='Segoe UI', size=int(sz*0.60))
         # Main container for board and eval bar
         outer = tk.Frame(self, bg=BG)
         outer.pack(side='top', fill='x')
@@ -1048,12 +1593,35 @@ class MiniBoardWidget(tk.Frame):
 
     def set_replay(self, move_history, eval_history=None, move_qualities=None):
         self._replay_moves = [m[0] for m in move_history]
+        self._replay_sans  = [m[1] for m in move_history]
         self._replay_evals = eval_history or []
         self._replay_qualities = move_qualities or []
+        self._replay_boards = self._replay_snapshots(self._replay_moves)
         self._replay_idx   = len(self._replay_moves)
         self._in_replay    = True
         self._render_replay()
 
+    @staticmethod
+    def _replay_snapshots(moves):
+        """
+        Play the game through once and keep the board after every ply, so
+        stepping through the replay is a list lookup instead of a re-play
+        from the start position.
+        """
+        try:
+            from core.board import Board as _Board
+        except ImportError:
+            return []
+        b = _Board()
+        boards = [tuple(tuple(r) for r in b.board)]
+        for uci in moves:
+            try: b.apply_uci(uci)
+            except: break
+            boards.append(tuple(tuple(r) for r in b.board))
+        # Plies after an illegal move keep showing the last legal position
+        boards += [boards[-1]] * (len(moves) + 1 - len(boards))
+        return boards
+
     def _rep_start(self): self._replay_idx = 0;                        self._render_replay()
     def _rep_end(self):   self._replay_idx = len(self._replay_moves);  self._render_replay()
     def _rep_prev(self):
@@ -1064,32 +1632,24 @@ class MiniBoardWidget(tk.Frame):
         self._render_replay()
 
     def _render_replay(self):
-        try:
-            from core.board import Board as _Board
-        except ImportError:
-            try:
-                from core.board import Board as _Board
-            except ImportError:
-                return
-        b = _Board()
-        moves = self._replay_moves[:self._replay_idx]
-        for uci in moves:
-            try: b.apply_uci(uci)
-            except: break
-        last = moves[-1] if moves else None
-        self._draw_from_board(b, last)
+        if not self._replay_boards:
+            return
+        n     = self._replay_idx
+        total = len(self._replay_moves)
+        last  = self._replay_moves[n-1] if n > 0 else None
+        self._draw(self._replay_boards[n], last)
         if self.eval_bar is not None:
-            idx = self._replay_idx - 1
-            if 0 <= idx < len(self._replay_evals):
-                self.eval_bar.set_eval(self._replay_evals[idx])
+            idx = n - 1
+            cp = (self._replay_evals[idx]
+                  if 0 <= idx < len(self._replay_evals) else None)
+            if cp is not None:
+                self.eval_bar.set_eval(cp)
             else:
                 self.eval_bar.reset()
-        n = self._replay_idx
-        total = len(self._replay_moves)
-        
+
         # Display move quality if available
         if hasattr(self, 'quality_lbl'):
-            idx = self._replay_idx - 1
+            idx = n - 1
             if 0 <= idx < len(self._replay_qualities):
                 quality = self._replay_qualities[idx]
                 if quality:
@@ -1099,20 +1659,9 @@ class MiniBoardWidget(tk.Frame):
                     self.quality_lbl.config(text="")
             else:
                 self.quality_lbl.config(text="")
-        
+
         if n > 0:
-            san = ""
-            try:
-                tmp = _Board()
-                for uci in self._replay_moves[:n-1]:
-                    tmp.apply_uci(uci)
-                legal = tmp.legal_moves()
-                uci_now = self._replay_moves[n-1]
-                fc = ord(uci_now[0])-ord('a'); fr = 8-int(uci_now[1])
-                tc = ord(uci_now[2])-ord('a'); tr = 8-int(uci_now[3])
-                promo = uci_now[4].lower() if len(uci_now)>4 else None
-                san = tmp._build_san(fr,fc,tr,tc,promo,legal)
-            except: pass
+            san  = self._replay_sans[n-1]
             side = "White" if n%2==1 else "Black"
             self.move_lbl.config(
                 text=f"Move {(n+1)//2} {side}: {san}  [{n}/{total}]")
@@ -1124,12 +1673,20 @@ class MiniBoardWidget(tk.Frame):
         self._draw(rows, last_move)
 
     def _draw(self, rows, last_move=None):
+        # Eval-only updates re-send the same position — skip the repaint
+        sig = (tuple(tuple(r) for r in rows) if rows else None, last_move)
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
         self.canvas.delete('all')
         sz = self.SQ
-        lm_from = lm_to = None
-        if last_move and len(last_move) >= 4:
-            lm_from = (8-int(last_move[1]), ord(last_move[0])-ord('a'))
-            lm_to   = (8-int(last_move[3]), ord(last_move[2])-ord('a'))
+        cached, lm_from, lm_to = self._lm_cache
+        if last_move != cached:
+            lm_from = lm_to = None
+            if last_move and len(last_move) >= 4:
+                lm_from = (8-int(last_move[1]), ord(last_move[0])-ord('a'))
+                lm_to   = (8-int(last_move[3]), ord(last_move[2])-ord('a'))
+            self._lm_cache = (last_move, lm_from, lm_to)
         for row in range(8):
             for col in range(8):
                 light = (row+col)%2 == 0
@@ -1146,12 +1703,11 @@ class MiniBoardWidget(tk.Frame):
                         sym = UNICODE.get(pc, pc)
                         fg  = '#F5F5F5' if pc.isupper() else '#1A1A1A'
                         sh  = '#000000' if pc.isupper() else '#888888'
-                        fsz = int(sz*0.60)
                         cx, cy = x1+sz//2, y1+sz//2
                         self.canvas.create_text(cx+1,cy+2,text=sym,
-                            font=('Segoe UI',fsz),fill=sh)
+                            font=self._piece_font,fill=sh)
                         self.canvas.create_text(cx,cy,text=sym,
-                            font=('Segoe UI',fsz),fill=fg)
+                            font=self._piece_font,fill=fg)
         self.canvas.create_rectangle(0,0,sz*8,sz*8,outline='#555',width=1)
 
 
@@ -1162,7 +1718,7 @@ class MiniBoardWidget(tk.Frame):
 class TournamentRunner:
     def __init__(self, tournament: Tournament, on_game_start,
                 on_board_update, on_game_end, on_round_end,
-                on_tournament_end, on_status):
+                on_tournament_end, on_status, on_eval=None):
         self.t               = tournament
         self.on_game_start   = on_game_start
         self.on_board_update = on_board_update
@@ -1172,20 +1728,47 @@ class TournamentRunner:
         self.on_status       = on_status
         self._stop_flag      = False
         self._pause_flag     = False
+        self._running_evt    = threading.Event()   # set while not paused
+        self._stop_evt       = threading.Event()
+        self._running_evt.set()
         self._thread         = None
         self.current_engines = []
         self._analyzer       = None
         self._analyzer_is_external = False
+        self.on_eval         = on_eval
+        # Holds at most one position; a newer ply replaces a stale one
+        self._analyzer_queue  = queue.Queue(maxsize=1)
+        self._analyzer_thread = None
+        # (evals, ply, cp) of the analyzer's last result; the queue drops
+        # stale plies, so the previous ply is often missing from evals
+        self._last_eval       = None
 
     def start(self):
         self._stop_flag  = False
         self._pause_flag = False
+        self._stop_evt.clear()
+        self._running_evt.set()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
-    def pause(self):  self._pause_flag = True
-    def resume(self): self._pause_flag = False
-    def stop(self):   self._stop_flag = True; self._pause_flag = False
+    def pause(self):
+        self._pause_flag = True
+        self._running_evt.clear()
+
+    def resume(self):
+        self._pause_flag = False
+        self._running_evt.set()
+
+    def stop(self):
+        self._stop_flag  = True
+        self._pause_flag = False
+        self._stop_evt.set()
+        self._running_evt.set()
+
+    def _wait_while_paused(self):
+        # Blocks without polling; stop() also sets the event
+        while self._pause_flag and not self._stop_flag:
+            self._running_evt.wait()
 
     def _run(self):
         analyzer_ref = self.t.analyzer_path
@@ -1206,6 +1789,9 @@ class TournamentRunner:
                     self._analyzer = AnalyzerEngine(analyzer_path, "TournamentAnalyzer")
                     self._analyzer.start()
                     self._analyzer_is_external = False
+                    self._analyzer_thread = threading.Thread(
+                        target=self._analyzer_loop, daemon=True)
+                    self._analyzer_thread.start()
                     self.on_status(f"🔍 Analyzer ready: {os.path.basename(analyzer_path)}")
                 except Exception as e:
                     self._analyzer = None
@@ -1222,26 +1808,30 @@ class TournamentRunner:
             self.t.start()
 
         while not self._stop_flag and not self.t.finished:
-            while self._pause_flag and not self._stop_flag:
-                time.sleep(0.1)
+            self._wait_while_paused()
 
             game = self.t.next_game()
             if game is None:
                 if self.t.round_complete():
                     self.on_status(f"Round {self.t.current_round} complete!")
-                    time.sleep(0.5)
+                    self._stop_evt.wait(0.5)
                     done = self.t.advance_round()
                     self.on_round_end(self.t.current_round - (0 if done else 1))
                     if done:
                         break
                 else:
-                    time.sleep(0.1)
+                    self._stop_evt.wait(0.1)
                 continue
 
             self._play_game(game)
             if self._stop_flag:
                 break
 
+        if self._analyzer_thread is not None:
+            self._analyzer_queue.put(None)
+            self._analyzer_thread.join()
+            self._analyzer_thread = None
+
         if self._analyzer and not self._analyzer_is_external:
             try: self._analyzer.stop()
             except: pass
@@ -1310,8 +1900,7 @@ class TournamentRunner:
         board        = _Board()
         last_move    = None
         start_t      = time.time()
-        eval_history = []
-        move_qualities = []  # Track move quality classifications
+        evals        = {}    # ply → (cp, quality), filled by the analyzer thread
         opening_name = None
         result       = None
         reason       = ""
@@ -1320,10 +1909,17 @@ class TournamentRunner:
         book_moves_used = 0
         MAX_BOOK_MOVES  = 20
 
+        # Plies are paced against absolute deadlines, so engine think time
+        # counts toward the configured delay instead of adding to it
+        loop_start = time.time()
+        ply        = 0
+
         while True:
             if self._stop_flag: break
-            while self._pause_flag and not self._stop_flag:
-                time.sleep(0.1)
+            if self._pause_flag:
+                paused_at = time.time()
+                self._wait_while_paused()
+                loop_start += time.time() - paused_at
 
             over, result, reason, winner_color = board.game_result()
             if over: break
@@ -1340,11 +1936,7 @@ class TournamentRunner:
             uci = None
 
             try:
-                legal_ucis = set()
-                for (fr, fc, tr, tc, promo) in board.legal_moves():
-                    base = (f"{chr(ord('a')+fc)}{8-fr}"
-                            f"{chr(ord('a')+tc)}{8-tr}")
-                    legal_ucis.add(base + promo.lower() if promo else base)
+                legal_ucis = board.legal_uci_moves()
             except Exception:
                 legal_ucis = None
 
@@ -1395,54 +1987,15 @@ class TournamentRunner:
                 if found_name:
                     opening_name = found_name
 
-            cp_val   = None
-            mate_val = None
-            quality  = None
-            if self._analyzer:
-                try:
-                    mvs_for_eval = board.uci_moves_str() if hasattr(board, 'uci_moves_str') else ""
-                    if hasattr(self._analyzer, 'eval_position'):
-                        cp_val, score_type = self._analyzer.eval_position(
-                            mvs_for_eval, movetime_ms=150)
-                        if cp_val is not None:
-                            if score_type == 'mate':
-                                mate_val = cp_val // 30000 if cp_val != 0 else 0
-                            eval_history.append(cp_val)
-                            # Classify move quality based on eval change
-                            if len(eval_history) >= 2:
-                                cp_before = eval_history[-2]
-                                cp_after  = eval_history[-1]
-                                is_white  = not is_white_turn  # Previous move was opposite color
-                                try:
-                                    from core.utils import classify_move_quality
-                                    quality = classify_move_quality(cp_before, cp_after, is_white)
-                                except ImportError:
-                                    pass
-                            move_qualities.append(quality)
-                    elif hasattr(self._analyzer, 'get_eval'):
-                        cp_val = self._analyzer.get_eval(mvs_for_eval, movetime_ms=150)
-                        if cp_val is not None:
-                            eval_history.append(cp_val)
-                            # Classify move quality based on eval change
-                            if len(eval_history) >= 2:
-                                cp_before = eval_history[-2]
-                                cp_after  = eval_history[-1]
-                                is_white  = not is_white_turn
-                                try:
-                                    from core.utils import classify_move_quality
-                                    quality = classify_move_quality(cp_before, cp_after, is_white)
-                                except ImportError:
-                                    pass
-                            move_qualities.append(quality)
-                except Exception:
-                    pass
-            
-            # If no analyzer or no quality computed, add None placeholder
-            if quality is None and len(move_qualities) < len(board.move_history):
-                move_qualities.append(None)
+            if self._analyzer_thread is not None:
+                self._queue_eval(game, evals, len(board.move_history),
+                                 board.uci_moves_str(), not is_white_turn)
 
-            self.on_board_update(game, board, last_move, cp_val, mate_val, opening_name)
-            time.sleep(max(0.02, self.t.delay))
+            self.on_board_update(game, board, last_move, None, None, opening_name)
+            ply += 1
+            wait = loop_start + ply * self.t.delay - time.time()
+            if wait > 0:
+                self._stop_evt.wait(wait)
 
         if not result:
             over, result, reason, winner_color = board.game_result()
@@ -1450,6 +2003,12 @@ class TournamentRunner:
                 result = '*'
                 reason = "Unknown"
 
+        # Let the in-flight evaluation for this game land before recording
+        if self._analyzer_thread is not None:
+            self._analyzer_queue.join()
+        eval_history, move_qualities = self._collect_evals(
+            evals, len(board.move_history))
+
         duration = int(time.time() - start_t)
         date_str = datetime.now().strftime("%Y.%m.%d")
         pgn = build_pgn(game.white.name, game.black.name,
@@ -1464,6 +2023,81 @@ class TournamentRunner:
         self._kill(e_white, e_black)
         self.on_game_end(game)
 
+    # ── Background analysis ───────────────────────────────────────────────────
+
+    def _queue_eval(self, game, evals, ply, moves_str, mover_is_white):
+        """Hand a position to the analyzer thread without blocking the game."""
+        item = (game, evals, ply, moves_str, mover_is_white)
+        try:
+            self._analyzer_queue.put_nowait(item)
+        except queue.Full:
+            # Analyzer is still busy — drop the stale position for the newest
+            try:
+                self._analyzer_queue.get_nowait()
+                self._analyzer_queue.task_done()
+            except queue.Empty:
+                pass
+            self._analyzer_queue.put_nowait(item)
+
+    def _analyzer_loop(self):
+        while True:
+            item = self._analyzer_queue.get()
+            if item is None:
+                self._analyzer_queue.task_done()
+                return
+            game, evals, ply, moves_str, mover_is_white = item
+            try:
+                self._eval_ply(game, evals, ply, moves_str, mover_is_white)
+            except Exception:
+                pass
+            finally:
+                self._analyzer_queue.task_done()
+
+    def _eval_ply(self, game, evals, ply, moves_str, mover_is_white):
+        cp_val   = None
+        mate_val = None
+        if hasattr(self._analyzer, 'eval_position'):
+            cp_val, score_type = self._analyzer.eval_position(
+                moves_str, movetime_ms=150)
+            if cp_val is not None and score_type == 'mate':
+                mate_val = cp_val // 30000 if cp_val != 0 else 0
+        elif hasattr(self._analyzer, 'get_eval'):
+            cp_val = self._analyzer.get_eval(moves_str, movetime_ms=150)
+        if cp_val is None:
+            return
+
+        # Classify move quality against the last position evaluated in
+        # this game, even when plies were skipped in between
+        quality = None
+        last    = self._last_eval
+        if last is not None and last[0] is evals and last[1] < ply:
+            try:
+                from core.utils import classify_move_quality
+                quality = classify_move_quality(last[2], cp_val, mover_is_white)
+            except ImportError:
+                pass
+        self._last_eval = (evals, ply, cp_val)
+        evals[ply] = (cp_val, quality)
+        if self.on_eval:
+            self.on_eval(game, ply, cp_val, mate_val)
+
+    @staticmethod
+    def _collect_evals(evals, n_plies):
+        """
+        Flatten the sparse ply → eval map into per-ply lists.  Plies the
+        analyzer skipped are None in both, so replay indices stay aligned
+        with the move list without inventing evaluations.
+        """
+        if not evals:
+            return [], [None] * n_plies
+        eval_history   = []
+        move_qualities = []
+        for ply in range(1, n_plies + 1):
+            cp, quality = evals.get(ply, (None, None))
+            eval_history.append(cp)
+            move_qualities.append(quality)
+        return eval_history, move_qualities
+
     def _book_probe(self, book, board):
         import re
         _UCI_RE = re.compile(r'^[a-h][1-8][a-h][1-8][qrbnQRBN]?$')
@@ -1492,6 +2126,7 @@ class TournamentRunner:
         game.result = '*'
         game.reason = reason
         game.status = 'done'
+        self.t._mark_completed(game)
         self.on_game_end(game)
 
     def _kill(self, *engines):
@@ -1506,6 +2141,10 @@ class TournamentRunner:
 #  Tournament History Window
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Game-list row tag per result string
+_RESULT_TAG = {'1-0': 'wwin', '0-1': 'bwin', '1/2-1/2': 'draw'}
+
+
 class TournamentHistoryWindow:
     def __init__(self, parent, tournament: Tournament, db=None):
         self.t   = tournament
@@ -1519,6 +2158,12 @@ class TournamentHistoryWindow:
         self._selected_game: TournamentGame = None
         self._game_map = {}
         self._elo_map  = {}           # filled async below
+        self._elo_fmt  = {}           # name → (badge text, colour)
+        self._cancel_insert = None    # cancels an unfinished game-list fill
+        self._list_hidden   = False   # game list unpacked during a long fill
+        self._repop_after   = None    # pending debounced repopulate
+        self._last_loaded_iid = None  # game-list row currently in the viewer
+        self.win.protocol("WM_DELETE_WINDOW", self._on_close)
         self._build()
         self._populate_game_list()
 
@@ -1535,6 +2180,8 @@ class TournamentHistoryWindow:
     def _on_elo_loaded(self, elo_map: dict):
         """Called on main thread once background Elo fetch is done."""
         self._elo_map = elo_map
+        self._elo_fmt = _elo_display_map(
+            elo_map, (p.name for p in self.t.player_list))
         # refresh badges on whatever game is currently selected
         if self._selected_game:
             self._load_game(self._selected_game)
@@ -1544,13 +2191,13 @@ class TournamentHistoryWindow:
         tb.pack(fill='x')
         tk.Label(tb, text="📜  Tournament History",
                 bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI', 12, 'bold')).pack(side='left', padx=14, pady=8)
+                font=_font('Segoe UI', 12, 'bold')).pack(side='left', padx=14, pady=8)
         tk.Label(tb, text=self.t.name, bg=PANEL_BG, fg="#666",
-                font=('Segoe UI', 9)).pack(side='left')
+                font=_font('Segoe UI', 9)).pack(side='left')
         tk.Button(tb, text="💾 Export PGN",
                 command=self._export_pgn,
                 bg=BTN_BG, fg=TEXT, relief='flat',
-                font=('Segoe UI', 9), padx=10, pady=4,
+                font=_font('Segoe UI', 9), padx=10, pady=4,
                 cursor='hand2').pack(side='right', padx=8, pady=6)
         tk.Frame(self.win, bg=ACCENT, height=2).pack(fill='x')
         paned = tk.PanedWindow(self.win, orient='horizontal',
@@ -1567,18 +2214,18 @@ class TournamentHistoryWindow:
         hdr = tk.Frame(p, bg=PANEL_BG)
         hdr.pack(fill='x', padx=8, pady=(8,4))
         tk.Label(hdr, text="Games", bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI', 10, 'bold')).pack(side='left')
+                font=_font('Segoe UI', 10, 'bold')).pack(side='left')
         self.game_count_lbl = tk.Label(hdr, text="", bg=PANEL_BG, fg="#555",
-                                        font=('Segoe UI', 8))
+                                        font=_font('Segoe UI', 8))
         self.game_count_lbl.pack(side='left', padx=6)
         flt = tk.Frame(p, bg=PANEL_BG)
         flt.pack(fill='x', padx=8, pady=(0,4))
         tk.Label(flt, text="Filter:", bg=PANEL_BG, fg="#888",
-                font=('Segoe UI', 8)).pack(side='left')
+                font=_font('Segoe UI', 8)).pack(side='left')
         self.filter_var = tk.StringVar()
-        self.filter_var.trace_add('write', lambda *_: self._populate_game_list())
+        self.filter_var.trace_add('write', self._schedule_repopulate)
         tk.Entry(flt, textvariable=self.filter_var,
-                bg=LOG_BG, fg=TEXT, font=('Segoe UI', 8),
+                bg=LOG_BG, fg=TEXT, font=_font('Segoe UI', 8),
                 width=18, relief='flat',
                 insertbackground=TEXT).pack(side='left', padx=4, ipady=3)
         self.result_filter = tk.StringVar(value="All")
@@ -1586,26 +2233,23 @@ class TournamentHistoryWindow:
             tk.Radiobutton(flt, text=txt, variable=self.result_filter,
                         value=val, bg=PANEL_BG, fg="#AAA",
                         selectcolor=BTN_BG, activebackground=PANEL_BG,
-                        font=('Segoe UI', 7), command=self._populate_game_list
+                        font=_font('Segoe UI', 7), command=self._schedule_repopulate
                         ).pack(side='left', padx=1)
         tf = tk.Frame(p, bg=PANEL_BG)
         tf.pack(fill='both', expand=True, padx=8, pady=(0,8))
         sb = tk.Scrollbar(tf); sb.pack(side='right', fill='y')
         cols = ['Rnd','White','Black','Res','Opening','Moves']
         self.game_tree = ttk.Treeview(tf, columns=cols, show='headings',
-                                    yscrollcommand=sb.set, height=28)
+                                    yscrollcommand=sb.set, height=28,
+                                    style=_tree_style(24))
         sb.config(command=self.game_tree.yview)
         wcfg = {'Rnd':36,'White':100,'Black':100,'Res':46,'Opening':120,'Moves':50}
         for c in cols:
             self.game_tree.heading(c, text=c)
-            self.game_tree.column(c, width=wcfg.get(c,60),
+            # Fixed widths — no column re-layout while rows stream in
+            self.game_tree.column(c, width=wcfg.get(c,60), minwidth=wcfg.get(c,60),
+                                stretch=False,
                                 anchor='center' if c not in ('White','Black','Opening') else 'w')
-        style = ttk.Style()
-        style.configure('Treeview', background=LOG_BG, foreground=TEXT,
-                        fieldbackground=LOG_BG, borderwidth=0, rowheight=24)
-        style.configure('Treeview.Heading', background=BTN_BG,
-                        foreground=TEXT, font=('Segoe UI',8,'bold'))
-        style.map('Treeview', background=[('selected',ACCENT)])
         self.game_tree.tag_configure('wwin',  foreground="#FFD700")
         self.game_tree.tag_configure('bwin',  foreground="#C8C8C8")
         self.game_tree.tag_configure('draw',  foreground="#00BFFF")
@@ -1616,7 +2260,7 @@ class TournamentHistoryWindow:
     def _build_viewer(self, p):
         self.viewer_hdr = tk.Label(p, text="← Select a game to replay",
                                     bg=BG, fg="#555",
-                                    font=('Segoe UI', 10, 'bold'),
+                                    font=_font('Segoe UI', 10, 'bold'),
                                     anchor='center', pady=6)
         self.viewer_hdr.pack(fill='x', padx=8)
 
@@ -1630,17 +2274,17 @@ class TournamentHistoryWindow:
         white_col.pack(side='left', fill='x', expand=True, padx=(0,4))
         self.vh_white = tk.Label(white_col, text="♔  —",
                                  bg="#1c2a1c", fg="#FFD700",
-                                 font=('Segoe UI', 9, 'bold'),
+                                 font=_font('Segoe UI', 9, 'bold'),
                                  anchor='center', pady=3)
         self.vh_white.pack(fill='x')
         self.vh_white_elo = tk.Label(white_col, text="",
                                      bg="#1c2a1c", fg="#888",
-                                     font=('Consolas', 7),
+                                     font=_font('Consolas', 7),
                                      anchor='center', pady=1)
         self.vh_white_elo.pack(fill='x')
 
         tk.Label(pl_row, text="vs", bg=BG, fg="#444",
-                font=('Segoe UI',8)).pack(side='left')
+                font=_font('Segoe UI',8)).pack(side='left')
 
         # ── PATCH: black player label + Elo badge ─────────────────────────────
         black_col = tk.Frame(pl_row, bg="#1a1a2a",
@@ -1649,18 +2293,18 @@ class TournamentHistoryWindow:
         black_col.pack(side='right', fill='x', expand=True, padx=(4,0))
         self.vh_black = tk.Label(black_col, text="♚  —",
                                  bg="#1a1a2a", fg="#C8C8C8",
-                                 font=('Segoe UI', 9, 'bold'),
+                                 font=_font('Segoe UI', 9, 'bold'),
                                  anchor='center', pady=3)
         self.vh_black.pack(fill='x')
         self.vh_black_elo = tk.Label(black_col, text="",
                                      bg="#1a1a2a", fg="#888",
-                                     font=('Consolas', 7),
+                                     font=_font('Consolas', 7),
                                      anchor='center', pady=1)
         self.vh_black_elo.pack(fill='x')
 
         self.vh_opening_lbl = tk.Label(p, text="",
                                        bg=BG, fg="#00BFFF",
-                                       font=('Segoe UI', 8, 'italic'),
+                                       font=_font('Segoe UI', 8, 'italic'),
                                        anchor='center', pady=2)
         self.vh_opening_lbl.pack(fill='x', padx=8)
 
@@ -1672,10 +2316,10 @@ class TournamentHistoryWindow:
         graph_lbl_row = tk.Frame(p, bg=BG)
         graph_lbl_row.pack(fill='x', padx=8)
         tk.Label(graph_lbl_row, text="📈 Eval Graph",
-                bg=BG, fg="#AAA", font=('Segoe UI',8,'bold')).pack(side='left')
+                bg=BG, fg="#AAA", font=_font('Segoe UI',8,'bold')).pack(side='left')
         self.eval_info_lbl = tk.Label(graph_lbl_row, text="",
                                     bg=BG, fg="#555",
-                                    font=('Consolas',7))
+                                    font=_font('Consolas',7))
         self.eval_info_lbl.pack(side='right')
         graph_frame = tk.Frame(p, bg=BG)
         graph_frame.pack(fill='x', padx=8, pady=(2,4))
@@ -1685,12 +2329,12 @@ class TournamentHistoryWindow:
         move_lbl_row = tk.Frame(p, bg=BG)
         move_lbl_row.pack(fill='x', padx=8)
         tk.Label(move_lbl_row, text="📋 Move List",
-                bg=BG, fg="#AAA", font=('Segoe UI',8,'bold')).pack(side='left')
+                bg=BG, fg="#AAA", font=_font('Segoe UI',8,'bold')).pack(side='left')
         mf = tk.Frame(p, bg=LOG_BG, highlightthickness=1,
                     highlightbackground="#333")
         mf.pack(fill='both', expand=True, padx=8, pady=(0,8))
         self.move_box = scrolledtext.ScrolledText(
-            mf, bg=LOG_BG, fg="#DDD", font=('Consolas',8),
+            mf, bg=LOG_BG, fg="#DDD", font=_font('Consolas',8),
             state='disabled', relief='flat', padx=4, pady=4,
             wrap='word', height=5)
         self.move_box.pack(fill='both', expand=True)
@@ -1698,58 +2342,124 @@ class TournamentHistoryWindow:
         self.move_box.tag_config('b',   foreground="#CCCCCC")
         self.move_box.tag_config('n',   foreground="#555")
         self.move_box.tag_config('res', foreground=ACCENT,
-                                font=('Consolas',9,'bold'))
+                                font=_font('Consolas',9,'bold'))
         self.move_box.tag_config('op',  foreground="#00BFFF",
-                                font=('Consolas',8,'italic'))
+                                font=_font('Consolas',8,'italic'))
+
+    def _on_close(self):
+        # Stop pending work and drop per-window caches before the widgets go
+        if self._repop_after is not None:
+            self.win.after_cancel(self._repop_after)
+            self._repop_after = None
+        if self._cancel_insert:
+            self._cancel_insert()
+            self._cancel_insert = None
+        self._game_map.clear()
+        self._elo_fmt  = {}
+        self._selected_game = None
+        self.win.destroy()
+
+    def _schedule_repopulate(self, *_):
+        # Coalesce a burst of keystrokes into one rebuild
+        if self._repop_after is not None:
+            self.win.after_cancel(self._repop_after)
+        self._repop_after = self.win.after(150, self._populate_game_list)
 
     def _populate_game_list(self, *_):
+        """
+        Show the completed games that pass the filters.  Rows are pooled:
+        a game's row is inserted once and afterwards only detached or moved
+        back into place, so a filter change costs Tcl calls in proportion to
+        the rows that appear or disappear, not to the whole list.
+        """
+        self._repop_after = None
         tree = self.game_tree
-        for item in tree.get_children():
-            tree.delete(item)
-        self._game_map = {}
+        if self._cancel_insert:
+            self._cancel_insert()
+            self._cancel_insert = None
+        if self._list_hidden:
+            self._list_hidden = False
+            tree.pack(fill='both', expand=True)
 
         games  = self.t.get_all_completed_games()
         flt    = self.filter_var.get().strip().lower()
         rflt   = self.result_filter.get()
         total  = len(games)
-        rows   = []
-        game_order = []   # parallel list to rebuild _game_map after batch insert
-
-        for g in games:
-            if rflt != "All" and g.result != rflt:
+        if rflt != "All":
+            games = self.t._games_by_result.get(rflt, ())
+
+        # One case-insensitive search over names + opening per game
+        match = re.compile(re.escape(flt), re.IGNORECASE).search if flt else None
+        want  = [g for g in games
+                 if match is None or match(g._search_blob) is not None]
+        want_iids = [str(g.id) for g in want]
+
+        shown = tree.get_children()
+        keep  = set(want_iids)
+        gone  = [iid for iid in shown if iid not in keep]
+        if gone:
+            tree.detach(*gone)
+        attached = set(shown).difference(gone)
+
+        rows     = []
+        game_map = self._game_map
+        pos      = 0   # index among rows already in the tree
+        for idx, (iid, g) in enumerate(zip(want_iids, want)):
+            if iid in attached:
+                pos += 1
                 continue
-            if flt and flt not in g.white.name.lower() \
-                    and flt not in g.black.name.lower() \
-                    and flt not in (g.opening or '').lower():
+            if iid in game_map and tree.exists(iid):
+                tree.move(iid, '', pos)          # pooled row — reattach
+                pos += 1
                 continue
-            res_str     = g.result or "—"
-            opening_str = (g.opening[:22] if g.opening else "—")
-            row = [g.round_num, g.white.name, g.black.name, res_str,
-                   opening_str, g.move_count]
-            if g.result == '1-0':        tag = 'wwin'
-            elif g.result == '0-1':      tag = 'bwin'
-            elif g.result == '1/2-1/2':  tag = 'draw'
-            else:                        tag = 'other'
-            rows.append({"values": row, "tags": (tag,)})
-            game_order.append(g)
-
-        shown = len(rows)
-        self.game_count_lbl.config(text=f"{shown} / {total} games")
+            # Completed games never change, so their row is rendered once
+            row = getattr(g, '_row_cache', None)
+            if row is None:
+                row = g._row_cache = (
+                    (g.round_num, g.white.name, g.black.name, g.result or "—",
+                     (g.opening[:22] if g.opening else "—"), g.move_count),
+                    (_RESULT_TAG.get(g.result, 'other'),))
+            rows.append((row[0], row[1], iid, idx))
+            game_map[iid] = g
+
+        self.game_count_lbl.config(text=f"{len(want)} / {total} games")
+        if not rows:
+            return
+
+        # A fill spanning several chunks (or into an empty list) hides the
+        # tree so Tk skips per-row redraws; the one-row top-up after each
+        # game lands in a single pass and leaves the list on screen
+        if len(rows) > _INSERT_CHUNK or not attached:
+            self._list_hidden = True
+            tree.pack_forget()
 
         def _after_insert():
-            # Re-map tree iids → game objects once all rows are in
-            for iid, g in zip(tree.get_children(), game_order):
-                self._game_map[iid] = g
+            self._cancel_insert = None
+            if self._list_hidden:
+                self._list_hidden = False
+                tree.pack(fill='both', expand=True)
 
-        _batch_tree_insert(self.win, tree, rows, done_fn=_after_insert)
+        self._cancel_insert = _batch_tree_insert(
+            self.win, tree, rows, done_fn=_after_insert)
 
     def _on_game_select(self, event):
         sel = self.game_tree.selection()
         if not sel: return
-        game = self._game_map.get(sel[0])
+        iid = sel[0]
+        # Re-selecting the row already on show would redo the whole replay
+        if iid == self._last_loaded_iid: return
+        game = self._game_map.get(iid)
         if game:
+            self._last_loaded_iid = iid
             self._load_game(game)
 
+    def _elo_badge(self, name: str) -> tuple:
+        badge = self._elo_fmt.get(name)
+        if badge is None:
+            badge = self._elo_fmt[name] = \
+                _elo_display(_lookup_elo(self._elo_map, name))[:2]
+        return badge
+
     def _load_game(self, game: TournamentGame):
         self._selected_game = game
         self.viewer_hdr.config(
@@ -1758,10 +2468,8 @@ class TournamentHistoryWindow:
         self.vh_black.config(text=f"♚  {game.black.name}")
 
         # ── PATCH: populate Elo badges ─────────────────────────────────────────
-        w_elo_str = _fmt_elo(self._elo_map, game.white.name)
-        b_elo_str = _fmt_elo(self._elo_map, game.black.name)
-        w_elo_col = _elo_color(self._elo_map, game.white.name)
-        b_elo_col = _elo_color(self._elo_map, game.black.name)
+        w_elo_str, w_elo_col = self._elo_badge(game.white.name)
+        b_elo_str, b_elo_col = self._elo_badge(game.black.name)
         self.vh_white_elo.config(text=w_elo_str, fg=w_elo_col)
         self.vh_black_elo.config(text=b_elo_str, fg=b_elo_col)
 
@@ -1774,48 +2482,42 @@ class TournamentHistoryWindow:
         move_qualities = getattr(game, 'move_qualities', [])
         if game.move_history:
             self.mini_board.set_replay(game.move_history, game.eval_history, move_qualities)
-        if game.eval_history:
+        stats = _eval_stats(game) if game.eval_history else None
+        if stats is not None:
             self.eval_graph.set_evals(game.eval_history)
-            avg     = sum(game.eval_history) / len(game.eval_history)
-            max_adv = max(game.eval_history)
-            min_adv = min(game.eval_history)
+            avg, max_adv, min_adv = stats
             self.eval_info_lbl.config(
                 text=f"avg {avg/100:+.2f}  max {max_adv/100:+.2f}  min {min_adv/100:+.2f}")
         else:
             self.eval_graph.set_evals([])
             self.eval_info_lbl.config(text="No eval data")
 
-        self.move_box.config(state='normal')
-        self.move_box.delete('1.0', 'end')
+        with _editable(self.move_box) as box:
+            box.delete('1.0', 'end')
 
-        if game.opening:
-            self.move_box.insert('end', f"📖  {game.opening}\n\n", 'op')
+            if game.opening:
+                box.insert('end', f"📖  {game.opening}\n\n", 'op')
 
-        # Configure tags for move quality colors
-        for quality, color in QUALITY_COLORS.items():
-            self.move_box.tag_config(f'q_{quality}', foreground=color)
+            # Configure tags for move quality colors
+            for quality, color in QUALITY_COLORS.items():
+                box.tag_config(f'q_{quality}', foreground=color)
 
-        for i, (uci, san, fen) in enumerate(game.move_history):
-            ply = i + 1
-            # Get move quality if available
-            quality = move_qualities[i] if i < len(move_qualities) else None
-            quality_tag = f'q_{quality}' if quality and quality in QUALITY_COLORS else None
-            
-            if ply % 2 == 1:
-                move_num = (ply+1) // 2
-                self.move_box.insert('end', f"{move_num}. ", 'n')
-                if quality_tag:
-                    self.move_box.insert('end', san + " ", quality_tag)
-                else:
-                    self.move_box.insert('end', san + " ", 'w')
-            else:
-                if quality_tag:
-                    self.move_box.insert('end', san + "  ", quality_tag)
+            # Build (text, tag) pairs and hand them to Tk in a single insert call
+            segs = []
+            for i, (uci, san, fen) in enumerate(game.move_history):
+                ply = i + 1
+                # Get move quality if available
+                quality = move_qualities[i] if i < len(move_qualities) else None
+                quality_tag = f'q_{quality}' if quality and quality in QUALITY_COLORS else None
+
+                if ply % 2 == 1:
+                    move_num = (ply+1) // 2
+                    segs += (f"{move_num}. ", 'n', san + " ", quality_tag or 'w')
                 else:
-                    self.move_box.insert('end', san + "  ", 'b')
-        self.move_box.insert('end', f"\n  ⇒ {game.result}  {game.reason}\n", 'res')
-        self.move_box.see('1.0')
-        self.move_box.config(state='disabled')
+                    segs += (san + "  ", quality_tag or 'b')
+            segs += (f"\n  ⇒ {game.result}  {game.reason}\n", 'res')
+            box.insert('end', *segs)
+            box.see('1.0')
 
     def _export_pgn(self):
         games = self.t.get_all_completed_games()
@@ -1832,9 +2534,7 @@ class TournamentHistoryWindow:
         if not path: return
         try:
             with open(path, 'w', encoding='utf-8') as f:
-                for g in games:
-                    if g.pgn:
-                        f.write(g.pgn + "\n\n")
+                f.write("".join(g.pgn + "\n\n" for g in games if g.pgn))
             messagebox.showinfo("Export PGN",
                 f"Exported {len(games)} games to:\n{path}", parent=self.win)
         except Exception as e:
@@ -1846,10 +2546,21 @@ class TournamentHistoryWindow:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TournamentSetupDialog:
+    # Format → (rounds spinbox state, double-RR checkbox state)
+    _FMT_STATE = {
+        Tournament.FORMAT_SWISS:      ('normal',   'disabled'),
+        Tournament.FORMAT_ROUNDROBIN: ('disabled', 'normal'),
+        Tournament.FORMAT_KNOCKOUT:   ('disabled', 'disabled'),
+    }
+    _ROW_H = 38   # engine row pitch on the canvas, px
+
     def __init__(self, root, attached_analyzer=None, attached_opening_book=None):
         self.root                  = root
         self.result                = None
-        self._entries              = []
+        self._entries              = []   # (name_var, path_var) per engine slot
+        self._row_widgets          = {}   # slot index → canvas window id
+        self._fmt_state            = None
+        self._dir_cache            = {}   # dir → file names, per _confirm
         self._attached_analyzer    = attached_analyzer
         self._attached_book        = attached_opening_book
         self._build()
@@ -1898,12 +2609,12 @@ class TournamentSetupDialog:
         hdr = tk.Frame(self.dialog, bg=BG)
         hdr.pack(fill='x', padx=20, pady=(16,0))
         tk.Label(hdr, text="🏆", bg=BG, fg=ACCENT,
-                font=('Segoe UI',28)).pack(side='left', padx=(0,10))
+                font=_font('Segoe UI',28)).pack(side='left', padx=(0,10))
         tf = tk.Frame(hdr, bg=BG); tf.pack(side='left')
         tk.Label(tf, text="NEW TOURNAMENT", bg=BG, fg=ACCENT,
-                font=('Segoe UI',17,'bold')).pack(anchor='w')
+                font=_font('Segoe UI',17,'bold')).pack(anchor='w')
         tk.Label(tf, text="Configure engines, format and rounds",
-                bg=BG, fg="#666", font=('Segoe UI',9)).pack(anchor='w')
+                bg=BG, fg="#666", font=_font('Segoe UI',9)).pack(anchor='w')
         tk.Frame(self.dialog, bg=ACCENT, height=2).pack(fill='x', padx=20, pady=(10,6))
 
         cfg = tk.Frame(self.dialog, bg=BG)
@@ -1911,55 +2622,55 @@ class TournamentSetupDialog:
 
         nf = tk.Frame(cfg, bg=BG); nf.pack(side='left', padx=(0,16))
         tk.Label(nf, text="Tournament Name:", bg=BG, fg=TEXT,
-                font=('Segoe UI',9)).pack(anchor='w')
+                font=_font('Segoe UI',9)).pack(anchor='w')
         self.name_var = tk.StringVar(value=f"Tournament {datetime.now().strftime('%H:%M')}")
         tk.Entry(nf, textvariable=self.name_var, bg=LOG_BG, fg=TEXT,
-                font=('Segoe UI',9), width=22, relief='flat',
+                font=_font('Segoe UI',9), width=22, relief='flat',
                 insertbackground=TEXT).pack(ipady=4)
 
         ff = tk.Frame(cfg, bg=BG); ff.pack(side='left', padx=(0,16))
         tk.Label(ff, text="Format:", bg=BG, fg=TEXT,
-                font=('Segoe UI',9)).pack(anchor='w')
+                font=_font('Segoe UI',9)).pack(anchor='w')
         self.fmt_var = tk.StringVar(value=Tournament.FORMAT_SWISS)
         self.fmt_combo = ttk.Combobox(ff, textvariable=self.fmt_var,
                                     values=[Tournament.FORMAT_SWISS,
                                             Tournament.FORMAT_ROUNDROBIN,
                                             Tournament.FORMAT_KNOCKOUT],
                                     state='readonly', width=14,
-                                    font=('Segoe UI',9))
+                                    font=_font('Segoe UI',9))
         self.fmt_combo.pack(ipady=3)
         self.fmt_combo.bind('<<ComboboxSelected>>', self._on_fmt_change)
 
         rf = tk.Frame(cfg, bg=BG); rf.pack(side='left', padx=(0,16))
         tk.Label(rf, text="Rounds (Swiss):", bg=BG, fg=TEXT,
-                font=('Segoe UI',9)).pack(anchor='w')
+                font=_font('Segoe UI',9)).pack(anchor='w')
         self.rounds_var = tk.IntVar(value=5)
         self.rounds_spin = tk.Spinbox(rf, from_=1, to=20,
                                     textvariable=self.rounds_var,
                                     width=5, bg=LOG_BG, fg=TEXT,
                                     buttonbackground=BTN_BG,
-                                    font=('Consolas',9), relief='flat')
+                                    font=_font('Consolas',9), relief='flat')
         self.rounds_spin.pack(ipady=3)
 
         mf = tk.Frame(cfg, bg=BG); mf.pack(side='left', padx=(0,16))
         tk.Label(mf, text="Move time (ms):", bg=BG, fg=TEXT,
-                font=('Segoe UI',9)).pack(anchor='w')
+                font=_font('Segoe UI',9)).pack(anchor='w')
         self.movetime_var = tk.IntVar(value=1000)
         tk.Spinbox(mf, from_=100, to=30000, increment=100,
                 textvariable=self.movetime_var,
                 width=7, bg=LOG_BG, fg=TEXT,
                 buttonbackground=BTN_BG,
-                font=('Consolas',9), relief='flat').pack(ipady=3)
+                font=_font('Consolas',9), relief='flat').pack(ipady=3)
 
         df = tk.Frame(cfg, bg=BG); df.pack(side='left')
         tk.Label(df, text="Delay (s):", bg=BG, fg=TEXT,
-                font=('Segoe UI',9)).pack(anchor='w')
+                font=_font('Segoe UI',9)).pack(anchor='w')
         self.delay_var = tk.DoubleVar(value=0.5)
         tk.Spinbox(df, from_=0.0, to=5.0, increment=0.1, format='%.1f',
                 textvariable=self.delay_var,
                 width=5, bg=LOG_BG, fg=TEXT,
                 buttonbackground=BTN_BG,
-                font=('Consolas',9), relief='flat').pack(ipady=3)
+                font=_font('Consolas',9), relief='flat').pack(ipady=3)
 
         row2 = tk.Frame(self.dialog, bg=BG)
         row2.pack(fill='x', padx=20, pady=(0,4))
@@ -1969,7 +2680,7 @@ class TournamentSetupDialog:
             variable=self.double_rr_var,
             bg=BG, fg=TEXT, selectcolor=BTN_BG,
             activebackground=BG, activeforeground=TEXT,
-            font=('Segoe UI',9))
+            font=_font('Segoe UI',9))
         self.drr_chk.pack(side='left', padx=(0,20))
 
         res_frame = tk.Frame(self.dialog, bg=PANEL_BG,
@@ -1979,25 +2690,25 @@ class TournamentSetupDialog:
 
         tk.Label(res_frame, text="🔗  Attached from GUI  (auto-loaded at startup)",
                 bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI',9,'bold')).pack(anchor='w', padx=10, pady=(6,2))
+                font=_font('Segoe UI',9,'bold')).pack(anchor='w', padx=10, pady=(6,2))
 
         ana_row = tk.Frame(res_frame, bg=PANEL_BG)
         ana_row.pack(fill='x', padx=10, pady=(0,2))
         tk.Label(ana_row, text="🔍 Analyzer:",
                 bg=PANEL_BG, fg="#888",
-                font=('Segoe UI',8), width=16, anchor='w').pack(side='left')
+                font=_font('Segoe UI',8), width=16, anchor='w').pack(side='left')
         ana_val   = self._get_analyzer_display()
         ana_color = "#00FF80" if self._attached_analyzer else "#FF8800"
         self._ana_status_lbl = tk.Label(
             ana_row, text=ana_val,
             bg=PANEL_BG, fg=ana_color,
-            font=('Consolas', 8), anchor='w')
+            font=_font('Consolas', 8), anchor='w')
         self._ana_status_lbl.pack(side='left', fill='x', expand=True)
 
         if not self._attached_analyzer:
             self._ana_override_var = tk.StringVar()
             tk.Entry(ana_row, textvariable=self._ana_override_var,
-                    bg=LOG_BG, fg="#888", font=('Consolas',8),
+                    bg=LOG_BG, fg="#888", font=_font('Consolas',8),
                     width=28, relief='flat',
                     insertbackground=TEXT).pack(side='left', padx=4, ipady=2)
             def _browse_ana():
@@ -2010,7 +2721,7 @@ class TournamentSetupDialog:
                         text=f"✓  {os.path.basename(p)}", fg="#00FF80")
             tk.Button(ana_row, text="...", command=_browse_ana,
                     bg=BTN_BG, fg=TEXT, relief='flat',
-                    font=('Segoe UI',8), padx=5, pady=1,
+                    font=_font('Segoe UI',8), padx=5, pady=1,
                     cursor='hand2').pack(side='left', padx=2)
         else:
             self._ana_override_var = None
@@ -2019,40 +2730,35 @@ class TournamentSetupDialog:
         book_row.pack(fill='x', padx=10, pady=(0,6))
         tk.Label(book_row, text="📖 Opening Book:",
                 bg=PANEL_BG, fg="#888",
-                font=('Segoe UI',8), width=16, anchor='w').pack(side='left')
+                font=_font('Segoe UI',8), width=16, anchor='w').pack(side='left')
         book_val   = self._get_book_display()
         book_color = "#00FF80" if self._attached_book else "#FF8800"
         tk.Label(book_row, text=book_val,
                 bg=PANEL_BG, fg=book_color,
-                font=('Consolas', 8), anchor='w').pack(side='left')
+                font=_font('Consolas', 8), anchor='w').pack(side='left')
 
         tk.Frame(self.dialog, bg='#2a2a4a', height=1).pack(fill='x', padx=20, pady=4)
 
         tk.Label(self.dialog, text="Engine Participants:",
-                bg=BG, fg=ACCENT, font=('Segoe UI',10,'bold')).pack(anchor='w', padx=20)
+                bg=BG, fg=ACCENT, font=_font('Segoe UI',10,'bold')).pack(anchor='w', padx=20)
         tk.Label(self.dialog,
                 text="Add at least 2 engines (name + executable path). Seed order = list order.",
-                bg=BG, fg="#666", font=('Segoe UI',8)).pack(anchor='w', padx=20, pady=(0,4))
+                bg=BG, fg="#666", font=_font('Segoe UI',8)).pack(anchor='w', padx=20, pady=(0,4))
 
         list_outer = tk.Frame(self.dialog, bg=BG)
         list_outer.pack(fill='both', expand=True, padx=20)
-        canvas_scr = tk.Canvas(list_outer, bg=BG, highlightthickness=0)
+        # Engine rows are virtualised: slots live in self._entries as plain
+        # StringVars and only the rows inside the viewport get widgets
+        self.engine_canvas = tk.Canvas(list_outer, bg=BG, highlightthickness=0)
         scr_sb = tk.Scrollbar(list_outer, orient='vertical',
-                            command=canvas_scr.yview)
-        canvas_scr.configure(yscrollcommand=scr_sb.set)
+                            command=self.engine_canvas.yview)
+        def _on_scroll(lo, hi):
+            scr_sb.set(lo, hi)
+            self._refresh_visible_rows()
+        self.engine_canvas.configure(yscrollcommand=_on_scroll)
         scr_sb.pack(side='right', fill='y')
-        canvas_scr.pack(side='left', fill='both', expand=True)
-        self.engine_frame = tk.Frame(canvas_scr, bg=BG)
-        self._canvas_window = canvas_scr.create_window(
-            (0,0), window=self.engine_frame, anchor='nw')
-        def _cfg(e):
-            canvas_scr.configure(scrollregion=canvas_scr.bbox('all'))
-            canvas_scr.itemconfig(self._canvas_window,
-                                width=canvas_scr.winfo_width())
-        self.engine_frame.bind('<Configure>', _cfg)
-        canvas_scr.bind('<Configure>',
-            lambda e: canvas_scr.itemconfig(
-                self._canvas_window, width=e.width))
+        self.engine_canvas.pack(side='left', fill='both', expand=True)
+        self.engine_canvas.bind('<Configure>', self._on_engine_canvas_resize)
         for _ in range(4):
             self._add_engine_row()
 
@@ -2061,12 +2767,12 @@ class TournamentSetupDialog:
         tk.Button(row_btns, text="➕  Add Engine",
                 command=self._add_engine_row,
                 bg=BTN_BG, fg=TEXT, relief='flat',
-                font=('Segoe UI',9), padx=10, pady=5,
+                font=_font('Segoe UI',9), padx=10, pady=5,
                 cursor='hand2').pack(side='left', padx=(0,8))
         tk.Button(row_btns, text="➖  Remove Last",
                 command=self._remove_last,
                 bg=BTN_BG, fg=TEXT, relief='flat',
-                font=('Segoe UI',9), padx=10, pady=5,
+                font=_font('Segoe UI',9), padx=10, pady=5,
                 cursor='hand2').pack(side='left')
 
         tk.Frame(self.dialog, bg=ACCENT, height=2).pack(fill='x', padx=20, pady=(8,0))
@@ -2075,44 +2781,81 @@ class TournamentSetupDialog:
         tk.Button(foot, text="✔  Create Tournament",
                 command=self._confirm,
                 bg=ACCENT, fg='white', activebackground=BTN_HOV,
-                relief='flat', font=('Segoe UI',11,'bold'),
+                relief='flat', font=_font('Segoe UI',11,'bold'),
                 padx=16, pady=10, cursor='hand2').pack(side='left', fill='x',
                                                         expand=True, padx=(0,8))
         tk.Button(foot, text="✕  Cancel",
                 command=self.dialog.destroy,
                 bg=BTN_BG, fg=TEXT, relief='flat',
-                font=('Segoe UI',11), padx=16, pady=10,
+                font=_font('Segoe UI',11), padx=16, pady=10,
                 cursor='hand2').pack(side='left', fill='x', expand=True)
 
         self._on_fmt_change()
         self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
 
     def _on_fmt_change(self, *_):
-        fmt = self.fmt_var.get()
-        if fmt == Tournament.FORMAT_SWISS:
-            self.rounds_spin.config(state='normal')
-            self.drr_chk.config(state='disabled')
-        elif fmt == Tournament.FORMAT_ROUNDROBIN:
-            self.rounds_spin.config(state='disabled')
-            self.drr_chk.config(state='normal')
-        else:
-            self.rounds_spin.config(state='disabled')
-            self.drr_chk.config(state='disabled')
+        state = self._FMT_STATE.get(self.fmt_var.get(), ('disabled', 'disabled'))
+        if state == self._fmt_state:
+            return
+        self._fmt_state = state
+        rounds_state, drr_state = state
+        self.rounds_spin.config(state=rounds_state)
+        self.drr_chk.config(state=drr_state)
 
     def _add_engine_row(self):
         idx = len(self._entries) + 1
-        row = tk.Frame(self.engine_frame, bg=PANEL_BG,
+        self._entries.append((tk.StringVar(value=f"Engine {idx}"),
+                              tk.StringVar()))
+        self._update_engine_scrollregion()
+        self._refresh_visible_rows()
+
+    def _remove_last(self):
+        if len(self._entries) > 2:
+            self._entries.pop()
+            wid = self._row_widgets.pop(len(self._entries), None)
+            if wid is not None:
+                self._destroy_engine_row(wid)
+            self._update_engine_scrollregion()
+            self._refresh_visible_rows()
+
+    def _on_engine_canvas_resize(self, e):
+        for wid in self._row_widgets.values():
+            self.engine_canvas.itemconfig(wid, width=e.width)
+        self._refresh_visible_rows()
+
+    def _update_engine_scrollregion(self):
+        self.engine_canvas.configure(
+            scrollregion=(0, 0, 0, len(self._entries) * self._ROW_H))
+
+    def _refresh_visible_rows(self):
+        c      = self.engine_canvas
+        top    = int(c.canvasy(0))
+        height = max(c.winfo_height(), self._ROW_H)
+        first  = max(0, top // self._ROW_H - 1)
+        last   = min(len(self._entries), (top + height) // self._ROW_H + 2)
+        for i in [i for i in self._row_widgets if not first <= i < last]:
+            self._destroy_engine_row(self._row_widgets.pop(i))
+        for i in range(first, last):
+            if i not in self._row_widgets:
+                self._row_widgets[i] = self._build_engine_row(i)
+
+    def _destroy_engine_row(self, wid):
+        frame = self.engine_canvas.nametowidget(
+            self.engine_canvas.itemcget(wid, 'window'))
+        self.engine_canvas.delete(wid)
+        frame.destroy()
+
+    def _build_engine_row(self, i):
+        name_var, path_var = self._entries[i]
+        row = tk.Frame(self.engine_canvas, bg=PANEL_BG,
                         highlightthickness=1, highlightbackground="#2a2a4a")
-        row.pack(fill='x', pady=2, ipady=2)
-        tk.Label(row, text=f"{idx}.", bg=PANEL_BG, fg="#888",
-                font=('Segoe UI',9), width=3).pack(side='left', padx=(8,0))
-        name_var = tk.StringVar(value=f"Engine {idx}")
+        tk.Label(row, text=f"{i + 1}.", bg=PANEL_BG, fg="#888",
+                font=_font('Segoe UI',9), width=3).pack(side='left', padx=(8,0))
         tk.Entry(row, textvariable=name_var, bg=LOG_BG, fg=TEXT,
-                font=('Segoe UI',9), width=18, relief='flat',
+                font=_font('Segoe UI',9), width=18, relief='flat',
                 insertbackground=TEXT).pack(side='left', padx=4, ipady=4)
-        path_var = tk.StringVar()
         tk.Entry(row, textvariable=path_var, bg=LOG_BG, fg="#AAA",
-                font=('Consolas',8), relief='flat',
+                font=_font('Consolas',8), relief='flat',
                 insertbackground=TEXT).pack(side='left', fill='x',
                                             expand=True, padx=4, ipady=4)
         def _browse(pv=path_var, nv=name_var):
@@ -2126,48 +2869,63 @@ class TournamentSetupDialog:
                     nv.set(base)
         tk.Button(row, text="...", command=_browse,
                 bg=BTN_BG, fg=TEXT, relief='flat',
-                font=('Segoe UI',8), padx=6, pady=2,
+                font=_font('Segoe UI',8), padx=6, pady=2,
                 cursor='hand2').pack(side='left', padx=(0,8))
-        self._entries.append((name_var, path_var, row))
+        return self.engine_canvas.create_window(
+            0, i * self._ROW_H + 2, window=row, anchor='nw',
+            width=self.engine_canvas.winfo_width(), height=self._ROW_H - 4)
 
-    def _remove_last(self):
-        if len(self._entries) > 2:
-            _, _, row = self._entries.pop()
-            row.destroy()
+    def _isfile(self, path):
+        """
+        os.path.isfile() backed by one directory scan per folder — engines
+        usually share a folder, so this replaces a stat per engine.
+        """
+        d = os.path.dirname(os.path.abspath(path))
+        names = self._dir_cache.get(d)
+        if names is None:
+            try:
+                with os.scandir(d) as it:
+                    names = {e.name for e in it if e.is_file()}
+            except OSError:
+                names = set()
+            self._dir_cache[d] = names
+        # Misses fall back to a real stat (case-insensitive filesystems)
+        return os.path.basename(path) in names or os.path.isfile(path)
 
     def _resolve_analyzer(self):
         a = self._attached_analyzer
         if a is not None:
             if isinstance(a, str):
-                return a if os.path.isfile(a) else None
+                return a if self._isfile(a) else None
             if hasattr(a, 'path') and isinstance(a.path, str):
                 return a
             return a
         if self._ana_override_var:
             p = self._ana_override_var.get().strip()
-            if p and os.path.isfile(p):
+            if p and self._isfile(p):
                 return p
         return None
 
     def _confirm(self):
         players = []
-        seen_names = {}
-        for name_var, path_var, _ in self._entries:
-            name = name_var.get().strip()
-            path = path_var.get().strip()
-            if not name or not path: continue
-            if not os.path.isfile(path):
+        seen_names = set()
+        self._dir_cache = {}   # files may have changed since the last attempt
+        slots = [(n, p, normalize_engine_name(n).lower())
+                 for n, p in ((nv.get().strip(), pv.get().strip())
+                              for nv, pv in self._entries)
+                 if n and p]
+        for name, path, norm_name in slots:
+            if not self._isfile(path):
                 messagebox.showerror("Error",
                     f"Engine file not found:\n{path}", parent=self.dialog)
                 return
-            norm_name = normalize_engine_name(name).lower()
             if norm_name in seen_names:
                 messagebox.showerror("Duplicate Engine Name",
                     f"Duplicate engine name detected:\n\"{name}\"\n\n"
                     f"Each engine must have a unique name.",
                     parent=self.dialog)
                 return
-            seen_names[norm_name] = True
+            seen_names.add(norm_name)
             players.append(TournamentPlayer(name, path))
 
         if len(players) < 2:
@@ -2214,6 +2972,9 @@ class RosterDialog:
         self.win.minsize(540, 460)
         self.win.transient(parent)
         self.win.grab_set()
+        self._row_cache = {}   # iid → (values, tag) as last rendered
+        self._last_roster = None   # (finished, per-player fields) last shown
+        self._flash_after = None   # pending banner clear
         self._build()
         self._refresh_list()
 
@@ -2223,12 +2984,12 @@ class RosterDialog:
         hdr.pack(fill='x')
         tk.Label(hdr, text="👥  Roster Management",
                  bg=PANEL_BG, fg=ACCENT,
-                 font=('Segoe UI', 12, 'bold')).pack(side='left', padx=12, pady=8)
+                 font=_font('Segoe UI', 12, 'bold')).pack(side='left', padx=12, pady=8)
         tk.Label(hdr, text=self.t.name, bg=PANEL_BG, fg="#666",
-                 font=('Segoe UI', 9)).pack(side='left')
+                 font=_font('Segoe UI', 9)).pack(side='left')
         tk.Button(hdr, text="✕ Close", command=self.win.destroy,
                   bg=BTN_BG, fg=TEXT, relief='flat',
-                  font=('Segoe UI', 9), padx=8, pady=4,
+                  font=_font('Segoe UI', 9), padx=8, pady=4,
                   cursor='hand2').pack(side='right', padx=8, pady=6)
         tk.Frame(self.win, bg=ACCENT, height=2).pack(fill='x')
 
@@ -2245,12 +3006,12 @@ class RosterDialog:
 
         tk.Label(self.win, text=note_text,
                  bg=BG, fg=note_color,
-                 font=('Segoe UI', 8, 'italic'),
+                 font=_font('Segoe UI', 8, 'italic'),
                  wraplength=620, anchor='w').pack(fill='x', padx=12, pady=(6, 2))
 
         tk.Label(self.win, text="Current Players:",
                  bg=BG, fg=ACCENT,
-                 font=('Segoe UI', 9, 'bold')).pack(anchor='w', padx=12, pady=(6, 2))
+                 font=_font('Segoe UI', 9, 'bold')).pack(anchor='w', padx=12, pady=(6, 2))
 
         pf = tk.Frame(self.win, bg=LOG_BG, highlightthickness=1,
                       highlightbackground="#333")
@@ -2259,20 +3020,17 @@ class RosterDialog:
         sb = tk.Scrollbar(pf); sb.pack(side='right', fill='y')
         cols = ['#', 'Name', 'Engine Path', 'Score', 'W', 'D', 'L', 'Games', 'Status']
         self.tree = ttk.Treeview(pf, columns=cols, show='headings',
-                                  yscrollcommand=sb.set, height=10)
+                                  yscrollcommand=sb.set, height=10,
+                                  style=_tree_style(24))
         sb.config(command=self.tree.yview)
         wcfg = {'#': 30, 'Name': 150, 'Engine Path': 180,
                 'Score': 50, 'W': 36, 'D': 36, 'L': 36, 'Games': 50, 'Status': 90}
         for c in cols:
             self.tree.heading(c, text=c)
-            self.tree.column(c, width=wcfg.get(c, 60),
+            # Pinned widths — ttk skips column re-layout as rows are added
+            self.tree.column(c, width=wcfg.get(c, 60), minwidth=wcfg.get(c, 60),
+                             stretch=False,
                              anchor='center' if c not in ('Name', 'Engine Path') else 'w')
-        style = ttk.Style()
-        style.configure('Treeview', background=LOG_BG, foreground=TEXT,
-                        fieldbackground=LOG_BG, borderwidth=0, rowheight=24)
-        style.configure('Treeview.Heading', background=BTN_BG,
-                        foreground=TEXT, font=('Segoe UI', 8, 'bold'))
-        style.map('Treeview', background=[('selected', ACCENT)])
         self.tree.tag_configure('removable', foreground="#FF6B6B")
         self.tree.tag_configure('active',    foreground=TEXT)
         self.tree.tag_configure('locked',    foreground="#555555")
@@ -2284,34 +3042,38 @@ class RosterDialog:
             btn_row, text="🗑  Remove Selected Player",
             command=self._remove_selected,
             bg="#5A1A1A", fg="#FF8888", relief='flat',
-            font=('Segoe UI', 9), padx=10, pady=5,
+            font=_font('Segoe UI', 9), padx=10, pady=5,
             cursor='hand2')
         self.remove_btn.pack(side='left')
         tk.Label(btn_row,
                  text="  (Only players with 0 games played can be removed)",
-                 bg=BG, fg="#555", font=('Segoe UI', 7)).pack(side='left', padx=4)
+                 bg=BG, fg="#555", font=_font('Segoe UI', 7)).pack(side='left', padx=4)
+        # Inline status banner — empty (invisible) until _flash() sets it
+        self._banner_lbl = tk.Label(btn_row, text="", bg=BG,
+                                    font=_font('Segoe UI', 8, 'bold'))
+        self._banner_lbl.pack(side='right')
 
         tk.Frame(self.win, bg='#2a2a4a', height=1).pack(fill='x', padx=12, pady=(2, 4))
         tk.Label(self.win, text="Add New Player:",
                  bg=BG, fg=ACCENT,
-                 font=('Segoe UI', 9, 'bold')).pack(anchor='w', padx=12)
+                 font=_font('Segoe UI', 9, 'bold')).pack(anchor='w', padx=12)
 
         add_row = tk.Frame(self.win, bg=BG)
         add_row.pack(fill='x', padx=12, pady=(4, 2))
 
         tk.Label(add_row, text="Name:", bg=BG, fg=TEXT,
-                 font=('Segoe UI', 8)).pack(side='left')
+                 font=_font('Segoe UI', 8)).pack(side='left')
         self.new_name_var = tk.StringVar()
         tk.Entry(add_row, textvariable=self.new_name_var,
-                 bg=LOG_BG, fg=TEXT, font=('Segoe UI', 8),
+                 bg=LOG_BG, fg=TEXT, font=_font('Segoe UI', 8),
                  width=18, relief='flat',
                  insertbackground=TEXT).pack(side='left', padx=(4, 12), ipady=3)
 
         tk.Label(add_row, text="Engine:", bg=BG, fg=TEXT,
-                 font=('Segoe UI', 8)).pack(side='left')
+                 font=_font('Segoe UI', 8)).pack(side='left')
         self.new_path_var = tk.StringVar()
         tk.Entry(add_row, textvariable=self.new_path_var,
-                 bg=LOG_BG, fg="#AAA", font=('Consolas', 7),
+                 bg=LOG_BG, fg="#AAA", font=_font('Consolas', 7),
                  relief='flat', insertbackground=TEXT
                  ).pack(side='left', fill='x', expand=True, padx=4, ipady=3)
 
@@ -2327,7 +3089,7 @@ class RosterDialog:
 
         tk.Button(add_row, text="...", command=_browse,
                   bg=BTN_BG, fg=TEXT, relief='flat',
-                  font=('Segoe UI', 8), padx=6, pady=2,
+                  font=_font('Segoe UI', 8), padx=6, pady=2,
                   cursor='hand2').pack(side='left', padx=(0, 8))
 
         add_btn_row = tk.Frame(self.win, bg=BG)
@@ -2336,7 +3098,7 @@ class RosterDialog:
             add_btn_row, text="➕  Add Player to Tournament",
             command=self._add_player,
             bg=BTN_BG, fg=TEXT, relief='flat',
-            font=('Segoe UI', 9), padx=12, pady=5,
+            font=_font('Segoe UI', 9), padx=12, pady=5,
             cursor='hand2')
         self.add_btn.pack(side='left')
 
@@ -2345,13 +3107,29 @@ class RosterDialog:
             self.add_btn.config(state='disabled')
 
     def _refresh_list(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Nothing shown changed since the last render → skip the diff pass
+        t = self.t
+        roster = (t.finished, tuple(
+            (p, p.name, p._path_display, p.score,
+             p.wins, p.draws, p.losses) for p in t.player_list))
+        if roster == self._last_roster:
+            return
+        self._last_roster = roster
+
+        # Diff against the last render: only rows whose values changed are
+        # touched, removed players are deleted and new ones inserted.  All
+        # rows are detached while mutating so the tree lays out once, on
+        # the final set_children in roster order (a single Tcl call).
+        tree  = self.tree
+        cache = self._row_cache
+        seen  = set()
+        order = []
+        children = tree.get_children()
+        if children:
+            tree.detach(*children)
         for i, p in enumerate(self.t.player_list, 1):
             can_remove = p.games_played == 0
-            path_display = p.engine_path if p.engine_path else "—"
-            if len(path_display) > 38:
-                path_display = "…" + path_display[-36:]
+            path_display = p._path_display
             if self.t.finished:
                 tag = 'locked'
             elif can_remove:
@@ -2363,23 +3141,45 @@ class RosterDialog:
                 else "🔒 has games" if not self.t.finished
                 else "🔒 locked"
             )
-            self.tree.insert('', 'end', values=[
-                i, p.name, path_display,
-                f"{p.score:.1f}", p.wins, p.draws, p.losses,
-                p.games_played, status_str
-            ], tags=(tag,))
+            values = (i, p.name, path_display,
+                      f"{p.score:.1f}", p.wins, p.draws, p.losses,
+                      p.games_played, status_str)
+            iid = f"p{id(p)}"
+            seen.add(iid)
+            order.append(iid)
+            old = cache.get(iid)
+            if old is None:
+                tree.insert('', 'end', iid=iid, values=values, tags=(tag,))
+            elif old != (values, tag):
+                tree.item(iid, values=values, tags=(tag,))
+            cache[iid] = (values, tag)
+        gone = [iid for iid in cache if iid not in seen]
+        if gone:
+            tree.delete(*gone)
+            for iid in gone:
+                del cache[iid]
+        tree.set_children('', *order)
+
+    def _flash(self, msg, color):
+        """Show *msg* in the inline banner for a few seconds, non-modally."""
+        if self._flash_after is not None:
+            self.win.after_cancel(self._flash_after)
+        self._banner_lbl.config(text=msg, fg=color)
+        self._flash_after = self.win.after(2500, self._clear_flash)
+
+    def _clear_flash(self):
+        self._flash_after = None
+        if self.win.winfo_exists():
+            self._banner_lbl.config(text="")
 
     def _remove_selected(self):
         if self.t.finished:
-            messagebox.showwarning("Locked",
-                "Tournament is finished — roster cannot be changed.",
-                parent=self.win)
+            self._flash("🔒 Tournament finished — roster locked", "#FF8800")
             return
 
         sel = self.tree.selection()
         if not sel:
-            messagebox.showinfo("No selection",
-                "Please select a player to remove.", parent=self.win)
+            self._flash("Select a player to remove", "#FF8800")
             return
 
         vals    = self.tree.item(sel[0])['values']
@@ -2387,10 +3187,7 @@ class RosterDialog:
         p_games = int(vals[7])
 
         if p_games > 0:
-            messagebox.showerror("Cannot Remove",
-                f'"{p_name}" has already played {p_games} game(s).\n\n'
-                "Only players with 0 games played can be removed.",
-                parent=self.win)
+            self._flash(f'✕ "{p_name}" has played {p_games} game(s)', "#FF6B6B")
             return
 
         confirm = messagebox.askyesno(
@@ -2405,57 +3202,47 @@ class RosterDialog:
         if player_obj:
             self.t.player_list.remove(player_obj)
             del self.t.players[player_obj.name]
-            if player_obj in self.t._ko_active_players:
-                self.t._ko_active_players.remove(player_obj)
-            if player_obj in self.t._ko_pending_winners:
-                self.t._ko_pending_winners.remove(player_obj)
+            self.t._norm_name_set.discard(
+                normalize_engine_name(player_obj.name).lower())
+            self.t._ko_active_players.pop(player_obj.name, None)
+            self.t._ko_pending_winners.pop(player_obj.name, None)
 
         self._refresh_list()
         if self.on_change:
             self.on_change()
 
-        messagebox.showinfo("Removed",
-            f'"{p_name}" has been removed from the tournament.',
-            parent=self.win)
+        self._flash(f'✓ Removed "{p_name}"', "#00FF80")
 
     def _add_player(self):
         if self.t.finished:
-            messagebox.showwarning("Locked",
-                "Tournament is finished — roster cannot be changed.",
-                parent=self.win)
+            self._flash("🔒 Tournament finished — roster locked", "#FF8800")
             return
 
         name = self.new_name_var.get().strip()
         path = self.new_path_var.get().strip()
 
         if not name:
-            messagebox.showerror("Missing Name",
-                "Please enter a name for the engine.", parent=self.win)
+            self._flash("✕ Enter a name for the engine", "#FF6B6B")
             return
         if not path:
-            messagebox.showerror("Missing Path",
-                "Please select the engine executable.", parent=self.win)
+            self._flash("✕ Select the engine executable", "#FF6B6B")
             return
         if not os.path.isfile(path):
-            messagebox.showerror("File Not Found",
-                f"Engine file not found:\n{path}", parent=self.win)
+            self._flash("✕ Engine file not found", "#FF6B6B")
             return
 
         norm_name = normalize_engine_name(name).lower()
-        for p in self.t.player_list:
-            if normalize_engine_name(p.name).lower() == norm_name:
-                messagebox.showerror("Duplicate Name",
-                    f'A player named "{name}" already exists in this tournament.\n\n'
-                    "Each player must have a unique name.",
-                    parent=self.win)
-                return
+        if norm_name in self.t._norm_name_set:
+            self._flash(f'✕ "{name}" is already in this tournament', "#FF6B6B")
+            return
 
         new_player = TournamentPlayer(name, path)
         new_player.seed = len(self.t.player_list) + 1
         self.t.player_list.append(new_player)
         self.t.players[new_player.name] = new_player
+        self.t._norm_name_set.add(norm_name)
         if self.t.format == Tournament.FORMAT_KNOCKOUT:
-            self.t._ko_active_players.append(new_player)
+            self.t._ko_active_players[new_player.name] = new_player
 
         self.new_name_var.set("")
         self.new_path_var.set("")
@@ -2464,23 +3251,42 @@ class RosterDialog:
         if self.on_change:
             self.on_change()
 
-        messagebox.showinfo("Player Added",
-            f'"{new_player.name}" has been added to the tournament.\n\n'
-            "They will be included in future round pairings.",
-            parent=self.win)
+        self._flash(f'✓ Added "{new_player.name}"', "#00FF80")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Main Tournament Window
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Player fields shown in a standings row, fetched in one C-level call
+_STANDING_FIELDS = attrgetter('name', 'score', 'wins', 'draws', 'losses',
+                              'games_played', 'buchholz', 'sonneborn')
+
+# Podium colour tag for players without an Elo rating
+_PLACE_TAGS = {1: 'gold', 2: 'silver', 3: 'bronze'}
+
+# Schedule row tags keyed by (status, result); anything else is 'pending'.
+# A running game has no result yet, so one key covers it.
+_SCHEDULE_TAGS = {
+    ('running', None):      ('running',),
+    ('done', '1-0'):        ('done_w',),
+    ('done', '0-1'):        ('done_b',),
+    ('done', '1/2-1/2'):    ('done_draw',),
+}
+_PENDING_TAGS = ('pending',)
+
+
 class TournamentWindow:
+    REFRESH_DELAY_MS = 50
+    MOVE_LOG_PLIES   = 400   # live move log keeps only the latest plies
+    DB_COMMIT_MS     = 500   # saved games are committed within this time
+
     def __init__(self, root, tournament: Tournament, db=None, db_path=None):
         self.root         = root
         self.t            = tournament
         self.runner       = None
         self.current_game: TournamentGame = None
-        self._history_win = None
+        self._history_win_ref = None   # weakref to the open history viewer
 
         if db is not None:
             self.db = db
@@ -2491,8 +3297,38 @@ class TournamentWindow:
 
         self.db_path = db_path or (db.db_path if db is not None else None)
 
+        # Game saves run on one background writer so disk I/O never blocks
+        # Tk; its connection lives on (and only on) that thread
+        self._db_exec = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="tdb")
+        self._db_conn = None
+        self._db_commit_after = None   # pending batched commit
+
         # Elo map starts empty; loaded async after window opens
         self._elo_map: dict = {}
+        # name → (elo, badge text, colour, tier label, tier tag)
+        self._elo_resolved: dict = {}
+        self._elo_fetch_inflight = False   # a background Elo fetch is running
+        self._elo_fetch_pending  = False   # another was requested meanwhile
+
+        # Refresh requests coalesced into one delayed pass
+        self._pending_refreshes: set = set()
+        self._refresh_tick_id        = None
+        self._stale_tabs: set        = set()   # skipped while tab was hidden
+        self._tab_names: dict        = {}      # tab widget path → tab name
+        self._schedule_row_cache: dict = {}   # id(game) → (state sig, row)
+        self._history_rows: list = []   # history tab rows, newest first
+        self._history_built      = 0    # completed games already in it
+        # Bracket canvas items by (round, slot) / round header
+        self._bracket_items: dict    = {}
+        self._bracket_headers: dict  = {}
+        self._bracket_tick_id        = None
+        # Extra runner-event listeners (e.g. the tournament list); each is
+        # called with the same argument as the matching _cb_* method
+        self._game_start_observers: list      = []
+        self._game_end_observers: list        = []
+        self._round_end_observers: list       = []
+        self._tournament_end_observers: list  = []
 
         self.win = tk.Toplevel(root)
         self.win.title(f"🏆 Tournament — {tournament.name}")
@@ -2501,7 +3337,10 @@ class TournamentWindow:
         self.win.resizable(True, True)
         self.win.minsize(980, 700)
         self.win.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Also reached when the app exits through the root window
+        self.win.bind('<Destroy>', self._on_destroy)
 
+        _init_ttk_styles()
         self._build_ui()
         self._refresh_standings()
 
@@ -2548,34 +3387,34 @@ class TournamentWindow:
                     highlightthickness=1, highlightbackground="#333")
         tb.pack(fill='x', padx=6, pady=(6,0))
         tk.Label(tb, text="🏆", bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI',18)).pack(side='left', padx=(10,4))
+                font=_font('Segoe UI',18)).pack(side='left', padx=(10,4))
         tk.Label(tb, text=self.t.name, bg=PANEL_BG, fg=TEXT,
-                font=('Segoe UI',12,'bold')).pack(side='left')
+                font=_font('Segoe UI',12,'bold')).pack(side='left')
         fmtcol = {"Swiss":"#00BFFF","Round Robin":"#7FFF00",
                 "Knockout":"#FF6B6B"}.get(self.t.format, ACCENT)
         tk.Label(tb, text=f" ·  {self.t.format}",
                 bg=PANEL_BG, fg=fmtcol,
-                font=('Segoe UI',10,'bold')).pack(side='left')
+                font=_font('Segoe UI',10,'bold')).pack(side='left')
 
         if self.t.opening_book:
             tk.Label(tb, text="📖", bg=PANEL_BG, fg="#00FF80",
-                    font=('Segoe UI',10)).pack(side='left', padx=(6,0))
+                    font=_font('Segoe UI',10)).pack(side='left', padx=(6,0))
         if self.t.analyzer_path:
             tk.Label(tb, text="🔍", bg=PANEL_BG, fg="#00BFFF",
-                    font=('Segoe UI',10)).pack(side='left', padx=(2,0))
+                    font=_font('Segoe UI',10)).pack(side='left', padx=(2,0))
         if self.db:
             tk.Label(tb, text="💾", bg=PANEL_BG, fg="#AAFFAA",
-                    font=('Segoe UI',10)).pack(side='left', padx=(2,0))
+                    font=_font('Segoe UI',10)).pack(side='left', padx=(2,0))
 
         tk.Label(tb, text=f"  {len(self.t.player_list)} players  ·  "
                         f"{self.t.rounds} rounds  ·  "
                         f"{self.t.movetime_ms}ms",
                 bg=PANEL_BG, fg="#555",
-                font=('Segoe UI',8)).pack(side='left', padx=8)
+                font=_font('Segoe UI',8)).pack(side='left', padx=8)
         self.status_var = tk.StringVar(value="")
         tk.Label(tb, textvariable=self.status_var,
                 bg=PANEL_BG, fg="#00FF80",
-                font=('Consolas',9)).pack(side='left', padx=8)
+                font=_font('Consolas',9)).pack(side='left', padx=8)
 
         for txt, cmd, acc in [
             ("▶ Start",      self._start,          True),
@@ -2589,14 +3428,15 @@ class TournamentWindow:
             tk.Button(tb, text=txt, command=cmd,
                     bg=bg, fg=TEXT, activebackground=BTN_HOV,
                     relief='flat',
-                    font=('Segoe UI',9,'bold' if acc else 'normal'),
+                    font=(_font('Segoe UI',9,'bold') if acc
+                          else _font('Segoe UI',9)),
                     padx=10, pady=6, cursor='hand2'
                     ).pack(side='right', padx=3, pady=4)
 
     def _build_left(self, p):
         self.game_hdr = tk.Label(p, text="No game running",
                                 bg=BG, fg=ACCENT,
-                                font=('Segoe UI',11,'bold'),
+                                font=_font('Segoe UI',11,'bold'),
                                 anchor='center', pady=6)
         self.game_hdr.pack(fill='x', padx=6, pady=(4,2))
 
@@ -2610,17 +3450,17 @@ class TournamentWindow:
         white_col.pack(side='left', fill='x', expand=True, padx=(0,4))
         self.white_lbl = tk.Label(white_col, text="♔ —",
                                   bg="#1c2a1c", fg="#FFD700",
-                                  font=('Segoe UI',10,'bold'),
+                                  font=_font('Segoe UI',10,'bold'),
                                   anchor='center', pady=4)
         self.white_lbl.pack(fill='x')
         self.white_elo_lbl = tk.Label(white_col, text="",
                                       bg="#1c2a1c", fg="#888",
-                                      font=('Consolas', 7),
+                                      font=_font('Consolas', 7),
                                       anchor='center', pady=1)
         self.white_elo_lbl.pack(fill='x')
 
         tk.Label(players_row, text="vs", bg=BG, fg="#555",
-                font=('Segoe UI',9)).pack(side='left')
+                font=_font('Segoe UI',9)).pack(side='left')
 
         # ── PATCH: black side with Elo sub-label ─────────────────────────────
         black_col = tk.Frame(players_row, bg="#1a1a2a",
@@ -2629,18 +3469,18 @@ class TournamentWindow:
         black_col.pack(side='right', fill='x', expand=True, padx=(4,0))
         self.black_lbl = tk.Label(black_col, text="♚ —",
                                   bg="#1a1a2a", fg="#C8C8C8",
-                                  font=('Segoe UI',10,'bold'),
+                                  font=_font('Segoe UI',10,'bold'),
                                   anchor='center', pady=4)
         self.black_lbl.pack(fill='x')
         self.black_elo_lbl = tk.Label(black_col, text="",
                                       bg="#1a1a2a", fg="#888",
-                                      font=('Consolas', 7),
+                                      font=_font('Consolas', 7),
                                       anchor='center', pady=1)
         self.black_elo_lbl.pack(fill='x')
 
         self.opening_lbl = tk.Label(p, text="",
                                     bg=BG, fg="#00BFFF",
-                                    font=('Segoe UI', 8, 'italic'),
+                                    font=_font('Segoe UI', 8, 'italic'),
                                     anchor='center', pady=2)
         self.opening_lbl.pack(fill='x', padx=6)
 
@@ -2650,20 +3490,19 @@ class TournamentWindow:
         self.mini_board.pack()
         tk.Frame(p, bg='#2a2a4a', height=1).pack(fill='x', padx=6, pady=(4,2))
         tk.Label(p, text="📈 Live Eval", bg=BG, fg="#AAA",
-                font=('Segoe UI',8,'bold')).pack(anchor='w', padx=8)
+                font=_font('Segoe UI',8,'bold')).pack(anchor='w', padx=8)
         eval_graph_frame = tk.Frame(p, bg=BG)
         eval_graph_frame.pack(fill='x', padx=6, pady=(0,4))
         self.live_eval_graph = EvalGraphWidget(eval_graph_frame, width=440, height=70)
         self.live_eval_graph.pack(fill='x')
-        self._live_evals = []
         tk.Frame(p, bg='#2a2a4a', height=1).pack(fill='x', padx=6, pady=2)
         tk.Label(p, text="Move Log:", bg=BG, fg="#AAA",
-                font=('Segoe UI',8,'bold')).pack(anchor='w', padx=8)
+                font=_font('Segoe UI',8,'bold')).pack(anchor='w', padx=8)
         mf = tk.Frame(p, bg=LOG_BG, highlightthickness=1,
                     highlightbackground="#333")
         mf.pack(fill='both', expand=True, padx=6, pady=(0,4))
         self.move_log = scrolledtext.ScrolledText(
-            mf, bg=LOG_BG, fg="#DDD", font=('Consolas',8),
+            mf, bg=LOG_BG, fg="#DDD", font=_font('Consolas',8),
             state='disabled', relief='flat', padx=4, pady=4,
             wrap='word', height=6)
         self.move_log.pack(fill='both', expand=True)
@@ -2671,21 +3510,14 @@ class TournamentWindow:
         self.move_log.tag_config('b',    foreground="#CCCCCC")
         self.move_log.tag_config('n',    foreground="#555")
         self.move_log.tag_config('res',  foreground=ACCENT,
-                                font=('Consolas',9,'bold'))
+                                font=_font('Consolas',9,'bold'))
         self.move_log.tag_config('book', foreground="#00FF80",
-                                font=('Consolas',8,'italic'))
+                                font=_font('Consolas',8,'italic'))
+        self._reset_move_ring()
 
     def _build_right(self, p):
-        nb = ttk.Notebook(p)
+        nb = ttk.Notebook(p, style='Tournament.TNotebook')
         nb.pack(fill='both', expand=True, padx=4, pady=4)
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TNotebook', background=PANEL_BG, borderwidth=0)
-        style.configure('TNotebook.Tab', background=BTN_BG, foreground=TEXT,
-                        padding=[10,4], font=('Segoe UI',9))
-        style.map('TNotebook.Tab',
-                background=[('selected',ACCENT)],
-                foreground=[('selected','white')])
         self.tab_standings = tk.Frame(nb, bg=PANEL_BG)
         self.tab_schedule  = tk.Frame(nb, bg=PANEL_BG)
         self.tab_history   = tk.Frame(nb, bg=PANEL_BG)
@@ -2700,13 +3532,33 @@ class TournamentWindow:
         self._build_history_tab(self.tab_history)
         if self.t.format == Tournament.FORMAT_KNOCKOUT:
             self._build_bracket_tab(self.tab_bracket)
+        self.notebook   = nb
+        self._tab_names = {str(self.tab_standings): 'standings',
+                           str(self.tab_schedule):  'schedule',
+                           str(self.tab_history):   'history',
+                           str(self.tab_bracket):   'bracket'}
+        nb.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+    def _visible_tab(self):
+        return self._tab_names.get(str(self.notebook.select()))
+
+    def _on_tab_changed(self, _event=None):
+        # Catch up on whatever the newly shown tab missed while hidden
+        name = self._visible_tab()
+        if name not in self._stale_tabs:
+            return
+        self._stale_tabs.discard(name)
+        if name == 'bracket':
+            self._schedule_bracket()
+        else:
+            self._schedule_refresh(name)
 
     def _build_standings_tab(self, p):
         tk.Label(p, text="📊 Current Standings",
                 bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
+                font=_font('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
         self.round_info_lbl = tk.Label(p, text="", bg=PANEL_BG, fg="#00BFFF",
-                                        font=('Segoe UI',9))
+                                        font=_font('Segoe UI',9))
         self.round_info_lbl.pack(anchor='w', padx=8, pady=(0,4))
         tf = tk.Frame(p, bg=PANEL_BG)
         tf.pack(fill='both', expand=True, padx=8, pady=(0,8))
@@ -2718,24 +3570,15 @@ class TournamentWindow:
             cols += ['BH','SB']
 
         self.standings_tree = ttk.Treeview(
-            tf, columns=cols, show='headings', yscrollcommand=sb.set)
+            tf, columns=cols, show='headings', yscrollcommand=sb.set,
+            style=_tree_style(26))
         sb.config(command=self.standings_tree.yview)
 
         widths = {'#':30,'Engine':150,'Elo':60,'Score':50,'W':40,'D':40,'L':40,
                   'Pts':45,'BH':50,'SB':50}
-        for c in cols:
-            self.standings_tree.heading(c, text=c)
-            self.standings_tree.column(
-                c, width=widths.get(c,50),
-                anchor='center' if c!='Engine' else 'w')
-
-        style = ttk.Style()
-        style.configure('Treeview', background=LOG_BG, foreground=TEXT,
-                        fieldbackground=LOG_BG, borderwidth=0, rowheight=26)
-        style.configure('Treeview.Heading', background=BTN_BG,
-                        foreground=TEXT, borderwidth=1,
-                        font=('Segoe UI',8,'bold'))
-        style.map('Treeview', background=[('selected',ACCENT)])
+        _setup_columns(self.standings_tree, cols, widths,
+                       left_cols=('Engine',), default_width=50)
+
         self.standings_tree.tag_configure('gold',   foreground="#FFD700")
         self.standings_tree.tag_configure('silver', foreground="#C0C0C0")
         self.standings_tree.tag_configure('bronze', foreground="#CD7F32")
@@ -2743,29 +3586,28 @@ class TournamentWindow:
         self.standings_tree.tag_configure('active', background="#1A2A1A")
 
         # ── PATCH: per-tier colour tags for Elo column ───────────────────────
-        for _, _, colour in RANK_TIERS:
-            self.standings_tree.tag_configure(f'tier_{colour}', foreground=colour)
+        for tag, (_, _, colour) in zip(_TIER_TAGS, _TIER_ASC):
+            self.standings_tree.tag_configure(tag, foreground=colour)
 
         self.standings_tree.pack(fill='both', expand=True)
 
     def _build_schedule_tab(self, p):
         tk.Label(p, text="📋 Round Schedule",
                 bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
+                font=_font('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
         tf = tk.Frame(p, bg=PANEL_BG)
         tf.pack(fill='both', expand=True, padx=8, pady=(0,8))
         sb = tk.Scrollbar(tf); sb.pack(side='right', fill='y')
         cols = ['Rnd','#','White','Black','Result','Opening','Moves']
         self.schedule_tree = ttk.Treeview(
-            tf, columns=cols, show='headings', yscrollcommand=sb.set)
-        sb.config(command=self.schedule_tree.yview)
+            tf, columns=cols, show='headings',
+            style=_tree_style(26))
+        self._schedule_vt = _VirtualTree(self.schedule_tree, sb, rowheight=26,
+                                         key=lambda r: (r[0][0], r[0][1]))
         wcfg = {'Rnd':40,'#':30,'White':130,'Black':130,
                 'Result':55,'Opening':130,'Moves':50}
-        for c in cols:
-            self.schedule_tree.heading(c, text=c)
-            self.schedule_tree.column(
-                c, width=wcfg.get(c,80),
-                anchor='center' if c not in ('White','Black','Opening') else 'w')
+        _setup_columns(self.schedule_tree, cols, wcfg,
+                       left_cols=('White','Black','Opening'))
         self.schedule_tree.tag_configure('done_w',    foreground="#FFD700")
         self.schedule_tree.tag_configure('done_b',    foreground="#C8C8C8")
         self.schedule_tree.tag_configure('done_draw', foreground="#00BFFF")
@@ -2778,24 +3620,23 @@ class TournamentWindow:
     def _build_history_tab(self, p):
         tk.Label(p, text="📜 Completed Games",
                 bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
+                font=_font('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
         tk.Label(p, text="Double-click to replay  ·  Click '📜 History' for full viewer",
                 bg=PANEL_BG, fg="#444",
-                font=('Segoe UI',7)).pack(anchor='w', padx=8, pady=(0,4))
+                font=_font('Segoe UI',7)).pack(anchor='w', padx=8, pady=(0,4))
         tf = tk.Frame(p, bg=PANEL_BG)
         tf.pack(fill='both', expand=True, padx=8, pady=(0,8))
         sb = tk.Scrollbar(tf); sb.pack(side='right', fill='y')
         cols = ['Rnd','White','Black','Result','Opening','Moves','Time']
         self.history_tree = ttk.Treeview(
-            tf, columns=cols, show='headings', yscrollcommand=sb.set)
-        sb.config(command=self.history_tree.yview)
+            tf, columns=cols, show='headings',
+            style=_tree_style(26))
+        self._history_vt = _VirtualTree(self.history_tree, sb, rowheight=26,
+                                        key=lambda r: tuple(r[0][:3]))
         hcfg = {'Rnd':40,'White':110,'Black':110,'Result':55,
                 'Opening':130,'Moves':50,'Time':55}
-        for c in cols:
-            self.history_tree.heading(c, text=c)
-            self.history_tree.column(
-                c, width=hcfg.get(c,80),
-                anchor='center' if c not in ('White','Black','Opening') else 'w')
+        _setup_columns(self.history_tree, cols, hcfg,
+                       left_cols=('White','Black','Opening'))
         self.history_tree.tag_configure('wwin',  foreground="#FFD700")
         self.history_tree.tag_configure('bwin',  foreground="#C8C8C8")
         self.history_tree.tag_configure('draw',  foreground="#00BFFF")
@@ -2805,7 +3646,7 @@ class TournamentWindow:
     def _build_bracket_tab(self, p):
         tk.Label(p, text="🎯 Knockout Bracket",
                 bg=PANEL_BG, fg=ACCENT,
-                font=('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
+                font=_font('Segoe UI',10,'bold')).pack(anchor='w', padx=8, pady=(8,4))
         bframe = tk.Frame(p, bg=LOG_BG, highlightthickness=1,
                         highlightbackground="#333")
         bframe.pack(fill='both', expand=True, padx=8, pady=(0,8))
@@ -2819,10 +3660,23 @@ class TournamentWindow:
         sb_y.pack(side='right',  fill='y')
         self.bracket_canvas.pack(fill='both', expand=True)
 
+    def _schedule_bracket(self):
+        """Coalesce bracket redraws into one pass on the next idle cycle."""
+        if self._visible_tab() != 'bracket':
+            self._stale_tabs.add('bracket')
+            return
+        if self._bracket_tick_id is None:
+            self._bracket_tick_id = self.win.after_idle(self._draw_bracket)
+
     def _draw_bracket(self):
+        # Canvas items are kept per (round, slot) and only reconfigured when
+        # the text/colours they show change; new games get new items.
+        self._bracket_tick_id = None
         c = self.bracket_canvas
-        c.delete('all')
         if self.t.format != Tournament.FORMAT_KNOCKOUT:
+            c.delete('all')
+            self._bracket_items.clear()
+            self._bracket_headers.clear()
             return
         rounds_data = self.t._ko_round_games
         if not rounds_data:
@@ -2832,19 +3686,28 @@ class TournamentWindow:
         col_w = 210
         pad   = 24
         row_h = 64
+        items   = self._bracket_items
+        headers = self._bracket_headers
+        live    = set()
+        created = False
 
         for rnd in range(1, n_rounds + 1):
             games = rounds_data.get(rnd, [])
             x = pad + (rnd - 1) * col_w
 
-            c.create_text(x + col_w // 2, pad // 2 + 4,
-                          text=f"Round {rnd}  ({len(games)} games)",
-                          fill=ACCENT, font=('Segoe UI', 9, 'bold'))
+            htext = f"Round {rnd}  ({len(games)} games)"
+            hdr   = headers.get(rnd)
+            if hdr is None:
+                headers[rnd] = (c.create_text(
+                    x + col_w // 2, pad // 2 + 4, text=htext,
+                    fill=ACCENT, font=_font('Segoe UI', 9, 'bold')), htext)
+                created = True
+            elif hdr[1] != htext:
+                c.itemconfigure(hdr[0], text=htext)
+                headers[rnd] = (hdr[0], htext)
 
             for i, g in enumerate(games):
                 y = pad + 20 + i * row_h * 2
-                c.create_rectangle(x + 8, y + 4, x + col_w - 8, y + row_h - 4,
-                                   fill=PANEL_BG, outline="#444")
                 wname = g.white.name[:20]
                 bname = g.black.name[:20]
                 wc = "#FFD700"
@@ -2855,42 +3718,73 @@ class TournamentWindow:
                     bc = "#00FF80"
                 elif g.result == '1/2-1/2':
                     wc = bc = "#00BFFF"
-                c.create_text(x + 14, y + 20, text=f"♔ {wname}",
-                              fill=wc, font=('Consolas', 8), anchor='w')
-                c.create_text(x + 14, y + 38, text=f"♚ {bname}",
-                              fill=bc, font=('Consolas', 8), anchor='w')
                 res_txt = g.result or ("▶" if g.status == 'running' else "…")
-                c.create_text(x + col_w - 12, y + 29, text=res_txt,
-                              fill=ACCENT, font=('Consolas', 8, 'bold'), anchor='e')
-
-                if rnd < n_rounds:
+                sig  = (wname, bname, wc, bc, res_txt)
+                key  = (rnd, i)
+                live.add(key)
+                slot = items.get(key)
+                if slot is None:
+                    slot = items[key] = {
+                        'rect':  c.create_rectangle(
+                                     x + 8, y + 4, x + col_w - 8, y + row_h - 4,
+                                     fill=PANEL_BG, outline="#444"),
+                        'wtext': c.create_text(
+                                     x + 14, y + 20, text=f"♔ {wname}", fill=wc,
+                                     font=_font('Consolas', 8), anchor='w'),
+                        'btext': c.create_text(
+                                     x + 14, y + 38, text=f"♚ {bname}", fill=bc,
+                                     font=_font('Consolas', 8), anchor='w'),
+                        'res':   c.create_text(
+                                     x + col_w - 12, y + 29, text=res_txt,
+                                     fill=ACCENT, font=_font('Consolas', 8, 'bold'),
+                                     anchor='e'),
+                        'line':  None,
+                        'sig':   sig,
+                    }
+                    created = True
+                elif slot['sig'] != sig:
+                    c.itemconfigure(slot['wtext'], text=f"♔ {wname}", fill=wc)
+                    c.itemconfigure(slot['btext'], text=f"♚ {bname}", fill=bc)
+                    c.itemconfigure(slot['res'],   text=res_txt)
+                    slot['sig'] = sig
+
+                # Connector appears once a later round exists
+                if rnd < n_rounds and slot['line'] is None:
                     mid_y = y + row_h // 2
                     next_x = x + col_w - 8
-                    c.create_line(next_x, mid_y, next_x + 16, mid_y,
-                                  fill="#444", width=1)
+                    slot['line'] = c.create_line(next_x, mid_y, next_x + 16, mid_y,
+                                                 fill="#444", width=1)
+                    created = True
 
-        c.configure(scrollregion=c.bbox('all'))
+        for key in [k for k in items if k not in live]:
+            slot = items.pop(key)
+            c.delete(slot['rect'], slot['wtext'], slot['btext'], slot['res'])
+            if slot['line'] is not None:
+                c.delete(slot['line'])
+        for rnd in [r for r in headers if r > n_rounds]:
+            c.delete(headers.pop(rnd)[0])
+
+        if created:
+            c.configure(scrollregion=c.bbox('all'))
 
     # ── Event handlers ────────────────────────────────────────────────────────
 
     def _on_schedule_dbl(self, event):
-        sel = self.schedule_tree.selection()
-        if not sel: return
-        vals = self.schedule_tree.item(sel[0])['values']
-        rnd, seq = int(vals[0]), int(vals[1])
-        rnd_games = [x for x in self.t.all_games if x.round_num == rnd]
+        row = self._schedule_vt.selected_row()
+        if row is None: return
+        vals = row[0]
+        rnd_games = self.t._games_by_round.get(int(vals[0]), [])
+        seq = int(vals[1])
         if 0 <= seq - 1 < len(rnd_games):
             self._replay_game(rnd_games[seq - 1])
 
     def _on_history_dbl(self, event):
-        sel = self.history_tree.selection()
-        if not sel: return
-        vals = self.history_tree.item(sel[0])['values']
-        rnd, wname, bname = int(vals[0]), vals[1], vals[2]
-        for g in self.t.get_all_completed_games():
-            if g.round_num == rnd and g.white.name == wname and g.black.name == bname:
-                self._replay_game(g)
-                return
+        row = self._history_vt.selected_row()
+        if row is None: return
+        vals = row[0]
+        g = self.t._game_by_key.get((int(vals[0]), str(vals[1]), str(vals[2])))
+        if g:
+            self._replay_game(g)
 
     def _replay_game(self, game: TournamentGame):
         if not game.move_history:
@@ -2903,42 +3797,53 @@ class TournamentWindow:
         self.black_lbl.config(text=f"♚  {game.black.name}")
 
         # ── PATCH: show Elo in replay mode too ───────────────────────────────
-        self.white_elo_lbl.config(
-            text=_fmt_elo(self._elo_map, game.white.name),
-            fg=_elo_color(self._elo_map, game.white.name))
-        self.black_elo_lbl.config(
-            text=_fmt_elo(self._elo_map, game.black.name),
-            fg=_elo_color(self._elo_map, game.black.name))
+        self._show_elo_badges(game)
 
         if game.opening:
             self.opening_lbl.config(text=f"📖  {game.opening}")
         else:
             self.opening_lbl.config(text="")
         self.mini_board.set_replay(game.move_history, game.eval_history)
-        self._live_evals = list(game.eval_history)
-        self.live_eval_graph.set_evals(self._live_evals)
+        self.live_eval_graph.set_evals(game.eval_history)
         self._log_game_moves(game)
         self._status(f"Replaying: {game.white.name} vs {game.black.name}")
 
     def _open_history(self):
-        if self._history_win and self._history_win.win.winfo_exists():
-            self._history_win.win.lift()
+        hw = self._history_window()
+        if hw:
+            hw.win.lift()
             return
         # ── PATCH: pass db so TournamentHistoryWindow can show Elo ───────────
-        self._history_win = TournamentHistoryWindow(self.win, self.t, db=self.db)
+        self._history_win_ref = weakref.ref(
+            TournamentHistoryWindow(self.win, self.t, db=self.db))
+
+    def _history_window(self):
+        """The open history viewer, or None once it has been closed."""
+        hw = self._history_win_ref() if self._history_win_ref else None
+        if hw and hw.win.winfo_exists():
+            return hw
+        return None
 
     def _open_roster(self):
         RosterDialog(self.win, self.t, on_change=self._on_roster_change)
 
     def _on_roster_change(self):
-        self._refresh_standings()
-        self._refresh_schedule()
-        self._refresh_history()
+        self._schedule_refresh('standings', 'schedule', 'history')
 
     # ── Runner callbacks ──────────────────────────────────────────────────────
 
+    def add_observer(self, fn):
+        """Call ``fn(arg)`` on every game start and end, round end and
+        tournament end."""
+        self._game_start_observers.append(fn)
+        self._game_end_observers.append(fn)
+        self._round_end_observers.append(fn)
+        self._tournament_end_observers.append(fn)
+
     def _cb_game_start(self, game):
         self.current_game = game
+        for fn in self._game_start_observers:
+            fn(game)
         self.win.after(0, self._on_game_start_ui, game)
 
     def _on_game_start_ui(self, game):
@@ -2948,39 +3853,35 @@ class TournamentWindow:
         self.black_lbl.config(text=f"♚  {game.black.name}")
 
         # ── PATCH: show Elo when game starts ─────────────────────────────────
-        self.white_elo_lbl.config(
-            text=_fmt_elo(self._elo_map, game.white.name),
-            fg=_elo_color(self._elo_map, game.white.name))
-        self.black_elo_lbl.config(
-            text=_fmt_elo(self._elo_map, game.black.name),
-            fg=_elo_color(self._elo_map, game.black.name))
+        self._show_elo_badges(game)
 
         self.opening_lbl.config(text="")
-        self._live_evals = []
         self._current_opening_in_log = False
         self._last_opening_in_log    = None
         self.live_eval_graph.set_evals([])
-        self.move_log.config(state='normal')
-        self.move_log.delete('1.0', 'end')
-        self.move_log.config(state='disabled')
-        self._refresh_schedule()
+        with _editable(self.move_log) as log:
+            log.delete('1.0', 'end')
+        self._reset_move_ring()
+        self._schedule_refresh('schedule')
 
     def _cb_board_update(self, game, board, last_move,
                          eval_cp=None, eval_mate=None, opening_name=None):
-        self.win.after(0, self._on_board_update_ui, board, last_move,
-                       len(board.move_history),
-                       board.move_history[-1] if board.move_history else None,
+        # Runs on the runner thread, which keeps mutating *board*: hand the
+        # UI an immutable copy of the squares instead of the board itself
+        squares = tuple(tuple(r) for r in board.board)
+        hist    = board.move_history
+        self.win.after(0, self._on_board_update_ui, squares, last_move,
+                       len(hist), hist[-1] if hist else None,
                        eval_cp, eval_mate, opening_name)
 
-    def _on_board_update_ui(self, board, last_move, ply, last_hist,
+    def _on_board_update_ui(self, squares, last_move, ply, last_hist,
                             eval_cp, eval_mate, opening_name=None):
-        self.mini_board.update_live(board, last_move, eval_cp, eval_mate)
+        self.mini_board.update_live(squares, last_move, eval_cp, eval_mate)
         if last_hist:
             uci, san, fen = last_hist
             self._append_move(ply, san)
         if eval_cp is not None:
-            self._live_evals.append(eval_cp)
-            self.live_eval_graph.set_evals(self._live_evals)
+            self.live_eval_graph.append_eval(eval_cp)
         if opening_name:
             self.opening_lbl.config(text=f"📖  {opening_name}")
             if not getattr(self, '_current_opening_in_log', False):
@@ -2991,66 +3892,89 @@ class TournamentWindow:
                 self._last_opening_in_log = opening_name
                 self._update_opening_in_log(opening_name)
 
+    def _cb_eval(self, game, ply, eval_cp, eval_mate):
+        self.win.after(0, self._on_eval_ui, game, eval_cp, eval_mate)
+
+    def _on_eval_ui(self, game, eval_cp, eval_mate):
+        # Evals arrive from the analyzer thread and may trail the game's end
+        if game.status != 'running':
+            return
+        self.mini_board.eval_bar.set_eval(eval_cp, eval_mate)
+        self.live_eval_graph.append_eval(eval_cp)
+
+    def _reset_move_ring(self):
+        # 'moves' marks where the ply text starts (after any opening line);
+        # its default right gravity keeps it there when the opening line is
+        # inserted or replaced at 1.0
+        self._move_ring = deque()
+        self.move_log.mark_set('moves', 'end-1c')
+
     def _append_move(self, ply, san):
-        self.move_log.config(state='normal')
+        # The widget holds at most MOVE_LOG_PLIES plies: the ring remembers
+        # each ply's length so the oldest can be cut from the 'moves' mark
+        # without asking Tk where lines end
         if ply % 2 == 1:
             move_num = (ply + 1) // 2
-            self.move_log.insert('end', f"{move_num}. ", 'n')
-            self.move_log.insert('end', san + " ", 'w')
+            segs = (f"{move_num}. ", 'n', san + " ", 'w')
         else:
-            self.move_log.insert('end', san + "  ", 'b')
-        lines = int(self.move_log.index('end-1c').split('.')[0])
-        if lines > 1000:
-            self.move_log.delete('1.0', '100.0')
-        self.move_log.see('end')
-        self.move_log.config(state='disabled')
+            segs = (san + "  ", 'b')
+        ring = self._move_ring
+        with _editable(self.move_log) as log:
+            if len(ring) >= self.MOVE_LOG_PLIES:
+                log.delete('moves', f'moves+{ring.popleft()}c')
+            log.insert('end', *segs)
+            ring.append(sum(len(t) for t in segs[::2]))
+            log.see('end')
 
     def _cb_game_end(self, game):
+        for fn in self._game_end_observers:
+            fn(game)
         self.win.after(0, self._on_game_end_ui, game)
 
     def _on_game_end_ui(self, game):
-        self.move_log.config(state='normal')
-        self.move_log.insert('end', f"\n  ⇒ {game.result}  {game.reason}\n", 'res')
-        self.move_log.see('end')
-        self.move_log.config(state='disabled')
+        with _editable(self.move_log) as log:
+            log.insert('end', f"\n  ⇒ {game.result}  {game.reason}\n", 'res')
+            log.see('end')
 
-        self._refresh_schedule()
-        self._refresh_history()
+        self._schedule_refresh('schedule', 'history')
         if self.t.format == Tournament.FORMAT_KNOCKOUT:
-            self.win.after(0, self._draw_bracket)
+            self._schedule_bracket()
         self._save_game_db(game)
-        if self._history_win and self._history_win.win.winfo_exists():
-            self._history_win._populate_game_list()
+        hw = self._history_window()
+        if hw:
+            hw._populate_game_list()
         # Refresh Elo off-thread (updates standings + badges when done)
         self._refresh_elo_async()
 
     def _cb_round_end(self, completed_round):
+        for fn in self._round_end_observers:
+            fn(completed_round)
         self.win.after(0, self._on_round_end_ui, completed_round)
 
     def _on_round_end_ui(self, rnd):
         self._status(f"✓ Round {rnd} complete")
-        self._refresh_standings()
-        self._refresh_schedule()
+        self._schedule_refresh('standings', 'schedule')
         if self.t.format == Tournament.FORMAT_KNOCKOUT:
-            self.win.after(0, self._draw_bracket)
+            self._schedule_bracket()
 
     def _cb_tournament_end(self, t):
+        for fn in self._tournament_end_observers:
+            fn(t)
         self.win.after(0, self._on_tournament_end_ui, t)
 
     def _on_tournament_end_ui(self, t):
         w = t.winner
         wname = w.name if w else "?"
         self._status(f"🏆 TOURNAMENT COMPLETE!  Winner: {wname}")
-        self._refresh_standings()
-        self._refresh_history()
+        self._schedule_refresh('standings', 'history')
         if t.format == Tournament.FORMAT_KNOCKOUT:
-            self._draw_bracket()
+            self._schedule_bracket()
         # Refresh final Elo off-thread, then show results
         fetch_async(
             parent  = self.win,
-            work_fn = lambda: _get_elo_map(self.db),
+            work_fn = lambda: (self._wait_db_writes(), _get_elo_map(self.db))[1],
             done_fn = lambda em: (
-                self.__dict__.update(_elo_map=em),
+                self._set_elo_map(em),
                 self._refresh_standings(),
                 self._show_final_results(),
             ),
@@ -3066,26 +3990,67 @@ class TournamentWindow:
 
     def _on_elo_loaded(self, elo_map: dict):
         """Called on main thread once the background Elo fetch completes."""
-        self._elo_map = elo_map
-        self._refresh_standings()
+        self._set_elo_map(elo_map)
+        self._schedule_refresh('standings')
         # Refresh live player badges if a game is running
         if self.current_game:
             g = self.current_game
-            self.white_elo_lbl.config(
-                text=_fmt_elo(self._elo_map, g.white.name),
-                fg=_elo_color(self._elo_map, g.white.name))
-            self.black_elo_lbl.config(
-                text=_fmt_elo(self._elo_map, g.black.name),
-                fg=_elo_color(self._elo_map, g.black.name))
+            self._show_elo_badges(g)
+
+    def _set_elo_map(self, elo_map: dict):
+        # Resolve every player once per map, so refreshes never repeat the
+        # name normalisation or the tier lookup
+        self._elo_map = elo_map
+        self._elo_resolved = {}
+        for p in self.t.player_list:
+            self._elo_info(p.name)
+
+    def _elo_info(self, name: str) -> tuple:
+        """(elo, badge text, colour, tier label, tier tag) for *name*."""
+        info = self._elo_resolved.get(name)
+        if info is None:
+            elo  = _lookup_elo(self._elo_map, name)
+            info = self._elo_resolved[name] = (elo, *_elo_display(elo))
+        return info
+
+    def _show_elo_badges(self, game):
+        _, wtxt, wcol, _, _ = self._elo_info(game.white.name)
+        _, btxt, bcol, _, _ = self._elo_info(game.black.name)
+        self.white_elo_lbl.config(text=wtxt, fg=wcol)
+        self.black_elo_lbl.config(text=btxt, fg=bcol)
 
     def _refresh_elo_async(self):
-        """Re-fetch Elo ratings in background and refresh standings when done."""
+        """
+        Re-fetch Elo ratings in background and refresh standings when done.
+        At most one fetch runs at a time; requests made meanwhile collapse
+        into a single follow-up fetch once it lands.
+        """
+        if self._elo_fetch_inflight:
+            self._elo_fetch_pending = True
+            return
+        self._elo_fetch_inflight = True
         fetch_async(
-            parent  = self.win,
-            work_fn = lambda: _get_elo_map(self.db),
-            done_fn = self._on_elo_loaded,
+            parent   = self.win,
+            work_fn  = lambda: (self._wait_db_writes(), _get_elo_map(self.db))[1],
+            done_fn  = self._on_elo_refreshed,
+            error_fn = self._on_elo_refresh_failed,
         )
 
+    def _on_elo_refreshed(self, elo_map: dict):
+        self._elo_fetch_inflight = False
+        self._on_elo_loaded(elo_map)
+        self._drain_elo_pending()
+
+    def _on_elo_refresh_failed(self, exc):
+        self._elo_fetch_inflight = False
+        print(f"[fetch_async] error: {exc}")
+        self._drain_elo_pending()
+
+    def _drain_elo_pending(self):
+        if self._elo_fetch_pending:
+            self._elo_fetch_pending = False
+            self._refresh_elo_async()
+
     # ── Control buttons ───────────────────────────────────────────────────────
 
     def _start(self):
@@ -3100,6 +4065,7 @@ class TournamentWindow:
             on_round_end      = self._cb_round_end,
             on_tournament_end = self._cb_tournament_end,
             on_status         = self._cb_status,
+            on_eval           = self._cb_eval,
         )
         self.runner.start()
         self._status(f"▶ Tournament started — {self.t.format}")
@@ -3117,10 +4083,56 @@ class TournamentWindow:
 
     def _on_close(self):
         self._stop()
+        for attr in ('_refresh_tick_id', '_bracket_tick_id'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                self.win.after_cancel(after_id)
+                setattr(self, attr, None)
         self.win.destroy()
 
+    def _on_destroy(self, e):
+        if e.widget is not self.win:
+            return
+        # Queued saves still run; the writer commits and closes last (the
+        # executor's thread is joined at interpreter exit, so this holds
+        # when the whole app is closing too)
+        if self._db_commit_after is not None:
+            self.win.after_cancel(self._db_commit_after)
+            self._db_commit_after = None
+        self._db_exec.submit(self._close_db_conn)
+        self._db_exec.shutdown(wait=False)
+
     # ── Refresh helpers ───────────────────────────────────────────────────────
 
+    def _schedule_refresh(self, *names):
+        """
+        Queue 'standings' / 'schedule' / 'history' for one rebuild
+        REFRESH_DELAY_MS from the first request.  Runner callbacks land as
+        separate after(0) events, so an idle-only hook would still let a
+        burst of them through one at a time; the short window folds them.
+        """
+        self._pending_refreshes.update(names)
+        if self._refresh_tick_id is None:
+            self._refresh_tick_id = self.win.after(
+                self.REFRESH_DELAY_MS, self._drain_refresh)
+
+    def _drain_refresh(self):
+        self._refresh_tick_id = None
+        pending = self._pending_refreshes
+        self._pending_refreshes = set()
+        if not self.win.winfo_exists():
+            return
+        # Hidden tabs are only marked stale; _on_tab_changed rebuilds them
+        visible = self._visible_tab()
+        self._stale_tabs.update(pending - {visible})
+        pending &= {visible}
+        if 'standings' in pending:
+            self._refresh_standings()
+        if 'schedule' in pending:
+            self._refresh_schedule()
+        if 'history' in pending:
+            self._refresh_history()
+
     def _refresh_standings(self):
         tree = self.standings_tree
         for item in tree.get_children():
@@ -3131,112 +4143,114 @@ class TournamentWindow:
         self.round_info_lbl.config(
             text=f"Round {rnd} / {total}  ·  "
                 f"{len(self.t.get_all_completed_games())} games completed")
-        cols = list(tree['columns'])
+        with_bh  = 'BH' in tree['columns']
+        cg       = self.current_game
+        active   = (cg.white.name, cg.black.name) if cg else ()
+        elo_info = self._elo_info
 
         rows = []
         for i, p in enumerate(standings, 1):
-            elo_val = self._elo_map.get(p.name) or \
-                      self._elo_map.get(normalize_engine_name(p.name))
+            name, score, wins, draws, losses, gp, bh, sb = _STANDING_FIELDS(p)
+            elo_val, _, _, _, tier_tag = elo_info(name)
             elo_str = str(elo_val) if elo_val is not None else "—"
-            row = [i, p.name, elo_str, f"{p.score:.1f}",
-                   p.wins, p.draws, p.losses, p.games_played]
-            if 'BH' in cols:
-                row += [f"{p.buchholz:.1f}", f"{p.sonneborn:.1f}"]
-            if elo_val is not None:
-                _, tier_col = get_tier(elo_val)
-                tag = f'tier_{tier_col}'
-            else:
-                tag = ('gold' if i==1 else 'silver' if i==2 else
-                       'bronze' if i==3 else 'normal')
-            if self.current_game and p.name in (
-                    self.current_game.white.name,
-                    self.current_game.black.name):
+            row = [i, name, elo_str, f"{score:.1f}", wins, draws, losses, gp]
+            if with_bh:
+                row += [f"{bh:.1f}", f"{sb:.1f}"]
+            if name in active:
                 tag = 'active'
-            rows.append({"values": row, "tags": (tag,)})
+            elif elo_val is not None:
+                tag = tier_tag
+            else:
+                tag = _PLACE_TAGS.get(i, 'normal')
+            rows.append((row, (tag,)))
 
         _batch_tree_insert(self.win, tree, rows)
 
     def _refresh_schedule(self):
-        tree = self.schedule_tree
-        for item in tree.get_children():
-            tree.delete(item)
-
-        rows = []
+        # Rows are cached per game and rebuilt only when the game's state
+        # changed, so the virtual tree sees the same tuple for unchanged
+        # games and skips their items entirely
+        rows  = []
+        cache = self._schedule_row_cache
+        by_round = self.t._games_by_round
         for rnd in range(1, self.t.current_round + 1):
-            for seq, g in enumerate(
-                    [g for g in self.t.all_games if g.round_num == rnd], 1):
+            for seq, g in enumerate(by_round.get(rnd, ()), 1):
+                sig = (seq, g.status, g.result, g.opening, g.move_count)
+                hit = cache.get(id(g))
+                if hit is not None and hit[0] == sig:
+                    rows.append(hit[1])
+                    continue
                 result_str  = g.result or "—"
                 opening_str = (g.opening[:22] if g.opening else "")
                 moves_str   = str(g.move_count) if g.status == 'done' else ""
                 row = [rnd, seq, g.white.name, g.black.name,
                        result_str, opening_str, moves_str]
-                if g.status == 'running':        tag = 'running'
-                elif g.status == 'done':
-                    if g.result == '1-0':        tag = 'done_w'
-                    elif g.result == '0-1':      tag = 'done_b'
-                    elif g.result == '1/2-1/2':  tag = 'done_draw'
-                    else:                        tag = 'pending'
-                else:                            tag = 'pending'
-                rows.append({"values": row, "tags": (tag,)})
-
-        def _after_insert():
-            ch = tree.get_children()
-            if ch:
-                tree.see(ch[-1])
+                entry = (row, _SCHEDULE_TAGS.get((g.status, g.result),
+                                                 _PENDING_TAGS))
+                cache[id(g)] = (sig, entry)
+                rows.append(entry)
 
-        _batch_tree_insert(self.win, tree, rows, done_fn=_after_insert)
+        self._schedule_vt.set_rows(rows)
+        self._schedule_vt.see_end()
 
     def _refresh_history(self):
-        tree = self.history_tree
-        for item in tree.get_children():
-            tree.delete(item)
-
+        # Completed games never change and only ever get appended, so rows
+        # are built once per game and prepended newest-first; the virtual
+        # tree then renders just the visible window of the list
+        completed = self.t.get_all_completed_games()
+        fresh     = len(completed) - self._history_built
+        if not fresh and self._history_rows:
+            return
+        self._history_built = len(completed)
         rows = []
-        for g in reversed(self.t.get_all_completed_games()):
+        for g in islice(reversed(completed), fresh):
             dur_s = f"{g.duration//60}m{g.duration%60}s" if g.duration else "—"
             row = [g.round_num, g.white.name, g.black.name,
                    g.result or "—",
                    (g.opening[:22] if g.opening else "—"),
                    g.move_count, dur_s]
-            if g.result == '1-0':      tag = 'wwin'
-            elif g.result == '0-1':    tag = 'bwin'
-            else:                      tag = 'draw'
-            rows.append({"values": row, "tags": (tag,)})
+            rows.append((row, (_RESULT_TAG.get(g.result, 'draw'),)))
 
-        _batch_tree_insert(self.win, tree, rows)
+        self._history_rows[:0] = rows
+        self._history_vt.set_rows(self._history_rows)
 
     def _prepend_opening_to_log(self, opening_name):
-        self.move_log.config(state='normal')
-        current = self.move_log.get('1.0', 'end-1c')
-        self.move_log.delete('1.0', 'end')
-        self.move_log.insert('end', f"📖  {opening_name}\n", 'book')
-        if current.strip():
-            self.move_log.insert('end', current)
-        self.move_log.config(state='disabled')
+        with _editable(self.move_log) as log:
+            log.insert('1.0', f"📖  {opening_name}\n", 'book')
 
     def _update_opening_in_log(self, opening_name):
-        self.move_log.config(state='normal')
-        first_line_end = self.move_log.index('1.end')
-        self.move_log.delete('1.0', f'{first_line_end}+1c')
-        self.move_log.insert('1.0', f"📖  {opening_name}\n", 'book')
-        self.move_log.config(state='disabled')
+        # Tk resolves the line end itself; no index round-trip needed
+        with _editable(self.move_log) as log:
+            log.delete('1.0', '1.0 lineend +1c')
+            log.insert('1.0', f"📖  {opening_name}\n", 'book')
 
     def _log_game_moves(self, game: TournamentGame):
-        self.move_log.config(state='normal')
-        self.move_log.delete('1.0', 'end')
-        if game.opening:
-            self.move_log.insert('end', f"📖 {game.opening}\n\n", 'book')
-        for i, (uci, san, fen) in enumerate(game.move_history):
-            ply = i + 1
-            if ply % 2 == 1:
-                move_num = (ply+1) // 2
-                self.move_log.insert('end', f"{move_num}. ", 'n')
-                self.move_log.insert('end', san + " ", 'w')
-            else:
-                self.move_log.insert('end', san + "  ", 'b')
-        self.move_log.insert('end', f"\n  ⇒ {game.result}  {game.reason}\n", 'res')
-        self.move_log.see('end')
-        self.move_log.config(state='disabled')
+        # Build (text, tag) segments up front and hand them to Tk in one
+        # multi-segment insert rather than one insert per move.  The
+        # segments are kept on the game, so replaying it again skips the
+        # rebuild unless its moves or result changed.
+        key    = (len(game.move_history), game.result, game.reason, game.opening)
+        cached = getattr(game, '_log_segs', None)
+        if cached is not None and cached[0] == key:
+            segs = cached[1]
+        else:
+            segs = []
+            if game.opening:
+                segs += (f"📖 {game.opening}\n\n", 'book')
+            for i, (uci, san, fen) in enumerate(game.move_history):
+                ply = i + 1
+                if ply % 2 == 1:
+                    move_num = (ply+1) // 2
+                    segs += (f"{move_num}. ", 'n', san + " ", 'w')
+                else:
+                    segs += (san + "  ", 'b')
+            segs += (f"\n  ⇒ {game.result}  {game.reason}\n", 'res')
+            game._log_segs = (key, segs)
+        with _editable(self.move_log) as log:
+            log.delete('1.0', 'end')
+            log.insert('end', *segs)
+            log.see('end')
+        self._reset_move_ring()
 
     # ── Final results dialog ──────────────────────────────────────────────────
 
@@ -3249,33 +4263,30 @@ class TournamentWindow:
         d.transient(self.win)
         d.grab_set()
         winner = self.t.winner
-        tk.Label(d, text="🏆", bg=BG, font=('Segoe UI',48)).pack(pady=(16,4))
+        tk.Label(d, text="🏆", bg=BG, font=_font('Segoe UI',48)).pack(pady=(16,4))
         tk.Label(d, text="TOURNAMENT COMPLETE", bg=BG, fg=ACCENT,
-                font=('Segoe UI',16,'bold')).pack()
+                font=_font('Segoe UI',16,'bold')).pack()
         tk.Label(d, text=self.t.name, bg=BG, fg="#AAA",
-                font=('Segoe UI',10)).pack()
+                font=_font('Segoe UI',10)).pack()
         tk.Frame(d, bg=ACCENT, height=2).pack(fill='x', padx=20, pady=10)
         if winner:
             # ── PATCH: show winner's Elo in final results ─────────────────────
-            w_elo     = self._elo_map.get(winner.name) or \
-                        self._elo_map.get(normalize_engine_name(winner.name))
+            w_elo, _, w_col, w_tier, _ = self._elo_info(winner.name)
             w_elo_str = f"  ·  Elo {w_elo}" if w_elo is not None else ""
-            w_tier    = ""
-            w_col     = "#FFD700"
-            if w_elo is not None:
-                w_tier, w_col = get_tier(w_elo)
+            if w_elo is None:
+                w_col = "#FFD700"
             tk.Label(d, text=f"🥇  {winner.name}", bg=BG, fg=w_col,
-                    font=('Segoe UI',18,'bold')).pack(pady=(4,0))
+                    font=_font('Segoe UI',18,'bold')).pack(pady=(4,0))
             tk.Label(d, text=f"Score: {winner.score:.1f}  ·  "
                              f"W:{winner.wins}  D:{winner.draws}  L:{winner.losses}"
                              f"{w_elo_str}",
-                    bg=BG, fg="#AAA", font=('Segoe UI',10)).pack()
+                    bg=BG, fg="#AAA", font=_font('Segoe UI',10)).pack()
             if w_elo is not None:
                 tk.Label(d, text=w_tier, bg=BG, fg=w_col,
-                         font=('Segoe UI', 9, 'italic')).pack(pady=(0,4))
+                         font=_font('Segoe UI', 9, 'italic')).pack(pady=(0,4))
         tk.Frame(d, bg='#2a2a4a', height=1).pack(fill='x', padx=20, pady=8)
         tk.Label(d, text="Final Standings:", bg=BG, fg="#AAA",
-                font=('Segoe UI',9,'bold')).pack(anchor='w', padx=24)
+                font=_font('Segoe UI',9,'bold')).pack(anchor='w', padx=24)
         tf = tk.Frame(d, bg=LOG_BG)
         tf.pack(fill='both', expand=True, padx=20, pady=4)
         sb = tk.Scrollbar(tf); sb.pack(side='right', fill='y')
@@ -3283,7 +4294,8 @@ class TournamentWindow:
         # ── PATCH: add Elo column to final standings table ─────────────────────
         cols = ['#','Engine','Elo','Score','W','D','L']
         tree = ttk.Treeview(tf, columns=cols, show='headings',
-                            yscrollcommand=sb.set, height=8)
+                            yscrollcommand=sb.set, height=8,
+                            style=_tree_style(26))
         sb.config(command=tree.yview)
         for c, w in [('#',30),('Engine',175),('Elo',65),
                      ('Score',55),('W',40),('D',40),('L',40)]:
@@ -3293,152 +4305,118 @@ class TournamentWindow:
         tree.tag_configure('silver', foreground="#C0C0C0")
         tree.tag_configure('bronze', foreground="#CD7F32")
         tree.tag_configure('normal', foreground=TEXT)
-        for _, _, colour in RANK_TIERS:
-            tree.tag_configure(f'tier_{colour}', foreground=colour)
+        for tag, (_, _, colour) in zip(_TIER_TAGS, _TIER_ASC):
+            tree.tag_configure(tag, foreground=colour)
 
+        # Every row is built before the first insert, so the batch below
+        # only does Tk work
+        rows = []
         for i, p in enumerate(self.t.get_standings(), 1):
-            p_elo     = self._elo_map.get(p.name) or \
-                        self._elo_map.get(normalize_engine_name(p.name))
-            elo_str   = str(p_elo) if p_elo is not None else "—"
-            if p_elo is not None:
-                _, tier_col = get_tier(p_elo)
-                tag = f'tier_{tier_col}'
+            elo, _, _, _, tier_tag = self._elo_info(p.name)
+            if elo is not None:
+                elo_str, tag = str(elo), tier_tag
             else:
-                tag = ('gold' if i==1 else 'silver' if i==2 else
-                       'bronze' if i==3 else 'normal')
-            tree.insert('', 'end',
-                values=[i, p.name, elo_str, f"{p.score:.1f}",
-                        p.wins, p.draws, p.losses],
-                tags=(tag,))
+                elo_str, tag = "—", _PLACE_TAGS.get(i, 'normal')
+            rows.append(([i, p.name, elo_str, f"{p.score:.1f}",
+                          p.wins, p.draws, p.losses], (tag,)))
         tree.pack(fill='both', expand=True)
+        # Rows stream in after the dialog's first paint; stop if it closes
+        cancel_rows = _batch_tree_insert(d, tree, rows)
+        d.bind('<Destroy>',
+               lambda e: cancel_rows() if e.widget is d else None)
         bf = tk.Frame(d, bg=BG)
         bf.pack(fill='x', padx=20, pady=(4,14))
         tk.Button(bf, text="📜 View Full History",
                 command=lambda: [d.destroy(), self._open_history()],
-                bg=BTN_BG, fg=TEXT, font=('Segoe UI',10),
+                bg=BTN_BG, fg=TEXT, font=_font('Segoe UI',10),
                 padx=16, pady=8, relief='flat', cursor='hand2'
                 ).pack(side='left', padx=(0,8))
         tk.Button(bf, text="Close", command=d.destroy,
-                bg=BTN_BG, fg=TEXT, font=('Segoe UI',10),
+                bg=BTN_BG, fg=TEXT, font=_font('Segoe UI',10),
                 padx=16, pady=8, relief='flat', cursor='hand2'
                 ).pack(side='right')
 
     # ── DB persistence ────────────────────────────────────────────────────────
 
     def _save_game_db(self, game: TournamentGame):
+        """Snapshot *game* on the Tk thread and queue the write."""
         if not game.pgn:
             return
-
-        if self.db is not None:
-            game_id, t_game_id = self.db.save_tournament_game(
-                tournament_id   = self.t.tournament_id,
-                tournament_name = self.t.name,
-                fmt             = self.t.format,
-                round_num       = game.round_num,
-                white_name      = game.white.name,
-                black_name      = game.black.name,
-                result          = game.result or '*',
-                reason          = game.reason,
-                pgn             = game.pgn,
-                move_count      = game.move_count,
-                duration_sec    = game.duration,
-                opening         = game.opening or None,
-            )
-            if game_id:
-                print(f"[DB] Saved tournament game #{game_id} "
-                      f"(t_game #{t_game_id}): "
-                      f"{game.white.name} vs {game.black.name} → {game.result}")
-            else:
-                print(f"[DB] Failed to save: "
-                      f"{game.white.name} vs {game.black.name}")
+        if self.db is None:
             return
+        snap = (self.t.tournament_id, self.t.name, self.t.format,
+                game.round_num, game.white.name, game.black.name,
+                game.result or '*', game.reason, game.pgn,
+                game.move_count, game.duration, game.opening or None)
+        self._db_exec.submit(self._save_game_worker, snap)
+        # Saves within DB_COMMIT_MS of the first uncommitted one share its
+        # commit; later saves never push it back
+        if self._db_commit_after is None:
+            self._db_commit_after = self.win.after(
+                self.DB_COMMIT_MS, self._flush_db_commit)
+
+    def _flush_db_commit(self):
+        self._db_commit_after = None
+        self._db_exec.submit(self._commit_db_conn)
+
+    def _wait_db_writes(self):
+        """
+        Block (off the Tk thread) until every queued save has landed and
+        been committed, so readers on other connections can see it.
+        """
+        try:
+            self._db_exec.submit(self._commit_db_conn).result()
+        except RuntimeError:
+            pass    # writer already shut down
+
+    def _save_game_worker(self, snap: tuple):
+        (t_id, t_name, fmt, round_num, white, black,
+         result, reason, pgn, move_count, duration, opening) = snap
 
-        if not self.db_path:
-            return
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("PRAGMA journal_mode=WAL")
-            cur = conn.cursor()
-
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS games (
-                    id                INTEGER PRIMARY KEY AUTOINCREMENT,
-                    white_engine      TEXT    NOT NULL,
-                    black_engine      TEXT    NOT NULL,
-                    result            TEXT    NOT NULL,
-                    reason            TEXT    NOT NULL,
-                    date              TEXT    NOT NULL,
-                    time              TEXT    NOT NULL,
-                    pgn               TEXT    NOT NULL,
-                    move_count        INTEGER,
-                    duration_seconds  INTEGER,
-                    source            TEXT    DEFAULT 'regular'
-                )
-            ''')
-            cur.execute('''
-                CREATE TABLE IF NOT EXISTS tournament_games (
-                    id              INTEGER PRIMARY KEY AUTOINCREMENT,
-                    game_id         INTEGER REFERENCES games(id) ON DELETE CASCADE,
-                    tournament_id   TEXT    NOT NULL,
-                    tournament_name TEXT    NOT NULL,
-                    format          TEXT    NOT NULL,
-                    round_num       INTEGER NOT NULL,
-                    white_engine    TEXT    NOT NULL,
-                    black_engine    TEXT    NOT NULL,
-                    result          TEXT    NOT NULL,
-                    reason          TEXT    NOT NULL,
-                    pgn             TEXT    NOT NULL,
-                    move_count      INTEGER,
-                    duration_sec    INTEGER,
-                    opening         TEXT,
-                    date            TEXT    NOT NULL,
-                    time            TEXT    NOT NULL
-                )
-            ''')
+            conn = self._writer_conn()
+        except Exception as e:
+            print(f"[DB] Failed to save: {white} vs {black} ({e})")
+            return
+        game_id, t_game_id = self.db.save_tournament_game_prepared(
+            conn,
+            tournament_id   = t_id,
+            tournament_name = t_name,
+            fmt             = fmt,
+            round_num       = round_num,
+            white_name      = white,
+            black_name      = black,
+            result          = result,
+            reason          = reason,
+            pgn             = pgn,
+            move_count      = move_count,
+            duration_sec    = duration,
+            opening         = opening,
+        )
+        if game_id is None:
+            print(f"[DB] Failed to save: {white} vs {black}")
+            return
+        print(f"[DB] Saved tournament game #{game_id} "
+              f"(t_game #{t_game_id}): {white} vs {black} → {result}")
+
+    def _writer_conn(self) -> sqlite3.Connection:
+        """Writer-thread connection, opened once (Database made the schema)."""
+        if self._db_conn is None:
+            self._db_conn = self.db.open_writer()
+        return self._db_conn
+
+    def _commit_db_conn(self):
+        if self._db_conn is not None:
             try:
-                cur.execute("ALTER TABLE games ADD COLUMN source TEXT DEFAULT 'regular'")
-            except sqlite3.OperationalError:
-                pass
+                self._db_conn.commit()
+            except Exception as e:
+                print(f"[TournamentWindow._save_game_db] {e}")
 
-            now      = datetime.now()
-            date_str = now.strftime("%Y.%m.%d")
-            time_str = now.strftime("%H:%M:%S")
-
-            cur.execute('''
-                INSERT INTO games
-                    (white_engine, black_engine, result, reason,
-                     date, time, pgn, move_count, duration_seconds, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                normalize_engine_name(game.white.name),
-                normalize_engine_name(game.black.name),
-                game.result or '*', game.reason,
-                date_str, time_str,
-                game.pgn, game.move_count, game.duration,
-                'tournament',
-            ))
-            game_id = cur.lastrowid
-
-            cur.execute('''
-                INSERT INTO tournament_games
-                    (game_id, tournament_id, tournament_name, format,
-                     round_num, white_engine, black_engine, result, reason,
-                     pgn, move_count, duration_sec, opening, date, time)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                game_id,
-                self.t.tournament_id, self.t.name, self.t.format, game.round_num,
-                normalize_engine_name(game.white.name),
-                normalize_engine_name(game.black.name),
-                game.result or '*', game.reason,
-                game.pgn, game.move_count, game.duration,
-                game.opening or '',
-                date_str, time_str,
-            ))
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"[TournamentWindow._save_game_db fallback] {e}")
+    def _close_db_conn(self):
+        if self._db_conn is not None:
+            self._commit_db_conn()
+            self._db_conn.close()
+            self._db_conn = None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -3446,31 +4424,98 @@ class TournamentWindow:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TournamentManager:
+    DB_CACHE_MAX = 8   # tournaments rebuilt from the DB kept parsed
+
     def __init__(self):
         self._entries: list[dict]          = []
+        self._by_id: dict[str, dict]       = {}   # tournament id → entry
         self._windows: dict[str, object]   = {}
+        self._revision                     = 0   # bumped on every change
+        self._dirty: set[str]              = set()   # ids awaiting update()
+        # Ids of DB-rebuilt tournaments, least recently opened first
+        self._from_db: OrderedDict[str, None] = OrderedDict()
+
+    @property
+    def revision(self) -> int:
+        """Changes whenever an entry is added or updated."""
+        return self._revision
 
     def register(self, tournament: Tournament,
                  win: "TournamentWindow | None" = None) -> None:
+        self._revision += 1
         entry = self._make_entry(tournament)
-        for i, e in enumerate(self._entries):
-            if e["id"] == tournament.tournament_id:
-                self._entries[i] = entry
-                break
+        old   = self._by_id.get(tournament.tournament_id)
+        if old is not None:
+            # Refreshed in place, so the entry keeps its list position
+            old.update(entry)
         else:
             self._entries.insert(0, entry)
+            self._by_id[tournament.tournament_id] = entry
         if win is not None:
             self._windows[tournament.tournament_id] = win
 
     def update(self, tournament: Tournament) -> None:
         self.register(tournament)
 
+    def register_from_db(self, tournament: Tournament,
+                         win: "TournamentWindow") -> None:
+        """
+        Register a tournament rebuilt from the database. Only the
+        DB_CACHE_MAX most recently opened stay parsed; older ones whose
+        window is closed are dropped, so the list falls back to their
+        DB row and reopening them parses again.
+        """
+        tid = tournament.tournament_id
+        self.register(tournament, win)
+        self._from_db[tid] = None
+        self._from_db.move_to_end(tid)
+        for old in list(self._from_db):
+            if len(self._from_db) <= self.DB_CACHE_MAX:
+                break
+            if old != tid and not self._window_open(old):
+                self._remove(old)
+
+    def touch(self, tid: str) -> None:
+        """Mark a DB-rebuilt tournament as just opened."""
+        if tid in self._from_db:
+            self._from_db.move_to_end(tid)
+
+    def _window_open(self, tid: str) -> bool:
+        win = self._windows.get(tid)
+        try:
+            return win is not None and bool(win.win.winfo_exists())
+        except Exception:
+            return False
+
+    def _remove(self, tid: str) -> None:
+        self._revision += 1
+        self._from_db.pop(tid, None)
+        self._windows.pop(tid, None)
+        entry = self._by_id.pop(tid, None)
+        if entry is not None:
+            self._entries.remove(entry)
+
+    def mark_dirty(self, tournament: Tournament) -> None:
+        """Note a change cheaply (safe from the runner thread); the entry is
+        rebuilt by the next flush_dirty() rather than on every event."""
+        self._dirty.add(tournament.tournament_id)
+
+    def flush_dirty(self) -> None:
+        # pop() is atomic, so ids marked while draining are never lost
+        while self._dirty:
+            entry = self._by_id.get(self._dirty.pop())
+            if entry is not None:
+                self.update(entry["obj"])
+
     def set_window(self, tid: str, win: "TournamentWindow") -> None:
         self._windows[tid] = win
 
     def get_all(self) -> list[dict]:
         return list(self._entries)
 
+    def get(self, tid: str) -> "dict | None":
+        return self._by_id.get(tid)
+
     def get_window(self, tid: str) -> "TournamentWindow | None":
         return self._windows.get(tid)
 
@@ -3491,12 +4536,33 @@ class TournamentManager:
 #  Tournament List Window
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class _DisplayRow(NamedTuple):
+    """One tournament in the list, from memory or from the database."""
+    id:      str
+    name:    str
+    format:  str
+    players: object
+    rounds:  object
+    games:   int
+    status:  int      # index into _STATUS_LABELS
+    winner:  str
+    search:  str      # lower-cased "name\0winner" for the text filter
+    created: str
+
+
 class TournamentListWindow:
+    # Status codes index these; ints keep the filter and counts cheap
+    _STATUS_LABELS = ("Pending", "Running", "Finished")
+    _STATUS_TAGS   = ('pending', 'running', 'finished')
+    _FINISHED      = 2
+    REFRESH_MIN_MS = 250   # callback-driven refreshes at most this often
+
     _COL_W = {
         '#': 34, 'Name': 200, 'Format': 100, 'Players': 62,
         'Rounds': 58, 'Games': 58, 'Status': 80,
         'Winner': 160, 'Started': 130,
     }
+    _COL_INDEX = {c: i for i, c in enumerate(_COL_W)}
 
     def __init__(self, root, manager: TournamentManager,
                  db=None, db_path=None,
@@ -3515,7 +4581,23 @@ class TournamentListWindow:
         self.win.resizable(True, True)
         self.win.minsize(720, 380)
 
-        self._id_map:    dict[str, str] = {}
+        # Rows as rendered (values, tags, tournament id), before sorting
+        self._base_rows: list = []
+        self._sort_keys: dict = {}   # column → typed keys, by base index
+        self._sel_tid = None         # selected tournament, whatever is on screen
+        # tournament id → (tournament, rev, games, status, winner, search)
+        self._stats_cache: dict[str, tuple] = {}
+        self._filter_after  = None   # pending debounced search refresh
+        self._last_rev      = -1     # manager revision of the last refresh
+        self._render_key    = None   # (revision, filters) last rendered
+        self._db_rows: list = []     # last DB reply, merged into renders
+        self._db_sig        = None   # its (id, game count) pairs
+        self._refresh_pending = False   # a callback refresh is queued
+        # One overlay serves every background job; it stays up while any runs
+        self._overlay: LoadingOverlay | None = None
+        self._busy_jobs = 0
+        self._db_fetch_seq = 0   # newest DB list query; older replies dropped
+        self._last_refresh_ts = 0.0     # monotonic time of the last refresh
         self._sort_col:  str | None     = None
         self._sort_rev:  bool           = False
 
@@ -3576,7 +4658,7 @@ class TournamentListWindow:
         tk.Label(frow, text="Search:", bg=BG, fg="#888",
                  font=('Segoe UI', 8)).pack(side='left')
         self._filter_var = tk.StringVar()
-        self._filter_var.trace_add('write', lambda *_: self._refresh())
+        self._filter_var.trace_add('write', self._on_filter_change)
         tk.Entry(frow, textvariable=self._filter_var,
                  bg=LOG_BG, fg=TEXT, font=('Segoe UI', 8),
                  width=20, relief='flat',
@@ -3615,8 +4697,11 @@ class TournamentListWindow:
 
         cols = list(self._COL_W.keys())
         self.tree = ttk.Treeview(tf, columns=cols, show='headings',
-                                  yscrollcommand=sb.set)
-        sb.config(command=self.tree.yview)
+                                  style=_tree_style(28))
+        # Only the rows on screen exist as Tk items, however long the list
+        self._vt = _VirtualTree(self.tree, sb, rowheight=28,
+                                key=lambda r: r[2],
+                                on_select=self._on_select)
 
         for c in cols:
             self.tree.heading(c, text=c,
@@ -3624,12 +4709,6 @@ class TournamentListWindow:
             self.tree.column(c, width=self._COL_W[c],
                              anchor='center' if c not in ('Name', 'Winner') else 'w')
 
-        style = ttk.Style()
-        style.configure('Treeview', background=LOG_BG, foreground=TEXT,
-                        fieldbackground=LOG_BG, borderwidth=0, rowheight=28)
-        style.configure('Treeview.Heading', background=BTN_BG,
-                        foreground=TEXT, font=('Segoe UI', 8, 'bold'))
-        style.map('Treeview', background=[('selected', ACCENT)])
 
         self.tree.tag_configure('running',  foreground="#00FF80",
                                 background="#001208")
@@ -3651,124 +4730,188 @@ class TournamentListWindow:
                  padx=10, pady=4).pack(side='left')
 
     @staticmethod
-    def _t_status(t: Tournament) -> str:
-        if t.finished: return "Finished"
-        if t.started:  return "Running"
-        return "Pending"
+    def _t_status(t: Tournament) -> int:
+        if t.finished: return 2
+        if t.started:  return 1
+        return 0
+
+    def _t_stats(self, t: Tournament) -> tuple:
+        """(games played, status code, winner name, search text), recomputed
+        only when the tournament's revision moved since it was last shown."""
+        hit = self._stats_cache.get(t.tournament_id)
+        if hit is not None and hit[0] is t and hit[1] == t._rev:
+            return hit[2:]
+        winner = t._winner_name
+        stats  = (len(t.get_all_completed_games()), self._t_status(t),
+                  winner, f"{t.name}\x00{winner}".lower())
+        self._stats_cache[t.tournament_id] = (t, t._rev) + stats
+        return stats
+
+    def _on_filter_change(self, *_):
+        # Coalesce a burst of keystrokes into one refresh
+        if self._filter_after is not None:
+            self.win.after_cancel(self._filter_after)
+        self._filter_after = self.win.after(150, self._refresh)
+
+    def _schedule_refresh(self):
+        """
+        Queue one _refresh no sooner than REFRESH_MIN_MS after the last.
+        Tournament callbacks fire per game, so while a refresh is already
+        queued further requests are simply dropped.
+        """
+        if self._refresh_pending:
+            return
+        # Only the first event of a burst pays for the Tk existence check
+        if not self.win.winfo_exists():
+            return
+        self._refresh_pending = True
+        since = (time.monotonic() - self._last_refresh_ts) * 1000
+        self.win.after(max(0, int(self.REFRESH_MIN_MS - since)),
+                       self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        if self.win.winfo_exists():
+            self._refresh()
 
-    @staticmethod
-    def _games_played(t: Tournament) -> int:
-        return len(t.get_all_completed_games())
+    def _busy(self, message: str):
+        """Show the shared overlay for a background job; pair with _idle()."""
+        if self._overlay is None:
+            self._overlay = LoadingOverlay(self.win, message)
+        self._busy_jobs += 1
+        self._overlay.show(message)
+
+    def _idle(self):
+        self._busy_jobs = max(0, self._busy_jobs - 1)
+        if not self._busy_jobs and self._overlay is not None:
+            self._overlay.hide()
 
     def _refresh(self, *_):
         """
-        Step 1: render in-memory entries immediately (no freeze),
-        Step 2: fetch DB rows off-thread and merge them in.
+        Step 1: render in-memory entries immediately (no freeze), along
+                with the last DB rows — skipped when neither the manager
+                nor the filters changed since the last render,
+        Step 2: fetch DB rows off-thread and re-render if they changed.
         """
-        self._render_display_rows(db_rows=[])   # instant render from memory
-
-        if self.db is not None:
-            overlay = LoadingOverlay(self.win, "Loading tournament list…")
-            overlay.show()
+        self._filter_after    = None
+        self._last_refresh_ts = time.monotonic()
+        self.manager.flush_dirty()
+        self._last_rev = self.manager.revision
+        name   = self._filter_var.get().strip()
+        fmt    = self._fmt_filter.get()
+        st_flt = self._status_filter.get()
+        key    = (self._last_rev, name, fmt, st_flt)
+        if key != self._render_key:
+            self._render_key = key
+            self._render_display_rows(db_rows=self._db_rows)
+
+        # Stored tournaments are all finished, so another status filter
+        # cannot match any of them and the query is skipped entirely
+        if self.db is not None and st_flt in ("All", "Finished"):
+            # Name and format filters run in SQL; the values are read above
+            # because the worker thread must not touch the Tk variables
+            name = name or None
+            fmt  = None if fmt == "All" else fmt
+            self._db_fetch_seq += 1
+            seq = self._db_fetch_seq
+            self._busy("Loading tournament list…")
             fetch_async(
                 parent  = self.win,
-                work_fn = self.db.get_tournament_list,
+                work_fn = lambda: self.db.get_tournament_list(
+                    name_like=name, fmt=fmt),
                 done_fn = lambda rows: (
-                    overlay.hide(),
-                    self._render_display_rows(db_rows=rows),
+                    self._idle(),
+                    self._on_db_rows(seq, rows),
                 ),
-                overlay = overlay,
                 error_fn = lambda e: (
-                    overlay.hide(),
+                    self._idle(),
                     print(f"[TournamentListWindow] DB load error: {e}"),
                 ),
             )
 
+    def _on_db_rows(self, seq: int, rows: list):
+        # Drop a slow reply that a newer filter has overtaken
+        if seq != self._db_fetch_seq:
+            return
+        sig = [(r.get("tournament_id"), r.get("game_count")) for r in rows]
+        if sig == self._db_sig:
+            return   # same tournaments as already on screen
+        self._db_rows, self._db_sig = rows, sig
+        self._render_display_rows(db_rows=rows)
+
     def _render_display_rows(self, db_rows=None):
         """
         Populate the tree from in-memory manager entries + optional db_rows.
-        Uses _batch_tree_insert to stay responsive with large history lists.
+        The tree is diffed against the last render rather than rebuilt, so a
+        poll where nothing changed costs no item inserts or deletes.
         """
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
-        self._id_map.clear()
-
         flt     = self._filter_var.get().strip().lower()
         fmt_flt = self._fmt_filter.get()
         st_flt  = self._status_filter.get()
+        st_code = (self._STATUS_LABELS.index(st_flt)
+                   if st_flt in self._STATUS_LABELS else None)
 
         entries = self.manager.get_all()
-        in_memory_ids = {e["id"] for e in entries}
+        if len(self._stats_cache) > len(entries):
+            # Entries were dropped from the manager; let their games go too
+            live = {e["id"] for e in entries}
+            self._stats_cache = {k: v for k, v in self._stats_cache.items()
+                                 if k in live}
 
         display_rows = []
 
         for entry in entries:
             t: Tournament = entry["obj"]
-            status   = self._t_status(t)
-            games    = self._games_played(t)
-            winner   = t.winner.name if t.winner else "—"
-            display_rows.append({
-                "id":      entry["id"],
-                "name":    entry["name"],
-                "format":  entry["format"],
-                "players": entry["players"],
-                "rounds":  entry["rounds"],
-                "games":   games,
-                "status":  status,
-                "winner":  winner,
-                "created": entry["created"],
-                "obj":     t,
-            })
-
-        for row in (db_rows or []):
+            games, status, winner, search = self._t_stats(t)
+            display_rows.append(_DisplayRow(
+                entry["id"], entry["name"], entry["format"],
+                entry["players"], entry["rounds"],
+                games, status, winner, search, entry["created"],
+            ))
+
+        # The immediate render from memory has no DB rows; only build the
+        # id set when there is something to de-duplicate against it
+        in_memory_ids = {e["id"] for e in entries} if db_rows else ()
+        for row in db_rows or ():
             tid = row.get("tournament_id", "")
             if tid in in_memory_ids:
                 continue
-            display_rows.append({
-                "id":      tid,
-                "name":    row.get("tournament_name", "Unknown"),
-                "format":  row.get("format", "—"),
-                "players": "—",
-                "rounds":  "—",
-                "games":   row.get("game_count", 0),
-                "status":  "Finished",
-                "winner":  "—",
-                "created": row.get("date", "—"),
-                "obj":     None,
-            })
-
-        # Build filtered tree-row list (ids tracked in insertion order)
+            name = row.get("tournament_name", "Unknown")
+            display_rows.append(_DisplayRow(
+                tid, name, row.get("format", "—"), "—", "—",
+                row.get("game_count", 0), self._FINISHED, "—",
+                f"{name}\x00—".lower(), row.get("date", "—"),
+            ))
+
+        # One pass both tallies the summary and builds the filtered rows
         tree_rows   = []
-        ordered_ids = []
+        by_format   = fmt_flt != "All"
+        counts      = [0, 0, 0]   # per status code
+        all_games   = 0
 
         for i, d in enumerate(display_rows, 1):
-            status = d["status"]
-            if flt and flt not in d["name"].lower()                     and flt not in d["winner"].lower():
+            status = d.status
+            counts[status] += 1
+            games  = d.games
+            if type(games) is int:
+                all_games += games
+            # Name and winner are pre-lowered into one NUL-joined string
+            if flt and flt not in d.search:
                 continue
-            if fmt_flt != "All" and d["format"] != fmt_flt:
+            if by_format and d.format != fmt_flt:
                 continue
-            if st_flt != "All" and status != st_flt:
+            if st_code is not None and status != st_code:
                 continue
 
-            row_vals = [
-                i, d["name"], d["format"], d["players"],
-                d["rounds"], d["games"], status, d["winner"], d["created"],
-            ]
-            if   status == "Running":  tag = 'running'
-            elif status == "Finished": tag = 'finished'
-            else:                      tag = 'pending'
-
-            tree_rows.append({"values": row_vals, "tags": (tag,)})
-            ordered_ids.append(d["id"])
+            row_vals = (
+                i, d.name, d.format, d.players, d.rounds,
+                games, self._STATUS_LABELS[status], d.winner, d.created,
+            )
+            tree_rows.append((row_vals, (self._STATUS_TAGS[status],), d.id))
 
         total     = len(display_rows)
         shown     = len(tree_rows)
-        finished  = sum(1 for d in display_rows if d["status"] == "Finished")
-        running   = sum(1 for d in display_rows if d["status"] == "Running")
-        all_games = sum(
-            d["games"] if isinstance(d["games"], int) else 0
-            for d in display_rows
-        )
+        _, running, finished = counts
 
         self._summary_var.set(
             f"  Showing {shown} / {total} tournaments  ·  "
@@ -3776,11 +4919,11 @@ class TournamentListWindow:
             f"{all_games} total games played"
         )
 
-        def _after_insert():
-            for iid, tid in zip(self.tree.get_children(), ordered_ids):
-                self._id_map[iid] = tid
-
-        _batch_tree_insert(self.win, self.tree, tree_rows, done_fn=_after_insert)
+        # The virtual tree diffs its visible pool against the new rows, so
+        # a render where nothing on screen changed makes no Tk item calls
+        self._base_rows = tree_rows
+        self._sort_keys = {}
+        self._apply_sort()
 
     def _sort_by(self, col: str):
         if self._sort_col == col:
@@ -3788,40 +4931,56 @@ class TournamentListWindow:
         else:
             self._sort_col = col
             self._sort_rev = False
-        rows = [(self.tree.set(k, col), k) for k in self.tree.get_children('')]
-        try:
-            rows.sort(key=lambda x: int(x[0]), reverse=self._sort_rev)
-        except ValueError:
-            rows.sort(key=lambda x: x[0].lower(), reverse=self._sort_rev)
-        for idx, (_, k) in enumerate(rows):
-            self.tree.move(k, '', idx)
+        self._apply_sort()
+
+    def _apply_sort(self):
+        """
+        Order the rendered rows by the active sort column and show them.
+        A column's keys are typed once (int if every value is one, else
+        lower-cased text) and reused until the next render, so re-sorting
+        only runs the C-level sort over ready keys.  The virtual tree keeps
+        the selected tournament selected wherever it lands.
+        """
+        rows = self._base_rows
+        col  = self._sort_col
+        if col is not None:
+            keys = self._sort_keys.get(col)
+            if keys is None:
+                ci = self._COL_INDEX[col]
+                try:
+                    keys = [int(r[0][ci]) for r in rows]
+                except ValueError:
+                    keys = [str(r[0][ci]).lower() for r in rows]
+                self._sort_keys[col] = keys
+            order = sorted(range(len(rows)), key=keys.__getitem__,
+                           reverse=self._sort_rev)
+            rows  = [rows[i] for i in order]
+        self._vt.set_rows(rows)
+
+    def _on_select(self, tid):
+        self._sel_tid = tid
+
+    def _selected_tid(self) -> "str | None":
+        # Kept by id, so scrolling the pool items never changes the answer
+        return self._sel_tid
 
     def _selected_tournament(self) -> "Tournament | None":
-        sel = self.tree.selection()
-        if not sel:
-            return None
-        tid = self._id_map.get(sel[0])
-        if tid is None:
-            return None
-        for e in self.manager.get_all():
-            if e["id"] == tid:
-                return e["obj"]
-        return None
+        entry = self.manager.get(self._selected_tid())
+        return entry["obj"] if entry else None
 
     def _open_selected(self):
         t = self._selected_tournament()
         if t is None:
-            sel = self.tree.selection()
-            if not sel:
+            tid = self._selected_tid()
+            if tid is None:
                 messagebox.showinfo("No selection",
                                     "Please select a tournament first.",
                                     parent=self.win)
                 return
-            tid = self._id_map.get(sel[0])
-            if tid:
-                self._open_db_tournament(tid)
+            self._open_db_tournament(tid)
             return
 
+        self.manager.touch(t.tournament_id)
         existing = self.manager.get_window(t.tournament_id)
         if existing is not None:
             try:
@@ -3842,21 +5001,24 @@ class TournamentListWindow:
                                 parent=self.win)
             return
 
-        overlay = LoadingOverlay(self.win, "Loading tournament from database…")
-        overlay.show()
+        self._busy("Loading tournament from database…")
 
         def _load():
             return self.db.get_tournament_games(tournament_id=tournament_id)
 
         def _on_loaded(rows):
             if not rows:
+                self._idle()
                 messagebox.showinfo("Empty",
                                     "No games found for this tournament in the database.",
                                     parent=self.win)
                 return
+            # Taken over by the parse job first, so the overlay never blinks
             self._build_db_tournament(tournament_id, rows)
+            self._idle()
 
         def _on_error(exc):
+            self._idle()
             messagebox.showerror("Error", f"Failed to load tournament:\n{exc}",
                                  parent=self.win)
 
@@ -3864,7 +5026,6 @@ class TournamentListWindow:
             parent   = self.win,
             work_fn  = _load,
             done_fn  = _on_loaded,
-            overlay  = overlay,
             error_fn = _on_error,
         )
         return   # the rest of the method is extracted to _build_db_tournament
@@ -3875,15 +5036,15 @@ class TournamentListWindow:
         The heavy PGN-parsing loop runs on a background thread so the UI
         never freezes regardless of how many games are in the database.
         """
-        overlay = LoadingOverlay(self.win, f"Processing {len(rows)} games…")
-        overlay.show()
+        self._busy(f"Processing {len(rows)} games…")
 
         def _work():
             return _parse_db_rows(tournament_id, rows)
 
         def _done(t):
+            self._idle()
             win = TournamentWindow(self.root, t, db=self.db, db_path=self.db_path)
-            self.manager.register(t, win)
+            self.manager.register_from_db(t, win)
             self._refresh()
             if t.format == Tournament.FORMAT_KNOCKOUT:
                 win.win.after(100, win._draw_bracket)
@@ -3892,9 +5053,12 @@ class TournamentListWindow:
             parent   = self.win,
             work_fn  = _work,
             done_fn  = _done,
-            overlay  = overlay,
-            error_fn = lambda e: messagebox.showerror(
-                "Error", f"Failed to build tournament:\n{e}", parent=self.win),
+            error_fn = lambda e: (
+                self._idle(),
+                messagebox.showerror(
+                    "Error", f"Failed to build tournament:\n{e}",
+                    parent=self.win),
+            ),
         )
 
     def _open_history(self):
@@ -3922,41 +5086,18 @@ class TournamentListWindow:
 
         win = TournamentWindow(self.root, t, db=resolved_db, db_path=self.db_path)
 
-        _orig_start = win._cb_game_start
-        _orig_round = win._cb_round_end
-        _orig_end   = win._cb_tournament_end
-
-        def _p_start(game):
-            self.manager.update(t)
-            if self.win.winfo_exists():
-                self.win.after(0, self._refresh)
-            _orig_start(game)
-
-        def _p_round(rnd):
-            self.manager.update(t)
-            if self.win.winfo_exists():
-                self.win.after(0, self._refresh)
-            _orig_round(rnd)
-
-        def _p_end(tournament):
-            self.manager.update(t)
-            if self.win.winfo_exists():
-                self.win.after(0, self._refresh)
-            _orig_end(tournament)
+        def _on_event(_):
+            self.manager.mark_dirty(t)
+            self._schedule_refresh()
 
-        win._cb_game_start     = _p_start
-        win._cb_round_end      = _p_round
-        win._cb_tournament_end = _p_end
+        win.add_observer(_on_event)
 
         self.manager.register(t, win)
         self._refresh()
 
     def _export_all_pgn(self):
-        all_games = []
-        for entry in self.manager.get_all():
-            all_games.extend(entry["obj"].get_all_completed_games())
-
-        if not all_games:
+        tournaments = [entry["obj"] for entry in self.manager.get_all()]
+        if not any(t.get_all_completed_games() for t in tournaments):
             messagebox.showinfo("Export PGN",
                                 "No completed games found across all tournaments.",
                                 parent=self.win)
@@ -3970,23 +5111,52 @@ class TournamentListWindow:
             initialfile=f"all_tournaments_{datetime.now().strftime('%Y%m%d_%H%M')}.pgn")
         if not path:
             return
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                for g in all_games:
+        # Running tournaments keep appending games, so the writer thread is
+        # given each one's completed count as of now and stops there
+        sources = [(t, len(t.get_all_completed_games())) for t in tournaments]
+        self._busy("Exporting PGN…")
+        fetch_async(
+            parent   = self.win,
+            work_fn  = lambda: self._write_pgn(path, sources),
+            done_fn  = lambda n_games: (
+                self._idle(),
+                messagebox.showinfo(
+                    "Export PGN",
+                    f"Exported {n_games} games from {len(sources)} "
+                    f"tournament(s):\n{path}",
+                    parent=self.win),
+            ),
+            error_fn = lambda e: (
+                self._idle(),
+                messagebox.showerror("Export failed", str(e), parent=self.win),
+            ),
+        )
+
+    @staticmethod
+    def _write_pgn(path: str, sources: list) -> int:
+        """
+        Stream the PGN of the first *n* completed games of each
+        (tournament, n) in *sources* to *path*; returns the count written.
+        Runs off the Tk thread.
+        """
+        n_games = 0
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            for t, n in sources:
+                for g in islice(t.get_all_completed_games(), n):
                     if g.pgn:
-                        f.write(g.pgn + "\n\n")
-            n_t = len(self.manager.get_all())
-            messagebox.showinfo(
-                "Export PGN",
-                f"Exported {len(all_games)} games from {n_t} tournament(s):\n{path}",
-                parent=self.win)
-        except Exception as e:
-            messagebox.showerror("Export failed", str(e), parent=self.win)
+                        f.write(g.pgn)
+                        f.write("\n\n")
+                        n_games += 1
+        return n_games
 
     def _poll(self):
         if not self.win.winfo_exists():
             return
-        self._refresh()
+        # Filter changes refresh on their own; the poll only has to catch
+        # manager changes, and an idle list costs one integer compare
+        self.manager.flush_dirty()
+        if self.manager.revision != self._last_rev:
+            self._refresh()
         self.win.after(3000, self._poll)
 
 
@@ -4022,25 +5192,7 @@ def open_tournament(root, db=None, db_path=None, analyzer=None,
 
     win = TournamentWindow(root, t, db=resolved_db, db_path=db_path)
 
-    _orig_start = win._cb_game_start
-    _orig_round = win._cb_round_end
-    _orig_end   = win._cb_tournament_end
-
-    def _p_start(game):
-        manager.update(t)
-        _orig_start(game)
-
-    def _p_round(rnd):
-        manager.update(t)
-        _orig_round(rnd)
-
-    def _p_end(tournament):
-        manager.update(t)
-        _orig_end(tournament)
-
-    win._cb_game_start     = _p_start
-    win._cb_round_end      = _p_round
-    win._cb_tournament_end = _p_end
+    win.add_observer(lambda _: manager.mark_dirty(t))
 
     manager.register(t, win)
     return win